@@ -0,0 +1,104 @@
+"""
+EthniData - Memory backend benchmark
+
+Measures, for each database, how long backend="memory" takes to load,
+how much Python heap the loaded dictionaries occupy, and the per-call
+latency of predict_nationality() compared with the default SQLite backend
+and, when one has been exported next to the database, the mmap snapshot.
+
+Usage:
+    python benchmarks/bench_memory_backend.py                  # bundled v2 + v3 DBs
+    python benchmarks/bench_memory_backend.py path/to/file.db  # any database
+"""
+
+import gc
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+BASE_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+from ethnidata import EthniData  # noqa: E402
+from ethnidata.snapshot import default_snapshot_path  # noqa: E402
+
+DEFAULT_DBS = [
+    BASE_DIR / "ethnidata" / "ethnidata.db",
+    BASE_DIR / "ethnidata" / "ethnidata_v3.db",
+]
+
+SAMPLE_NAMES = 2000
+
+
+def sample_names(db_path: Path, count: int):
+    ed = EthniData(db_path=str(db_path))
+    rows = ed.conn.execute(
+        "SELECT DISTINCT name FROM names WHERE name_type = 'first' LIMIT ?", (count * 10,)
+    ).fetchall()
+    ed.close()
+    names = [row[0] for row in rows]
+    random.Random(0).shuffle(names)
+    return names[:count]
+
+
+def time_calls(ed: EthniData, names) -> float:
+    """Mean microseconds per predict_nationality() call"""
+    start = time.perf_counter()
+    for name in names:
+        ed.predict_nationality(name)
+    return (time.perf_counter() - start) / max(len(names), 1) * 1e6
+
+
+def bench(db_path: Path):
+    print(f"\n📁 {db_path} ({db_path.stat().st_size / 1024 / 1024:.1f} MB on disk)")
+    names = sample_names(db_path, SAMPLE_NAMES)
+
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    memory = EthniData(db_path=str(db_path), backend="memory")
+    load_seconds = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"   Keys loaded:     {len(memory._backend):,}")
+    print(f"   Load time:       {load_seconds:.2f} s")
+    print(f"   Resident heap:   {current / 1024 / 1024:.1f} MB (peak {peak / 1024 / 1024:.1f} MB)")
+
+    with EthniData(db_path=str(db_path)) as disk:
+        disk_us = time_calls(disk, names)
+        print(f"   {disk.backend:<16} {disk_us:8.1f} µs/call")
+
+    memory_us = time_calls(memory, names)
+    print(f"   {'memory':<16} {memory_us:8.1f} µs/call")
+    memory.close()
+
+    snapshot_path = default_snapshot_path(db_path)
+    if snapshot_path.exists():
+        start = time.perf_counter()
+        snapshot = EthniData(db_path=str(db_path), backend="snapshot")
+        open_ms = (time.perf_counter() - start) * 1000
+        snapshot_us = time_calls(snapshot, names)
+        print(f"   {'snapshot':<16} {snapshot_us:8.1f} µs/call "
+              f"(opened in {open_ms:.1f} ms, {snapshot_path.stat().st_size / 1024 / 1024:.1f} MB)")
+        snapshot.close()
+
+
+def main():
+    paths = [Path(p) for p in sys.argv[1:]] or [p for p in DEFAULT_DBS if p.exists()]
+    if not paths:
+        print("❌ No database found; pass a path or download the bundled databases")
+        return 1
+
+    print("="*80)
+    print("⚡ EthniData - Memory backend benchmark")
+    print("="*80)
+    for path in paths:
+        bench(path)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,72 @@
+"""
+EthniData - Multi-process scaling benchmark
+
+Runs predict_full_name_batch() over the same workload in-process and with
+ParallelPredictor at increasing worker counts, and reports throughput and
+speedup relative to one process.
+
+Usage:
+    python benchmarks/bench_parallel.py                    # bundled database
+    python benchmarks/bench_parallel.py path/to/file.db --pairs 200000 --workers 1 2 4 8
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+from ethnidata import EthniData, ParallelPredictor  # noqa: E402
+
+
+def workload(ed: EthniData, count: int):
+    """Random (first, last) pairs drawn from the database"""
+    firsts = [r[0] for r in ed.conn.execute(
+        "SELECT DISTINCT name FROM names WHERE name_type = 'first' LIMIT 50000")]
+    lasts = [r[0] for r in ed.conn.execute(
+        "SELECT DISTINCT name FROM names WHERE name_type = 'last' LIMIT 50000")]
+    rng = random.Random(0)
+    return [(rng.choice(firsts), rng.choice(lasts)) for _ in range(count)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("db_path", nargs="?", help="Database (default: bundled)")
+    parser.add_argument("--pairs", type=int, default=50000, help="Number of full names")
+    parser.add_argument("--workers", type=int, nargs="+",
+                        default=sorted({1, 2, 4, 8, os.cpu_count() or 1}))
+    parser.add_argument("--backend", default="sqlite", choices=["sqlite", "memory", "snapshot"])
+    args = parser.parse_args()
+
+    with EthniData(db_path=args.db_path) as ed:
+        db_path = str(ed.db_path)
+        pairs = workload(ed, args.pairs)
+        # Distinct pairs keep the comparison about lookups, not deduplication
+        pairs = list(dict.fromkeys(pairs))
+
+        start = time.perf_counter()
+        ed.predict_full_name_batch(pairs)
+        baseline = len(pairs) / (time.perf_counter() - start)
+
+    print("="*80)
+    print(f"⚡ EthniData - Parallel scaling ({len(pairs):,} distinct full names, {os.cpu_count()} CPUs)")
+    print("="*80)
+    print(f"   {'in-process':<12} {baseline:12,.0f} names/s")
+
+    for n in args.workers:
+        with ParallelPredictor(db_path=db_path, n_workers=n, backend=args.backend,
+                               chunk_size=max(1, len(pairs) // (n * 4))) as pp:
+            # Warm up: start the workers and open their connections
+            pp.predict_nationality_batch([f"warmup{i}" for i in range(n * pp.chunk_size)])
+            start = time.perf_counter()
+            pp.predict_full_name_batch(pairs)
+            rate = len(pairs) / (time.perf_counter() - start)
+        print(f"   {n:>2} workers   {rate:12,.0f} names/s   x{rate / baseline:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,386 @@
+"""
+EthniData - Predictor benchmark suite with regression tracking
+
+Builds a synthetic database whose name frequencies follow a Zipf law,
+replays a Zipf-distributed query workload against it (popular names are
+asked for far more often than rare ones, plus a share of unknown names)
+and reports:
+
+    latency      p50 / p90 / p99 / mean µs per call of predict_nationality(),
+                 predict_nationality(explain=True), predict_full_name() and
+                 predict_all()
+    throughput   names/s of predict_nationality_batch() and
+                 predict_full_name_batch()
+    cold start   seconds from a fresh interpreter to the first prediction
+    rss          peak resident set size of the cold-start process and of
+                 the benchmark process
+
+Results are written as JSON.  With ``--baseline`` the run is compared with
+an earlier result file and exits with status 1 if any metric got worse by
+more than ``--threshold`` (relative).
+
+Usage:
+    python benchmarks/bench_suite.py --output bench.json
+    python benchmarks/bench_suite.py --names 200000 --baseline bench.json --threshold 0.15
+    python benchmarks/bench_suite.py --db path/to/file.db --backend memory
+"""
+
+import argparse
+import json
+import math
+import platform
+import random
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+from itertools import accumulate
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+BASE_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+from ethnidata import EthniData, __version__  # noqa: E402
+from ethnidata.name_stats import build_name_stats  # noqa: E402
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None
+
+# (country, region, language, religion) the synthetic rows are spread over
+COUNTRIES = [
+    ("TUR", "Asia", "Turkish", "Islam"),
+    ("DEU", "Europe", "German", "Christianity"),
+    ("USA", "Americas", "English", "Christianity"),
+    ("GBR", "Europe", "English", "Christianity"),
+    ("ESP", "Europe", "Spanish", "Christianity"),
+    ("MEX", "Americas", "Spanish", "Christianity"),
+    ("BRA", "Americas", "Portuguese", "Christianity"),
+    ("FRA", "Europe", "French", "Christianity"),
+    ("ITA", "Europe", "Italian", "Christianity"),
+    ("RUS", "Europe", "Russian", "Christianity"),
+    ("IND", "Asia", "Hindi", "Hinduism"),
+    ("PAK", "Asia", "Urdu", "Islam"),
+    ("CHN", "Asia", "Chinese", "Buddhism"),
+    ("JPN", "Asia", "Japanese", "Buddhism"),
+    ("KOR", "Asia", "Korean", None),
+    ("NGA", "Africa", "English", "Christianity"),
+    ("EGY", "Africa", "Arabic", "Islam"),
+    ("KEN", "Africa", "Swahili", "Christianity"),
+    ("AUS", "Oceania", "English", "Christianity"),
+    ("IDN", "Asia", "Indonesian", "Islam"),
+]
+
+SYLLABLES = ["a", "ah", "al", "an", "ba", "da", "el", "em", "fa", "ha", "ka", "ki", "la", "li", "ma", "me",
+             "mi", "na", "ne", "o", "ra", "ri", "sa", "se", "ta", "to", "u", "va", "ya", "yil", "za", "zo"]
+
+# Rows of the most frequent name; rank r gets about MAX_ROWS / r ** zipf
+MAX_ROWS = 400
+
+DEFAULT_NAMES = 20000
+DEFAULT_QUERIES = 20000
+DEFAULT_ZIPF = 1.1
+DEFAULT_UNKNOWN = 0.05
+DEFAULT_THRESHOLD = 0.10
+
+COLD_START_CODE = """
+import json, sys, time
+start = time.perf_counter()
+from ethnidata import EthniData
+imported = time.perf_counter()
+ed = EthniData(db_path=sys.argv[1], backend=sys.argv[2])
+ed.predict_nationality(sys.argv[3])
+done = time.perf_counter()
+try:
+    import resource
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+except ImportError:
+    rss = None
+print(json.dumps({"import_s": imported - start, "first_call_s": done - start, "rss": rss}))
+"""
+
+
+def rss_mb(maxrss: Optional[int]) -> Optional[float]:
+    """ru_maxrss in MB (bytes on macOS, kilobytes elsewhere)"""
+    if maxrss is None:
+        return None
+    return maxrss / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+def synthetic_names(count: int, rng: random.Random) -> List[str]:
+    """``count`` distinct lower-case names built from syllables"""
+    names: Dict[str, None] = {}
+    while len(names) < count:
+        names["".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))] = None
+    return list(names)
+
+
+def build_fixture_db(path: Path, n_names: int = DEFAULT_NAMES, zipf: float = DEFAULT_ZIPF,
+                     name_stats: bool = False, seed: int = 0) -> Dict[str, List[str]]:
+    """
+    Write a synthetic ``names`` database with ``n_names`` first and last names
+
+    Name of rank r has about ``MAX_ROWS / r ** zipf`` rows spread over a
+    few countries.
+
+    Returns:
+        {'first': [...], 'last': [...]}, each ordered by rank (most frequent first)
+    """
+    rng = random.Random(seed)
+    conn = sqlite3.connect(str(path))
+    conn.execute("DROP TABLE IF EXISTS names")
+    conn.execute("""
+        CREATE TABLE names (
+            name TEXT NOT NULL,
+            name_type TEXT,
+            country_code TEXT,
+            region TEXT,
+            language TEXT,
+            religion TEXT,
+            gender TEXT,
+            source TEXT,
+            PRIMARY KEY (name, name_type, country_code, source)
+        )
+    """)
+
+    vocabulary = {}
+    for name_type in ("first", "last"):
+        names = synthetic_names(n_names, rng)
+        vocabulary[name_type] = names
+        rows = []
+        for rank, name in enumerate(names, 1):
+            n_rows = max(1, int(MAX_ROWS / rank ** zipf))
+            countries = rng.sample(COUNTRIES, min(n_rows, rng.randint(1, 8)))
+            weights = [rng.random() ** 2 + 0.01 for _ in countries]
+            gender = rng.choice("MF") if name_type == "first" else None
+            for i, (country, region, language, religion) in enumerate(
+                    rng.choices(countries, weights=weights, k=n_rows)):
+                rows.append((name, name_type, country, region, language, religion, gender, f"src{i}"))
+        conn.executemany("""
+            INSERT INTO names
+            (name, name_type, country_code, region, language, religion, gender, source)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """, rows)
+
+    conn.execute("CREATE INDEX idx_name ON names(name)")
+    conn.commit()
+    if name_stats:
+        build_name_stats(conn)
+    conn.close()
+    return vocabulary
+
+
+def zipf_workload(names: Sequence[str], count: int, zipf: float = DEFAULT_ZIPF,
+                  unknown: float = DEFAULT_UNKNOWN, seed: int = 1) -> List[str]:
+    """``count`` queries, name of rank r drawn with weight 1 / r ** zipf, as users type them"""
+    rng = random.Random(seed)
+    cum_weights = list(accumulate(1 / rank ** zipf for rank in range(1, len(names) + 1)))
+    queries = []
+    for name in rng.choices(names, cum_weights=cum_weights, k=count):
+        if rng.random() < unknown:
+            name = name + rng.choice(SYLLABLES) + "x"
+        queries.append(name.title())
+    return queries
+
+
+def percentile(sorted_values: Sequence[float], q: float) -> float:
+    """Nearest-rank percentile of an ascending list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, min(len(sorted_values), math.ceil(q / 100 * len(sorted_values))))
+    return sorted_values[rank - 1]
+
+
+def latency(call: Callable, args: Sequence[Tuple], warmup: int = 200) -> Dict[str, float]:
+    """Per-call latency percentiles in microseconds"""
+    for item in args[:warmup]:
+        call(*item)
+    timer = time.perf_counter_ns
+    samples = []
+    for item in args:
+        start = timer()
+        call(*item)
+        samples.append((timer() - start) / 1000)
+    samples.sort()
+    return {
+        "p50_us": percentile(samples, 50),
+        "p90_us": percentile(samples, 90),
+        "p99_us": percentile(samples, 99),
+        "mean_us": sum(samples) / len(samples) if samples else 0.0,
+    }
+
+
+def throughput(call: Callable, items: Sequence, repeat: int = 3) -> float:
+    """Best items/s over ``repeat`` runs"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        call(items)
+        best = min(best, time.perf_counter() - start)
+    return len(items) / best if best > 0 else 0.0
+
+
+def cold_start(db_path: Path, backend: str, name: str, runs: int) -> Dict[str, float]:
+    """Median wall time of a fresh interpreter importing ethnidata and predicting once"""
+    results = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        out = subprocess.run(
+            [sys.executable, "-c", COLD_START_CODE, str(db_path), backend, name],
+            check=True, capture_output=True, text=True, cwd=str(BASE_DIR)
+        ).stdout
+        child = json.loads(out)
+        child["wall_s"] = time.perf_counter() - start
+        results.append(child)
+    results.sort(key=lambda r: r["wall_s"])
+    median = results[len(results) // 2]
+    return {
+        "wall_s": median["wall_s"],
+        "import_s": median["import_s"],
+        "first_call_s": median["first_call_s"],
+        "rss_mb": rss_mb(median["rss"]),
+    }
+
+
+def run_suite(db_path: Path, vocabulary: Dict[str, List[str]], queries: int = DEFAULT_QUERIES,
+              zipf: float = DEFAULT_ZIPF, unknown: float = DEFAULT_UNKNOWN, backend: str = "sqlite",
+              cold_runs: int = 3) -> Dict[str, Dict]:
+    """
+    Measure every metric against ``db_path``
+
+    Returns:
+        {metric: {'value': float, 'unit': str, 'better': 'lower' | 'higher'}}
+    """
+    firsts = zipf_workload(vocabulary["first"], queries, zipf, unknown, seed=1)
+    lasts = zipf_workload(vocabulary["last"], queries, zipf, unknown, seed=2)
+    metrics: Dict[str, Dict] = {}
+
+    def record(name: str, value: Optional[float], unit: str, better: str = "lower"):
+        if value is not None:
+            metrics[name] = {"value": value, "unit": unit, "better": better}
+
+    if cold_runs:
+        for key, value in cold_start(db_path, backend, firsts[0], cold_runs).items():
+            record(f"cold_start.{key}", value, "MB" if key == "rss_mb" else "s")
+
+    with EthniData(db_path=str(db_path), backend=backend) as ed:
+        cases = {
+            "predict_nationality": (ed.predict_nationality, [(name,) for name in firsts]),
+            "predict_nationality_explain": (
+                lambda name: ed.predict_nationality(name, explain=True), [(name,) for name in firsts]),
+            "predict_full_name": (ed.predict_full_name, list(zip(firsts, lasts))),
+            "predict_all": (ed.predict_all, [(name,) for name in firsts]),
+        }
+        for case, (call, args) in cases.items():
+            for key, value in latency(call, args).items():
+                record(f"latency.{case}.{key}", value, "us")
+
+        record("throughput.predict_nationality_batch",
+               throughput(ed.predict_nationality_batch, firsts), "names/s", "higher")
+        record("throughput.predict_full_name_batch",
+               throughput(ed.predict_full_name_batch, list(zip(firsts, lasts))), "names/s", "higher")
+
+    if resource is not None:
+        record("rss.peak_mb", rss_mb(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss), "MB")
+    return metrics
+
+
+def compare(baseline: Dict[str, Dict], current: Dict[str, Dict],
+            threshold: float) -> List[Tuple[str, float, float, float]]:
+    """
+    Metrics of ``current`` worse than ``baseline`` by more than ``threshold``
+
+    Returns:
+        (metric, baseline value, current value, relative change) tuples;
+        metrics missing from either side are ignored
+    """
+    regressions = []
+    for name, metric in current.items():
+        base = baseline.get(name)
+        if base is None or not base["value"]:
+            continue
+        change = (metric["value"] - base["value"]) / base["value"]
+        if metric["better"] == "higher":
+            change = -change
+        if change > threshold:
+            regressions.append((name, base["value"], metric["value"], change))
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--db", help="Benchmark an existing database (workload drawn from its names)")
+    parser.add_argument("--names", type=int, default=DEFAULT_NAMES, help="Synthetic names per name type")
+    parser.add_argument("--queries", type=int, default=DEFAULT_QUERIES, help="Calls per latency case")
+    parser.add_argument("--zipf", type=float, default=DEFAULT_ZIPF, help="Zipf exponent")
+    parser.add_argument("--unknown", type=float, default=DEFAULT_UNKNOWN, help="Share of unknown names")
+    parser.add_argument("--name-stats", action="store_true", help="Build name_stats in the synthetic DB")
+    parser.add_argument("--backend", default="sqlite", choices=["sqlite", "memory"])
+    parser.add_argument("--cold-runs", type=int, default=3, help="Cold-start runs (0 to skip)")
+    parser.add_argument("--output", help="Write results to this JSON file")
+    parser.add_argument("--baseline", help="Earlier JSON result to compare with")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Relative slowdown that counts as a regression (default: 0.10)")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.db:
+            db_path = Path(args.db)
+            with EthniData(db_path=str(db_path)) as ed:
+                vocabulary = {
+                    name_type: [row[0] for row in ed.conn.execute(
+                        "SELECT name FROM names WHERE name_type = ? GROUP BY name ORDER BY COUNT(*) DESC LIMIT ?",
+                        (name_type, args.names))]
+                    for name_type in ("first", "last")
+                }
+        else:
+            db_path = Path(tmp) / "bench.db"
+            start = time.perf_counter()
+            vocabulary = build_fixture_db(db_path, args.names, args.zipf, args.name_stats)
+            print(f"🧪 Synthetic DB: {args.names:,} names per type, built in {time.perf_counter() - start:.1f} s")
+
+        metrics = run_suite(db_path, vocabulary, args.queries, args.zipf, args.unknown,
+                            args.backend, args.cold_runs)
+
+    result = {
+        "meta": {
+            "ethnidata": __version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "db": args.db,
+            "names": args.names,
+            "queries": args.queries,
+            "zipf": args.zipf,
+            "unknown": args.unknown,
+            "name_stats": args.name_stats,
+            "backend": args.backend,
+        },
+        "metrics": metrics,
+    }
+
+    print("="*80)
+    for name, metric in metrics.items():
+        print(f"   {name:<48} {metric['value']:14,.2f} {metric['unit']}")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(result, indent=2) + "\n")
+        print(f"\n💾 Results written to {args.output}")
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())["metrics"]
+        regressions = compare(baseline, metrics, args.threshold)
+        if regressions:
+            print(f"\n❌ {len(regressions)} regression(s) above {args.threshold:.0%}:")
+            for name, base, current, change in regressions:
+                print(f"   {name:<48} {base:,.2f} -> {current:,.2f} ({change:+.1%})")
+            return 1
+        print(f"\n✅ No regression above {args.threshold:.0%} against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
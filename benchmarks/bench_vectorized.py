@@ -0,0 +1,68 @@
+"""
+EthniData - Full-name score combination benchmark
+
+Compares the scalar dict merge of predict_full_name() with the NumPy
+combination used by predict_full_name_batch() on synthetic top-5 lists.
+No database is needed.
+
+Usage:
+    python benchmarks/bench_vectorized.py [N_PAIRS]
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+from ethnidata import EthniData  # noqa: E402
+from ethnidata.countries import COUNTRY_NAMES  # noqa: E402
+from ethnidata.vectorized import combine_top_countries  # noqa: E402
+
+N_NAMES = 5000
+CODES = list(COUNTRY_NAMES)
+
+
+def top_countries(rng):
+    counts = sorted((rng.randint(1, 50) for _ in range(5)), reverse=True)
+    total = sum(counts)
+    return [
+        {'country': rng.choice(CODES), 'region': 'Europe', 'language': 'English',
+         'probability': round(count / total, 4)}
+        for count in counts
+    ]
+
+
+def main():
+    n_pairs = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    rng = random.Random(0)
+    firsts = [top_countries(rng) for _ in range(N_NAMES)]
+    lasts = [top_countries(rng) for _ in range(N_NAMES)]
+    first_ids = [rng.randrange(N_NAMES) for _ in range(n_pairs)]
+    last_ids = [rng.randrange(N_NAMES) for _ in range(n_pairs)]
+
+    print("="*80)
+    print(f"⚡ EthniData - Full-name score combination ({n_pairs:,} pairs)")
+    print("="*80)
+    print(f"   {'top_n':>5} {'scalar (s)':>11} {'numpy (s)':>10} {'speedup':>8}")
+
+    for top_n in (1, 5):
+        start = time.perf_counter()
+        scalar = [
+            EthniData._combine_top_countries({'top_countries': firsts[f]}, {'top_countries': lasts[l]}, top_n)
+            for f, l in zip(first_ids, last_ids)
+        ]
+        scalar_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        vectorized = combine_top_countries(firsts, lasts, top_n, first_ids, last_ids)
+        vector_time = time.perf_counter() - start
+
+        assert scalar == vectorized
+        print(f"   {top_n:>5} {scalar_time:11.3f} {vector_time:10.3f} {scalar_time / vector_time:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -70,27 +70,47 @@ __version__ = "4.5.0"
 __author__ = "Teyfik Oz"
 __license__ = "MIT"
 
-from .predictor import EthniData
-from .explainability import ExplainabilityEngine
-from .morphology import MorphologyEngine, NameFeatureExtractor
+from importlib import import_module
+from typing import TYPE_CHECKING
 
-# Synthetic module imports (optional, may not have freq_provider)
-try:
+# Public names -> defining submodule.  Submodules are imported on first
+# attribute access (PEP 562), so ``import ethnidata`` stays cheap for
+# short-lived processes: asyncio, multiprocessing and the predictor stack
+# only load when the class that needs them is used.
+_LAZY_ATTRIBUTES = {
+    "EthniData": ".predictor",
+    "AsyncEthniData": ".aio",
+    "ParallelPredictor": ".parallel",
+    "Instrumentation": ".instrumentation",
+    "ExplainabilityEngine": ".explainability",
+    "MorphologyEngine": ".morphology",
+    "NameFeatureExtractor": ".morphology",
+    "SyntheticDataEngine": ".synthetic",
+    "SyntheticConfig": ".synthetic",
+    "SyntheticRecord": ".synthetic",
+    "FrequencyProvider": ".synthetic",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+if TYPE_CHECKING:
+    from .predictor import EthniData
+    from .aio import AsyncEthniData
+    from .parallel import ParallelPredictor
+    from .instrumentation import Instrumentation
+    from .explainability import ExplainabilityEngine
+    from .morphology import MorphologyEngine, NameFeatureExtractor
     from .synthetic import SyntheticDataEngine, SyntheticConfig, SyntheticRecord, FrequencyProvider
-    __all__ = [
-        "EthniData",
-        "ExplainabilityEngine",
-        "MorphologyEngine",
-        "NameFeatureExtractor",
-        "SyntheticDataEngine",
-        "SyntheticConfig",
-        "SyntheticRecord",
-        "FrequencyProvider"
-    ]
-except ImportError:
-    __all__ = [
-        "EthniData",
-        "ExplainabilityEngine",
-        "MorphologyEngine",
-        "NameFeatureExtractor"
-    ]
+
+
+def __getattr__(name: str):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
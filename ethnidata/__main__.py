@@ -0,0 +1,7 @@
+"""Allow ``python -m ethnidata enrich ...``"""
+
+import sys
+
+from .cli import main
+
+sys.exit(main())
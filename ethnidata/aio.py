@@ -0,0 +1,232 @@
+"""
+EthniData asyncio front-end
+
+AsyncEthniData runs the blocking SQLite lookups of a pooled EthniData on a
+bounded thread pool so they never stall the event loop.  Concurrent
+requests for the same name (and arguments) share a single lookup; the
+name is used as given, so nothing is normalized on the event loop.
+
+Usage:
+    async with AsyncEthniData(max_workers=8) as ed:
+        result = await ed.predict_nationality("Ahmet")
+        results = await ed.predict_many(["Ahmet", "Maria", "Ahmet"])
+
+License: MIT
+"""
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Literal, Optional, Tuple
+
+from .cache import copy_result
+from .predictor import EthniData
+
+
+class AsyncEthniData:
+    """asyncio wrapper around a thread-shared EthniData"""
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        use_v3: bool = False,
+        cache_size: int = 0,
+        max_workers: int = 4,
+        immutable: bool = False,
+        predictor: Optional[EthniData] = None
+    ):
+        """
+        Args:
+            db_path, use_v3, cache_size, immutable: Passed to EthniData
+            max_workers: Maximum number of concurrent database lookups
+            predictor: Use this EthniData (created with pooled=True) instead
+                of creating one; it stays open after close()
+
+        Raises:
+            ValueError: If ``predictor`` is not pooled
+        """
+        self._owns_predictor = predictor is None
+        if predictor is not None and not predictor._pool.per_thread:
+            raise ValueError("AsyncEthniData needs a pooled EthniData (pooled=True)")
+        if predictor is None:
+            predictor = EthniData(
+                db_path=db_path,
+                use_v3=use_v3,
+                cache_size=cache_size,
+                pooled=True,
+                immutable=immutable
+            )
+        self.predictor = predictor
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ethnidata")
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        # Number of calls answered by joining an in-flight lookup
+        self.coalesced = 0
+
+    async def _call(self, func: Callable, *args, **kwargs) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    async def _coalesced(self, key: Hashable, func: Callable, *args, **kwargs) -> Dict:
+        """Run ``func`` once per key at a time; concurrent callers share the result"""
+        future = self._inflight.get(key)
+        if future is not None:
+            self.coalesced += 1
+            return copy_result(await asyncio.shield(future))
+
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+        self._inflight[key] = future
+        future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return copy_result(await asyncio.shield(future))
+
+    async def predict_nationality(
+        self,
+        name: str,
+        name_type: Literal["first", "last"] = "first",
+        top_n: int = 5,
+        explain: bool = False
+    ) -> Dict:
+        """Async EthniData.predict_nationality()"""
+        return await self._coalesced(
+            ('nationality', name, name_type, top_n, explain),
+            self.predictor.predict_nationality, name, name_type, top_n, explain
+        )
+
+    async def predict_gender(self, name: str) -> Dict:
+        """Async EthniData.predict_gender()"""
+        return await self._coalesced(
+            ('gender', name),
+            self.predictor.predict_gender, name
+        )
+
+    async def predict_region(self, name: str, name_type: Literal["first", "last"] = "first") -> Dict:
+        """Async EthniData.predict_region()"""
+        return await self._coalesced(
+            ('region', name, name_type),
+            self.predictor.predict_region, name, name_type
+        )
+
+    async def predict_language(
+        self,
+        name: str,
+        name_type: Literal["first", "last"] = "first",
+        top_n: int = 5
+    ) -> Dict:
+        """Async EthniData.predict_language()"""
+        return await self._coalesced(
+            ('language', name, name_type, top_n),
+            self.predictor.predict_language, name, name_type, top_n
+        )
+
+    async def predict_religion(
+        self,
+        name: str,
+        name_type: Literal["first", "last"] = "first",
+        top_n: int = 5
+    ) -> Dict:
+        """Async EthniData.predict_religion()"""
+        return await self._coalesced(
+            ('religion', name, name_type, top_n),
+            self.predictor.predict_religion, name, name_type, top_n
+        )
+
+    async def predict_ethnicity(self, name: str, name_type: Literal["first", "last"] = "first") -> Dict:
+        """Async EthniData.predict_ethnicity()"""
+        return await self._coalesced(
+            ('ethnicity', name, name_type),
+            self.predictor.predict_ethnicity, name, name_type
+        )
+
+    async def predict_full_name(
+        self,
+        first_name: str,
+        last_name: str,
+        top_n: int = 5,
+        explain: bool = False
+    ) -> Dict:
+        """Async EthniData.predict_full_name()"""
+        return await self._coalesced(
+            ('full_name', first_name, last_name, top_n, explain),
+            self.predictor.predict_full_name, first_name, last_name, top_n, explain
+        )
+
+    async def predict_all(self, name: str, name_type: Literal["first", "last"] = "first") -> Dict:
+        """Async EthniData.predict_all()"""
+        return await self._coalesced(
+            ('all', name, name_type),
+            self.predictor.predict_all, name, name_type
+        )
+
+    async def predict_nationality_batch(
+        self,
+        names: Iterable[str],
+        name_type: Literal["first", "last"] = "first",
+        top_n: int = 5,
+        explain: bool = False
+    ) -> List[Dict]:
+        """Async EthniData.predict_nationality_batch()"""
+        return await self._call(self.predictor.predict_nationality_batch, list(names), name_type, top_n, explain)
+
+    async def predict_full_name_batch(
+        self,
+        names: Iterable[Tuple[str, str]],
+        top_n: int = 5,
+        explain: bool = False
+    ) -> List[Dict]:
+        """Async EthniData.predict_full_name_batch()"""
+        return await self._call(self.predictor.predict_full_name_batch, list(names), top_n, explain)
+
+    async def predict_all_batch(
+        self,
+        names: Iterable[str],
+        name_type: Literal["first", "last"] = "first"
+    ) -> List[Dict]:
+        """Async EthniData.predict_all_batch()"""
+        return await self._call(self.predictor.predict_all_batch, list(names), name_type)
+
+    async def predict_many(
+        self,
+        names: Iterable[str],
+        name_type: Literal["first", "last"] = "first",
+        top_n: int = 5,
+        explain: bool = False
+    ) -> List[Dict]:
+        """
+        Predict nationality for many names concurrently
+
+        Lookups run on the bounded executor; repeated names in ``names`` and
+        names already being looked up by other tasks are resolved once.
+
+        Returns:
+            List of predict_nationality() results in input order
+        """
+        names = list(names)
+        unique = list(dict.fromkeys(names))
+        results = await asyncio.gather(*(
+            self.predict_nationality(name, name_type, top_n, explain) for name in unique
+        ))
+        by_name = dict(zip(unique, results))
+        return [copy_result(by_name[name]) for name in names]
+
+    async def get_stats(self) -> Dict:
+        """Async EthniData.get_stats()"""
+        return await self._call(self.predictor.get_stats)
+
+    def cache_info(self):
+        return self.predictor.cache_info()
+
+    def clear_cache(self) -> None:
+        self.predictor.clear_cache()
+
+    async def close(self) -> None:
+        """Wait for running lookups, then close the executor (and the predictor, if created here)"""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, functools.partial(self._executor.shutdown, wait=True))
+        if self._owns_predictor:
+            self.predictor.close()
+
+    async def __aenter__(self) -> "AsyncEthniData":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
@@ -0,0 +1,350 @@
+"""
+EthniData storage backends
+
+A backend answers "which countries / regions / languages / religions /
+genders does this normalized name occur with, and how often".  The
+predictor turns those counts into probabilities, so every backend must
+return rows in the canonical order defined in ``distributions``.
+
+- SQLiteBackend:     GROUP BY over the raw ``names`` table at query time
+- NameStatsBackend:  point reads from the precomputed ``name_stats`` table
+- MemoryBackend:     dictionary lookups over distributions loaded into RAM
+- SnapshotBackend:   binary search in a memory-mapped snapshot file
+
+License: MIT
+"""
+
+import sqlite3
+import sys
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+
+from .connection import ConnectionPool
+from .distributions import (
+    EMPTY_DISTRIBUTION,
+    CountRow,
+    CountryRow,
+    NameDistribution,
+    aggregate_rows,
+    country_sort_key,
+)
+from .name_stats import (
+    NAME_STATS_COLUMNS,
+    NAME_STATS_TABLE,
+    decode_distribution,
+    iter_distributions,
+    iter_name_stats,
+    name_stats_is_current,
+)
+from .snapshot import SnapshotReader
+
+# Ties on frequency are broken by the grouping columns so that every
+# backend (and the batched paths) rank results identically.
+NATIONALITY_QUERY = """
+    SELECT country_code, region, language, COUNT(*) as frequency
+    FROM names
+    WHERE name = ? AND name_type = ?
+    GROUP BY country_code, region, language
+    ORDER BY frequency DESC, country_code, region, language
+    LIMIT ?
+"""
+
+NATIONALITY_BATCH_QUERY = """
+    SELECT name, country_code, region, language, COUNT(*) as frequency
+    FROM names
+    WHERE name_type = ? AND name IN ({placeholders})
+    GROUP BY name, country_code, region, language
+"""
+
+REGION_QUERY = """
+    SELECT region, COUNT(*) as total_freq
+    FROM names
+    WHERE name = ? AND name_type = ?
+    GROUP BY region
+    ORDER BY total_freq DESC, region
+    LIMIT ?
+"""
+
+LANGUAGE_QUERY = """
+    SELECT language, COUNT(*) as total_freq
+    FROM names
+    WHERE name = ? AND name_type = ? AND language IS NOT NULL
+    GROUP BY language
+    ORDER BY total_freq DESC, language
+    LIMIT ?
+"""
+
+RELIGION_QUERY = """
+    SELECT religion, COUNT(*) as total_freq
+    FROM names
+    WHERE name = ? AND name_type = ? AND religion IS NOT NULL
+    GROUP BY religion
+    ORDER BY total_freq DESC, religion
+    LIMIT ?
+"""
+
+GENDER_QUERY = """
+    SELECT gender, COUNT(*) as count
+    FROM names
+    WHERE name = ? AND name_type = 'first'
+    GROUP BY gender
+    ORDER BY gender
+"""
+
+# Every attribute of a name in one pass; feeds predict_all()
+DISTRIBUTION_QUERY = """
+    SELECT country_code, region, language, religion, gender, COUNT(*) as frequency
+    FROM names
+    WHERE name = ? AND name_type = ?
+    GROUP BY country_code, region, language, religion, gender
+"""
+
+DISTRIBUTION_BATCH_QUERY = """
+    SELECT name, country_code, region, language, religion, gender, COUNT(*) as frequency
+    FROM names
+    WHERE name_type = ? AND name IN ({placeholders})
+    GROUP BY name, country_code, region, language, religion, gender
+"""
+
+ATTRIBUTE_QUERIES = {
+    "region": REGION_QUERY,
+    "language": LANGUAGE_QUERY,
+    "religion": RELIGION_QUERY,
+}
+
+NAME_STATS_QUERY = f"""
+    SELECT {NAME_STATS_COLUMNS}
+    FROM {NAME_STATS_TABLE}
+    WHERE name = ? AND name_type = ?
+"""
+
+NAME_STATS_BATCH_QUERY = f"""
+    SELECT name, {NAME_STATS_COLUMNS}
+    FROM {NAME_STATS_TABLE}
+    WHERE name_type = ? AND name IN ({{placeholders}})
+"""
+
+# Names per IN (...) query; stays below SQLite's historic 999-variable limit
+BATCH_CHUNK_SIZE = 500
+
+
+def _chunks(items: List[str]):
+    for start in range(0, len(items), BATCH_CHUNK_SIZE):
+        yield items[start:start + BATCH_CHUNK_SIZE]
+
+
+def _limit(rows, top_n: Optional[int]) -> List:
+    return list(rows) if top_n is None else list(rows[:top_n])
+
+
+class DistributionBackend:
+    """
+    Base class for backends that store fully aggregated distributions.
+
+    Subclasses implement distribution() and distributions_many(); the
+    narrower lookups used by the individual predict_* methods are derived
+    from them.
+    """
+
+    name = "base"
+
+    def distribution(self, name: str, name_type: str) -> NameDistribution:
+        raise NotImplementedError
+
+    def distributions_many(self, names: Iterable[str], name_type: str) -> Dict[str, NameDistribution]:
+        return {name: self.distribution(name, name_type) for name in names}
+
+    def countries(self, name: str, name_type: str, top_n: int) -> List[CountryRow]:
+        return _limit(self.distribution(name, name_type).countries, top_n)
+
+    def countries_many(self, names: Iterable[str], name_type: str, top_n: int) -> Dict[str, List[CountryRow]]:
+        return {
+            name: _limit(dist.countries, top_n)
+            for name, dist in self.distributions_many(names, name_type).items()
+            if dist.countries
+        }
+
+    def counts(self, name: str, name_type: str, attribute: str, top_n: Optional[int] = None) -> List[CountRow]:
+        return _limit(self.distribution(name, name_type).counts(attribute), top_n)
+
+    def genders(self, name: str) -> List[CountRow]:
+        return list(self.distribution(name, "first").genders)
+
+    def close(self) -> None:
+        """Release resources held outside the connection pool"""
+
+
+class _PooledBackend(DistributionBackend):
+    """Backend reading an SQLite file through a ConnectionPool"""
+
+    def __init__(self, pool: ConnectionPool):
+        self.pool = pool
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Connection for the calling thread"""
+        return self.pool.get()
+
+
+class SQLiteBackend(_PooledBackend):
+    """Aggregates the raw ``names`` table at query time"""
+
+    name = "sqlite"
+
+    def distribution(self, name: str, name_type: str) -> NameDistribution:
+        cursor = self.conn.execute(DISTRIBUTION_QUERY, (name, name_type))
+        return aggregate_rows(tuple(row) for row in cursor.fetchall())
+
+    def distributions_many(self, names: Iterable[str], name_type: str) -> Dict[str, NameDistribution]:
+        grouped: Dict[str, List[Tuple]] = {}
+
+        for chunk in _chunks(list(names)):
+            placeholders = ", ".join("?" * len(chunk))
+            cursor = self.conn.execute(
+                DISTRIBUTION_BATCH_QUERY.format(placeholders=placeholders),
+                (name_type, *chunk)
+            )
+            for row in cursor.fetchall():
+                grouped.setdefault(row[0], []).append(tuple(row)[1:])
+
+        return {name: aggregate_rows(rows) for name, rows in grouped.items()}
+
+    def countries(self, name: str, name_type: str, top_n: int) -> List[CountryRow]:
+        cursor = self.conn.execute(NATIONALITY_QUERY, (name, name_type, top_n))
+        return [tuple(row) for row in cursor.fetchall()]
+
+    def countries_many(self, names: Iterable[str], name_type: str, top_n: int) -> Dict[str, List[CountryRow]]:
+        grouped: Dict[str, List[CountryRow]] = {}
+
+        for chunk in _chunks(list(names)):
+            placeholders = ", ".join("?" * len(chunk))
+            cursor = self.conn.execute(
+                NATIONALITY_BATCH_QUERY.format(placeholders=placeholders),
+                (name_type, *chunk)
+            )
+            for row in cursor.fetchall():
+                grouped.setdefault(row[0], []).append(tuple(row)[1:])
+
+        for rows in grouped.values():
+            rows.sort(key=country_sort_key)
+            del rows[top_n:]
+
+        return grouped
+
+    def counts(self, name: str, name_type: str, attribute: str, top_n: Optional[int] = None) -> List[CountRow]:
+        query = ATTRIBUTE_QUERIES[attribute]
+        cursor = self.conn.execute(query, (name, name_type, -1 if top_n is None else top_n))
+        return [tuple(row) for row in cursor.fetchall()]
+
+    def genders(self, name: str) -> List[CountRow]:
+        cursor = self.conn.execute(GENDER_QUERY, (name,))
+        return [tuple(row) for row in cursor.fetchall()]
+
+
+class NameStatsBackend(_PooledBackend):
+    """Reads precomputed distributions from the ``name_stats`` table"""
+
+    name = "name_stats"
+
+    def distribution(self, name: str, name_type: str) -> NameDistribution:
+        row = self.conn.execute(NAME_STATS_QUERY, (name, name_type)).fetchone()
+        if row is None:
+            return EMPTY_DISTRIBUTION
+        return decode_distribution(*row)
+
+    def distributions_many(self, names: Iterable[str], name_type: str) -> Dict[str, NameDistribution]:
+        found: Dict[str, NameDistribution] = {}
+
+        for chunk in _chunks(list(names)):
+            placeholders = ", ".join("?" * len(chunk))
+            cursor = self.conn.execute(
+                NAME_STATS_BATCH_QUERY.format(placeholders=placeholders),
+                (name_type, *chunk)
+            )
+            for name, *columns in cursor.fetchall():
+                found[name] = decode_distribution(*columns)
+
+        return found
+
+
+class _Interner:
+    """Shares identical strings, rows and row tuples between distributions"""
+
+    def __init__(self):
+        self._seen: Dict[Hashable, Hashable] = {}
+
+    def __call__(self, value):
+        if isinstance(value, str):
+            return sys.intern(value)
+        return self._seen.setdefault(value, value)
+
+    def rows(self, rows: Tuple) -> Tuple:
+        return self(tuple(
+            self(tuple(self(v) if isinstance(v, str) else v for v in row))
+            for row in rows
+        ))
+
+    def distribution(self, dist: NameDistribution) -> NameDistribution:
+        return self(NameDistribution(
+            countries=self.rows(dist.countries),
+            regions=self.rows(dist.regions),
+            languages=self.rows(dist.languages),
+            religions=self.rows(dist.religions),
+            genders=self.rows(dist.genders),
+        ))
+
+
+class MemoryBackend(DistributionBackend):
+    """
+    Serves every lookup from RAM-resident dictionaries.
+
+    Built once from the ``name_stats`` table when current (the prebuilt
+    snapshot), otherwise by aggregating the raw ``names`` table.  Strings
+    and repeated distribution rows are interned to keep the footprint small.
+    """
+
+    name = "memory"
+
+    def __init__(self, distributions: Dict[str, Dict[str, NameDistribution]]):
+        self._by_type = distributions
+
+    @classmethod
+    def load(cls, conn: sqlite3.Connection) -> "MemoryBackend":
+        rows = iter_name_stats(conn) if name_stats_is_current(conn) else iter_distributions(conn)
+        intern = _Interner()
+        by_type: Dict[str, Dict[str, NameDistribution]] = {}
+
+        for name, name_type, dist in rows:
+            by_type.setdefault(sys.intern(name_type), {})[sys.intern(name)] = intern.distribution(dist)
+
+        return cls(by_type)
+
+    def __len__(self) -> int:
+        return sum(len(names) for names in self._by_type.values())
+
+    def distribution(self, name: str, name_type: str) -> NameDistribution:
+        names = self._by_type.get(name_type)
+        if names is None:
+            return EMPTY_DISTRIBUTION
+        return names.get(name, EMPTY_DISTRIBUTION)
+
+    def distributions_many(self, names: Iterable[str], name_type: str) -> Dict[str, NameDistribution]:
+        by_name = self._by_type.get(name_type, {})
+        return {name: by_name[name] for name in names if name in by_name}
+
+
+class SnapshotBackend(DistributionBackend):
+    """Reads distributions from a memory-mapped binary snapshot (see ``snapshot``)"""
+
+    name = "snapshot"
+
+    def __init__(self, path):
+        self.reader = SnapshotReader(path)
+
+    def __len__(self) -> int:
+        return len(self.reader)
+
+    def distribution(self, name: str, name_type: str) -> NameDistribution:
+        return self.reader.get(name, name_type)
+
+    def close(self) -> None:
+        self.reader.close()
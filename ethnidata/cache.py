@@ -0,0 +1,78 @@
+"""
+EthniData result cache
+
+Bounded least-recently-used cache for prediction results.  Name traffic is
+heavily skewed (a few thousand names dominate), so caching finished
+predictions lets hot names skip the database entirely.
+
+License: MIT
+"""
+
+import threading
+from collections import OrderedDict, namedtuple
+from typing import Any, Hashable, Tuple
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "evictions", "maxsize", "currsize"])
+
+_MISSING = object()
+
+
+def copy_result(value: Any) -> Any:
+    """
+    Copy a prediction result (nested dicts/lists of immutable leaves).
+
+    Much cheaper than copy.deepcopy for the shapes the predictor returns,
+    and keeps callers from mutating cached entries.
+    """
+    if isinstance(value, dict):
+        return {k: copy_result(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [copy_result(v) for v in value]
+    return value
+
+
+class LRUCache:
+    """Thread-safe LRU mapping with hit/miss/eviction counters"""
+
+    def __init__(self, maxsize: int):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """Return (found, value); a hit marks the entry most recently used"""
+        with self._lock:
+            value = self._data.get(key, _MISSING)
+            if value is _MISSING:
+                self.misses += 1
+                return False, None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return True, value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+            self._data[key] = value
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters"""
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.evictions, self.maxsize, len(self._data))
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -0,0 +1,444 @@
+"""
+EthniData command line interface
+
+    ethnidata enrich people.csv enriched.csv --first-name-column first --last-name-column last
+    ethnidata enrich names.jsonl out.jsonl --name-column name --name-type first
+    ethnidata enrich people.parquet out.parquet ...        # needs pyarrow
+
+``enrich`` streams the input in chunks, resolves each distinct name of a
+chunk once with batched lookups (on ``--workers`` processes if asked) and
+appends country, confidence, region, language, religion and gender columns
+to every row.  Memory use depends on the chunk size, not the file size.
+
+License: MIT
+"""
+
+import argparse
+import csv
+import json
+import sys
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from .predictor import EthniData
+
+if TYPE_CHECKING:
+    from .parallel import ParallelPredictor
+
+ENRICHED_FIELDS = ("country", "confidence", "region", "language", "religion", "gender")
+
+# Arrow types of the enriched columns; fixed up front so a first chunk of
+# unknown names (all None) does not type them as null
+ENRICHED_TYPES = {
+    "country": "string", "confidence": "float64", "region": "string",
+    "language": "string", "religion": "string", "gender": "string",
+}
+
+FORMATS = {
+    ".csv": "csv",
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+    ".parquet": "parquet",
+}
+
+Row = Dict[str, object]
+
+
+def detect_format(path: str, explicit: Optional[str] = None) -> str:
+    """Return 'csv', 'jsonl' or 'parquet' for ``path``"""
+    if explicit:
+        return explicit
+    fmt = FORMATS.get(Path(path).suffix.lower())
+    if fmt is None:
+        raise ValueError(f"Cannot infer format of {path}; use --input-format/--output-format")
+    return fmt
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow  # noqa: F401
+        import pyarrow.parquet  # noqa: F401
+    except ImportError:
+        raise ImportError("Parquet support requires pyarrow: pip install ethnidata[parquet]") from None
+    return pyarrow
+
+
+# ---------------------------------------------------------------------------
+# Readers: yield (fieldnames, rows) chunks
+# ---------------------------------------------------------------------------
+
+def _chunked(rows: Iterator[Row], chunk_size: int) -> Iterator[List[Row]]:
+    chunk: List[Row] = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def read_chunks(path: str, fmt: str, chunk_size: int) -> Tuple[List[str], Iterator[List[Row]]]:
+    """Open ``path`` and return its column names and a lazy chunk iterator"""
+    if fmt == "csv":
+        f = open(path, newline="", encoding="utf-8")
+        reader = csv.DictReader(f)
+        fieldnames = list(reader.fieldnames or [])
+
+        def chunks():
+            with f:
+                yield from _chunked(reader, chunk_size)
+        return fieldnames, chunks()
+
+    if fmt == "jsonl":
+        f = open(path, encoding="utf-8")
+
+        def rows():
+            with f:
+                for line in f:
+                    if line.strip():
+                        yield json.loads(line)
+        # Column order is only known per row for JSONL
+        return [], _chunked(rows(), chunk_size)
+
+    if fmt == "parquet":
+        pa = _require_pyarrow()
+        parquet_file = pa.parquet.ParquetFile(path)
+
+        def chunks():
+            for batch in parquet_file.iter_batches(batch_size=chunk_size):
+                yield batch.to_pylist()
+        return list(parquet_file.schema_arrow.names), chunks()
+
+    raise ValueError(f"Unsupported format: {fmt}")
+
+
+# ---------------------------------------------------------------------------
+# Writers
+# ---------------------------------------------------------------------------
+
+class _CsvWriter:
+    def __init__(self, path: str, fieldnames: List[str]):
+        self._file = open(path, "w", newline="", encoding="utf-8")
+        self._writer = csv.DictWriter(self._file, fieldnames=fieldnames, extrasaction="ignore")
+        self._writer.writeheader()
+
+    def write(self, rows: List[Row]) -> None:
+        self._writer.writerows(rows)
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class _JsonlWriter:
+    def __init__(self, path: str, fieldnames: List[str]):
+        self._file = open(path, "w", encoding="utf-8")
+
+    def write(self, rows: List[Row]) -> None:
+        self._file.writelines(json.dumps(row, ensure_ascii=False) + "\n" for row in rows)
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class _ParquetWriter:
+    """
+    Writes a fixed schema: ``input_schema`` (default: every column a
+    string, as CSV and JSONL input are written) plus ``enriched_types``.
+    Non-string values in string columns (JSONL numbers, objects) are stored
+    as their JSON text.
+    """
+
+    def __init__(self, path: str, fieldnames: List[str], input_schema=None,
+                 enriched_types: Optional[Dict[str, str]] = None):
+        pa = self._pa = _require_pyarrow()
+        enriched = {column: getattr(pa, type_name)() for column, type_name in (enriched_types or {}).items()}
+        if input_schema is None:
+            input_schema = pa.schema([(name, pa.string()) for name in fieldnames if name not in enriched])
+        fields = [pa.field(field.name, enriched.get(field.name, field.type)) for field in input_schema]
+        fields += [pa.field(column, arrow_type) for column, arrow_type in enriched.items()
+                   if column not in input_schema.names]
+        self._schema = pa.schema(fields)
+        self._text_columns = [field.name for field in fields
+                              if field.type == pa.string() and field.name not in enriched]
+        self._path = path
+        self._writer = None
+
+    def _as_text(self, rows: List[Row]) -> List[Row]:
+        for row in rows:
+            for column in self._text_columns:
+                value = row.get(column)
+                if value is not None and not isinstance(value, str):
+                    row[column] = json.dumps(value, ensure_ascii=False)
+        return rows
+
+    def write(self, rows: List[Row]) -> None:
+        if self._writer is None:
+            self._writer = self._pa.parquet.ParquetWriter(self._path, self._schema)
+        self._writer.write_table(self._pa.Table.from_pylist(self._as_text(rows), schema=self._schema))
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+
+
+def _jsonl_columns(path: str) -> List[str]:
+    """Every key of a JSONL file, in order of first appearance (one extra pass)"""
+    columns: Dict[str, None] = {}
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                columns.update(dict.fromkeys(json.loads(line)))
+    return list(columns)
+
+
+WRITERS = {"csv": _CsvWriter, "jsonl": _JsonlWriter, "parquet": _ParquetWriter}
+
+
+# ---------------------------------------------------------------------------
+# Enrichment
+# ---------------------------------------------------------------------------
+
+def _clean(value) -> str:
+    return value.strip() if isinstance(value, str) else ""
+
+
+class Enricher:
+    """
+    Adds prediction columns to chunks of rows.
+
+    Either ``first_column`` and ``last_column`` (full-name prediction) or
+    ``name_column`` with ``name_type`` must be given.  Each distinct name in
+    a chunk is looked up once.
+    """
+
+    def __init__(
+        self,
+        predictor: Union[EthniData, "ParallelPredictor"],
+        first_column: Optional[str] = None,
+        last_column: Optional[str] = None,
+        name_column: Optional[str] = None,
+        name_type: str = "first",
+        prefix: str = ""
+    ):
+        if name_column is None and not (first_column and last_column):
+            raise ValueError("Give either name_column or both first_column and last_column")
+        self.predictor = predictor
+        self.first_column = first_column
+        self.last_column = last_column
+        self.name_column = name_column
+        self.name_type = name_type
+        self.columns = {field: prefix + field for field in ENRICHED_FIELDS}
+
+    @property
+    def input_columns(self) -> List[str]:
+        if self.name_column is not None:
+            return [self.name_column]
+        return [self.first_column, self.last_column]
+
+    def _predict_single(self, names: List[str]) -> Dict[str, Dict]:
+        enriched = {}
+        for name, result in zip(names, self.predictor.predict_all_batch(names, self.name_type)):
+            nationality = result['nationality']
+            enriched[name] = {
+                'country': nationality['country'],
+                'confidence': nationality['confidence'],
+                'region': nationality['region'],
+                'language': nationality['language'],
+                'religion': result['religion']['religion'],
+                'gender': result.get('gender', {}).get('gender'),
+            }
+        return enriched
+
+    def _predict_full(self, pairs: List[Tuple[str, str]]) -> Dict[Tuple[str, str], Dict]:
+        firsts = [first for first in dict.fromkeys(first for first, _ in pairs) if first]
+        by_first = {
+            first: result
+            for first, result in zip(firsts, self.predictor.predict_all_batch(firsts, "first"))
+        }
+
+        enriched = {}
+        for pair, result in zip(pairs, self.predictor.predict_full_name_batch(pairs)):
+            first_result = by_first.get(pair[0])
+            enriched[pair] = {
+                'country': result['country'],
+                'confidence': result['confidence'],
+                'region': result['region'],
+                'language': result['language'],
+                'religion': first_result['religion']['religion'] if first_result else None,
+                'gender': first_result['gender']['gender'] if first_result else None,
+            }
+        return enriched
+
+    def enrich(self, rows: List[Row]) -> List[Row]:
+        """Add the prediction columns to ``rows`` in place and return them"""
+        if self.name_column is not None:
+            keys = [_clean(row.get(self.name_column)) for row in rows]
+            predictions = self._predict_single([key for key in dict.fromkeys(keys) if key])
+        else:
+            keys = [(_clean(row.get(self.first_column)), _clean(row.get(self.last_column))) for row in rows]
+            predictions = self._predict_full([key for key in dict.fromkeys(keys) if key[0] and key[1]])
+
+        empty = dict.fromkeys(ENRICHED_FIELDS)
+        for row, key in zip(rows, keys):
+            values = predictions.get(key, empty)
+            for field, column in self.columns.items():
+                row[column] = values[field]
+        return rows
+
+
+def enrich_file(
+    input_path: str,
+    output_path: str,
+    enricher: Enricher,
+    chunk_size: int = 10000,
+    input_format: Optional[str] = None,
+    output_format: Optional[str] = None,
+    progress=None
+) -> Dict[str, float]:
+    """
+    Stream ``input_path`` through ``enricher`` into ``output_path``.
+
+    Args:
+        progress: Optional callback receiving (rows_done, elapsed_seconds)
+                  after every chunk
+
+    Returns:
+        {'rows': int, 'seconds': float, 'rows_per_second': float}
+    """
+    in_fmt = detect_format(input_path, input_format)
+    out_fmt = detect_format(output_path, output_format)
+
+    fieldnames, chunks = read_chunks(input_path, in_fmt, chunk_size)
+    if in_fmt == "jsonl" and out_fmt == "parquet":
+        # Parquet needs every column before the first row group
+        fieldnames = _jsonl_columns(input_path)
+    missing = [c for c in enricher.input_columns if fieldnames and c not in fieldnames]
+    if missing:
+        raise ValueError(f"Input has no column(s): {', '.join(missing)}")
+    out_fields = fieldnames + [c for c in enricher.columns.values() if c not in fieldnames]
+
+    options = {}
+    if out_fmt == "parquet":
+        options = {
+            'input_schema': _require_pyarrow().parquet.read_schema(input_path) if in_fmt == "parquet" else None,
+            'enriched_types': {column: ENRICHED_TYPES[field] for field, column in enricher.columns.items()},
+        }
+    writer = WRITERS[out_fmt](output_path, out_fields, **options)
+    start = time.perf_counter()
+    done = 0
+    try:
+        for chunk in chunks:
+            writer.write(enricher.enrich(chunk))
+            done += len(chunk)
+            if progress:
+                progress(done, time.perf_counter() - start)
+    except BaseException:
+        # Do not leave a truncated output file behind
+        writer.close()
+        Path(output_path).unlink(missing_ok=True)
+        raise
+    writer.close()
+
+    seconds = time.perf_counter() - start
+    return {'rows': done, 'seconds': seconds, 'rows_per_second': done / seconds if seconds else 0.0}
+
+
+# ---------------------------------------------------------------------------
+# Entry point
+# ---------------------------------------------------------------------------
+
+def _print_progress(rows: int, seconds: float) -> None:
+    rate = rows / seconds if seconds else 0.0
+    print(f"   {rows:,} rows  {rate:,.0f} rows/s", end="\r", file=sys.stderr, flush=True)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="ethnidata", description="EthniData command line tools")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    enrich = subparsers.add_parser(
+        "enrich",
+        help="Add country/confidence/region/language/religion/gender columns to a file",
+        description="Stream a CSV, JSONL or Parquet file and append EthniData predictions."
+    )
+    enrich.add_argument("input", help="Input file (.csv, .jsonl, .parquet)")
+    enrich.add_argument("output", help="Output file (.csv, .jsonl, .parquet)")
+    enrich.add_argument("--first-name-column", help="Column holding first names")
+    enrich.add_argument("--last-name-column", help="Column holding last names")
+    enrich.add_argument("--name-column", help="Column holding a single name (instead of first/last)")
+    enrich.add_argument("--name-type", choices=["first", "last"], default="first",
+                        help="Type of --name-column (default: first)")
+    enrich.add_argument("--input-format", choices=sorted(WRITERS), help="Override input format")
+    enrich.add_argument("--output-format", choices=sorted(WRITERS), help="Override output format")
+    enrich.add_argument("--chunk-size", type=int, default=10000, help="Rows per chunk (default: 10000)")
+    enrich.add_argument("--prefix", default="", help="Prefix for the added column names")
+    enrich.add_argument("--db", help="Path to the EthniData database")
+    enrich.add_argument("--v3", action="store_true", help="Use the v3 database if installed")
+    enrich.add_argument("--backend", choices=["sqlite", "memory", "snapshot"], default="sqlite",
+                        help="Storage backend (default: sqlite)")
+    enrich.add_argument("--cache-size", type=int, default=100000,
+                        help="Names cached across chunks (default: 100000, 0 disables)")
+    enrich.add_argument("--workers", type=int, default=1,
+                        help="Worker processes for lookups (default: 1, in-process)")
+    enrich.add_argument("--quiet", action="store_true", help="Do not report progress")
+    return parser
+
+
+def _enrich(args: argparse.Namespace) -> int:
+    if args.name_column is None and not (args.first_name_column and args.last_name_column):
+        print("❌ Give --name-column, or both --first-name-column and --last-name-column", file=sys.stderr)
+        return 2
+    if not Path(args.input).exists():
+        print(f"❌ Input not found: {args.input}", file=sys.stderr)
+        return 1
+
+    if args.workers > 1:
+        from .parallel import ParallelPredictor
+
+        predictor = ParallelPredictor(
+            db_path=args.db, use_v3=args.v3, n_workers=args.workers,
+            # Split each input chunk so every worker gets a share of it
+            chunk_size=max(1, args.chunk_size // args.workers),
+            cache_size=args.cache_size, backend=args.backend
+        )
+    else:
+        predictor = EthniData(db_path=args.db, use_v3=args.v3, cache_size=args.cache_size, backend=args.backend)
+
+    with predictor:
+        enricher = Enricher(
+            predictor,
+            first_column=args.first_name_column,
+            last_column=args.last_name_column,
+            name_column=args.name_column,
+            name_type=args.name_type,
+            prefix=args.prefix
+        )
+        try:
+            report = enrich_file(
+                args.input, args.output, enricher,
+                chunk_size=args.chunk_size,
+                input_format=args.input_format,
+                output_format=args.output_format,
+                progress=None if args.quiet else _print_progress
+            )
+        except (ValueError, ImportError) as e:
+            print(f"\n❌ {e}", file=sys.stderr)
+            return 1
+
+    if not args.quiet:
+        print(f"\n✅ Enriched {report['rows']:,} rows in {report['seconds']:.1f}s "
+              f"({report['rows_per_second']:,.0f} rows/s) -> {args.output}", file=sys.stderr)
+    return 0
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = _build_parser().parse_args(argv)
+    if args.command == "enrich":
+        return _enrich(args)
+    return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
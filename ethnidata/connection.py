@@ -0,0 +1,134 @@
+"""
+EthniData connection management
+
+EthniData either uses one shared connection (the classic single-threaded
+mode) or hands every thread its own read-only connection, so a single
+predictor - and its result cache - can be shared by a threaded web server.
+
+License: MIT
+"""
+
+import sqlite3
+import threading
+import weakref
+from pathlib import Path
+from typing import List
+
+# Idle per-thread connections kept for reuse after their thread ends
+MAX_IDLE_CONNECTIONS = 8
+
+
+def read_only_uri(db_path: Path, immutable: bool = False) -> str:
+    """Build a ``file:`` URI that opens ``db_path`` read-only"""
+    uri = f"{Path(db_path).resolve().as_uri()}?mode=ro"
+    if immutable:
+        # No locking or change detection: only for files nobody writes to
+        uri += "&immutable=1"
+    return uri
+
+
+def has_table(conn: sqlite3.Connection, table: str) -> bool:
+    """Return True if the database contains ``table``"""
+    row = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+        (table,)
+    ).fetchone()
+    return row is not None
+
+
+class _ThreadConnection:
+    """Thread-local holder; dropped (and its connection released) when the thread ends"""
+
+    __slots__ = ("conn", "__weakref__")
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+
+
+class ConnectionPool:
+    """
+    Hands out SQLite connections for an EthniData database.
+
+    Args:
+        db_path: Path to the SQLite file
+        per_thread: If True, each thread lazily gets its own read-only
+            connection; otherwise one read-write connection is shared
+        immutable: Open per-thread connections with ``immutable=1``
+        max_idle: Connections of finished threads kept for new threads;
+            the rest are closed
+    """
+
+    def __init__(self, db_path: Path, per_thread: bool = False, immutable: bool = False,
+                 max_idle: int = MAX_IDLE_CONNECTIONS):
+        self.db_path = Path(db_path)
+        self.per_thread = per_thread
+        self.immutable = immutable
+        self.max_idle = max_idle
+        self._closed = False
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._idle: List[sqlite3.Connection] = []
+
+        if not per_thread:
+            self._shared = self._open(read_only=False)
+
+    def _open(self, read_only: bool) -> sqlite3.Connection:
+        if read_only:
+            conn = sqlite3.connect(
+                read_only_uri(self.db_path, self.immutable),
+                uri=True,
+                check_same_thread=False
+            )
+        else:
+            conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        with self._lock:
+            self._connections.append(conn)
+        return conn
+
+    def get(self) -> sqlite3.Connection:
+        """Return the connection to use from the calling thread"""
+        if not self.per_thread:
+            return self._shared
+        if self._closed:
+            raise sqlite3.ProgrammingError("Cannot operate on a closed database.")
+
+        holder = getattr(self._local, "holder", None)
+        if holder is None:
+            with self._lock:
+                conn = self._idle.pop() if self._idle else None
+            if conn is None:
+                conn = self._open(read_only=True)
+            holder = self._local.holder = _ThreadConnection(conn)
+            weakref.finalize(holder, self._release, conn).atexit = False
+        return holder.conn
+
+    def _release(self, conn: sqlite3.Connection) -> None:
+        """Take back the connection of a finished thread"""
+        with self._lock:
+            if not self._closed and len(self._idle) < self.max_idle:
+                self._idle.append(conn)
+                return
+            if conn in self._connections:
+                self._connections.remove(conn)
+        conn.close()
+
+    @property
+    def size(self) -> int:
+        """Number of open connections (in use or idle)"""
+        return len(self._connections)
+
+    @property
+    def idle(self) -> int:
+        """Number of idle connections waiting for a new thread"""
+        return len(self._idle)
+
+    def close(self) -> None:
+        """Close every connection handed out by this pool"""
+        with self._lock:
+            self._closed = True
+            connections, self._connections = self._connections, []
+            self._idle = []
+        for conn in connections:
+            conn.close()
@@ -0,0 +1,167 @@
+"""
+EthniData post-ranking corrections
+
+After predict_nationality() has ranked countries from the database it runs
+a correction pipeline that fixes well-known coverage gaps, e.g. Turkish
+surnames outranked by neighbouring countries or Japanese surnames
+mislabelled as Bhutanese.
+
+Each stage has a cheap ``matches()`` pre-filter (set / trie lookups
+precompiled by the rule pack); the first stage that matches a name handles
+it and the pipeline stops.  Names no stage matches cost a handful of set
+lookups.
+
+Configure per predictor:
+
+    EthniData(corrections=[])                                # disabled
+    EthniData(corrections=default_corrections() + [MyStage()])
+
+License: MIT
+"""
+
+from typing import Dict, Iterable, List, Optional
+
+from .countries import country_name
+from .morphology import MorphologyEngine
+
+
+class Ranking:
+    """Ranked countries and confidence for one name, as seen by corrections"""
+
+    __slots__ = ("name_lower", "top_countries", "confidence", "applied", "signal")
+
+    def __init__(self, name_lower: str, top_countries: List[Dict], confidence: float):
+        self.name_lower = name_lower
+        self.top_countries = top_countries
+        self.confidence = confidence
+        self.applied = False
+        self.signal: Optional[str] = None
+
+
+class Correction:
+    """Base class for a post-ranking correction stage"""
+
+    name = "correction"
+
+    def matches(self, name_lower: str) -> bool:
+        """Fast pre-filter: does this stage handle the name?"""
+        raise NotImplementedError
+
+    def apply(self, ranking: Ranking) -> None:
+        """Adjust ``ranking`` in place; set ``ranking.applied`` if anything changed"""
+        raise NotImplementedError
+
+
+class CountryBoost(Correction):
+    """
+    Promote ``country`` to the top when the name carries its signal.
+
+    If the country is ranked, it moves to first place and confidence is
+    raised to at least ``found_confidence``.  Otherwise, when
+    ``can_insert()`` allows it, a synthetic entry is inserted with
+    ``insert_probability`` and confidence becomes ``insert_confidence``.
+    """
+
+    def __init__(
+        self,
+        signal: str,
+        country: str,
+        region: str,
+        language: str,
+        found_confidence: float = 0.75,
+        insert_probability: float = 0.85,
+        insert_confidence: float = 0.70
+    ):
+        self.name = signal.lower()
+        self.signal = signal
+        self.country = country
+        self.region = region
+        self.language = language
+        self.found_confidence = found_confidence
+        self.insert_probability = insert_probability
+        self.insert_confidence = insert_confidence
+
+    def can_insert(self, name_lower: str) -> bool:
+        return True
+
+    def apply(self, ranking: Ranking) -> None:
+        top_countries = ranking.top_countries
+
+        for i, country_data in enumerate(top_countries):
+            if country_data['country'] == self.country:
+                top_countries.insert(0, top_countries.pop(i))
+                ranking.confidence = max(ranking.confidence, self.found_confidence)
+                break
+        else:
+            if not self.can_insert(ranking.name_lower):
+                return
+            top_countries.insert(0, {
+                'country': self.country,
+                'country_name': country_name(self.country),
+                'region': self.region,
+                'language': self.language,
+                'probability': self.insert_probability,
+                'frequency': 0
+            })
+            ranking.confidence = self.insert_confidence
+
+        ranking.applied = True
+        ranking.signal = self.signal
+
+
+class TurkishBoost(CountryBoost):
+    """Turkish characters or suffixes; inserts TUR only when both are present"""
+
+    def __init__(self):
+        super().__init__('Turkish', 'TUR', 'Asia', 'Turkish',
+                         found_confidence=0.70, insert_probability=0.80, insert_confidence=0.65)
+
+    def matches(self, name_lower: str) -> bool:
+        rules = MorphologyEngine.rule_pack()
+        return rules.has_turkish_chars(name_lower) or rules.has_turkish_suffix(name_lower)
+
+    def can_insert(self, name_lower: str) -> bool:
+        rules = MorphologyEngine.rule_pack()
+        return rules.has_turkish_chars(name_lower) and rules.has_turkish_suffix(name_lower)
+
+
+class JapaneseBoost(CountryBoost):
+    """Common Japanese surnames (avoids Bhutan-style mislabels)"""
+
+    def __init__(self):
+        super().__init__('Japanese', 'JPN', 'Asia', 'Japanese')
+
+    def matches(self, name_lower: str) -> bool:
+        return name_lower in MorphologyEngine.rule_pack().japanese_common
+
+
+class ChineseBoost(CountryBoost):
+    """Common Chinese surnames"""
+
+    def __init__(self):
+        super().__init__('Chinese', 'CHN', 'Asia', 'Chinese')
+
+    def matches(self, name_lower: str) -> bool:
+        return name_lower in MorphologyEngine.rule_pack().chinese_common
+
+
+def default_corrections() -> List[Correction]:
+    """The built-in stages, in priority order"""
+    return [TurkishBoost(), JapaneseBoost(), ChineseBoost()]
+
+
+class CorrectionPipeline:
+    """Ordered correction stages; the first stage matching a name handles it"""
+
+    def __init__(self, stages: Optional[Iterable[Correction]] = None):
+        self.stages: List[Correction] = default_corrections() if stages is None else list(stages)
+
+    def __bool__(self) -> bool:
+        return bool(self.stages)
+
+    def apply(self, ranking: Ranking) -> Ranking:
+        for stage in self.stages:
+            if stage.matches(ranking.name_lower):
+                stage.apply(ranking)
+                break
+        return ranking
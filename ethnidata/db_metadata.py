@@ -0,0 +1,149 @@
+"""
+EthniData database metadata
+
+get_stats() used to count rows and distinct values over the whole
+``names`` table on every call, which takes seconds on the v3 database.
+The build pipeline now stores those numbers once in a ``db_metadata``
+key/value table, together with the package version that built it and a
+checksum of the ``names`` rows; get_stats() reads them back with one
+small query.  Databases without the table (older downloads) are still
+scanned.
+
+Write or refresh it after building a database:
+
+    python -m ethnidata.tools.build_metadata path/to/ethnidata.db
+    python -m ethnidata.tools.build_metadata path/to/ethnidata.db --verify
+
+get_stats() does not check the stored counts against ``names``.  Anything
+that writes to ``names`` must call invalidate_derived_tables() first (the
+scripts/ steps that modify a database do) or rebuild the table afterwards
+(``make metadata``); ``--verify`` reports a table that has gone stale.
+
+License: MIT
+"""
+
+import hashlib
+import sqlite3
+import time
+from typing import Dict, Optional, Sequence
+
+from .connection import has_table
+from .fuzzy import FUZZY_META_TABLE, FUZZY_TABLE
+from .name_stats import NAME_STATS_SOURCE_TABLE, NAME_STATS_TABLE
+
+METADATA_TABLE = "db_metadata"
+
+METADATA_SCHEMA = f"""
+    CREATE TABLE {METADATA_TABLE} (
+        key TEXT PRIMARY KEY,
+        value TEXT NOT NULL
+    )
+"""
+
+# Keys holding integer counts; the rest are strings
+COUNT_KEYS = (
+    "total_rows", "total_first_names", "total_last_names",
+    "countries", "regions", "languages", "religions",
+)
+
+# Tables computed from the names rows; invalidate_derived_tables() drops them
+DERIVED_TABLES = (METADATA_TABLE, NAME_STATS_TABLE, NAME_STATS_SOURCE_TABLE, FUZZY_TABLE, FUZZY_META_TABLE)
+
+# Keys returned by EthniData.get_stats()
+STATS_KEYS = ("total_first_names", "total_last_names", "countries", "regions", "languages")
+
+_CHECKSUM_QUERY = """
+    SELECT name, name_type, country_code, region, language, religion, gender, source
+    FROM names
+    ORDER BY name, name_type, country_code, source, region, language, religion, gender
+"""
+
+
+def invalidate_derived_tables(conn: sqlite3.Connection) -> None:
+    """
+    Drop db_metadata, name_stats and the fuzzy index before changing ``names``
+
+    Readers then fall back to the raw table until scripts/30 (and
+    build_fuzzy_index) rebuild them.
+    """
+    for table in DERIVED_TABLES:
+        conn.execute(f"DROP TABLE IF EXISTS {table}")
+    conn.commit()
+
+
+def has_db_metadata(conn: sqlite3.Connection) -> bool:
+    """Return True if the database contains a db_metadata table"""
+    return has_table(conn, METADATA_TABLE)
+
+
+_COUNT_QUERIES = {
+    'total_rows': "SELECT COUNT(*) FROM names",
+    'total_first_names': "SELECT COUNT(*) FROM names WHERE name_type = 'first'",
+    'total_last_names': "SELECT COUNT(*) FROM names WHERE name_type = 'last'",
+    'countries': "SELECT COUNT(DISTINCT country_code) FROM names",
+    'regions': "SELECT COUNT(DISTINCT region) FROM names WHERE region IS NOT NULL",
+    'languages': "SELECT COUNT(DISTINCT language) FROM names WHERE language IS NOT NULL",
+    'religions': "SELECT COUNT(DISTINCT religion) FROM names WHERE religion IS NOT NULL",
+}
+
+
+def scan_stats(conn: sqlite3.Connection, keys: Sequence[str] = COUNT_KEYS) -> Dict[str, int]:
+    """Row and distinct-value counts of the ``names`` table (one full scan per key)"""
+    return {key: conn.execute(_COUNT_QUERIES[key]).fetchone()[0] for key in keys}
+
+
+def names_checksum(conn: sqlite3.Connection) -> str:
+    """SHA-256 over every ``names`` row in a fixed order"""
+    digest = hashlib.sha256()
+    for row in conn.execute(_CHECKSUM_QUERY):
+        digest.update("\x1f".join("" if value is None else str(value) for value in row).encode("utf-8"))
+        digest.update(b"\x1e")
+    return digest.hexdigest()
+
+
+def build_db_metadata(conn: sqlite3.Connection, checksum: bool = True) -> Dict:
+    """
+    (Re)create the db_metadata table from the ``names`` table.
+
+    Args:
+        conn: Writable connection to an EthniData database
+        checksum: Also store names_checksum() (one more full, ordered scan)
+
+    Returns:
+        The metadata written, as read_db_metadata() returns it
+    """
+    from . import __version__
+
+    metadata = scan_stats(conn)
+    metadata['build_version'] = __version__
+    metadata['built_at'] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+    if checksum:
+        metadata['checksum'] = f"sha256:{names_checksum(conn)}"
+
+    conn.execute(f"DROP TABLE IF EXISTS {METADATA_TABLE}")
+    conn.execute(METADATA_SCHEMA)
+    conn.executemany(
+        f"INSERT INTO {METADATA_TABLE} (key, value) VALUES (?, ?)",
+        [(key, str(value)) for key, value in metadata.items()]
+    )
+    conn.commit()
+    return metadata
+
+
+def read_db_metadata(conn: sqlite3.Connection) -> Optional[Dict]:
+    """Stored metadata with counts as ints, or None for databases without the table"""
+    if not has_db_metadata(conn):
+        return None
+    metadata: Dict = {key: value for key, value in conn.execute(f"SELECT key, value FROM {METADATA_TABLE}")}
+    for key in COUNT_KEYS:
+        if key in metadata:
+            metadata[key] = int(metadata[key])
+    return metadata
+
+
+def database_stats(conn: sqlite3.Connection) -> Dict[str, int]:
+    """EthniData.get_stats(): from db_metadata when it has every key, else by scanning"""
+    metadata = read_db_metadata(conn)
+    if metadata is None or not all(key in metadata for key in STATS_KEYS):
+        metadata = scan_stats(conn, STATS_KEYS)
+    return {key: metadata[key] for key in STATS_KEYS}
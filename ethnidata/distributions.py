@@ -0,0 +1,118 @@
+"""
+EthniData name distributions
+
+Aggregated per-(name, name_type) counts of country, region, language,
+religion and gender, kept in the exact order the predictor's SQL queries
+produce them so every storage backend ranks results identically.
+
+License: MIT
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional, Tuple
+
+CountryRow = Tuple[Optional[str], Optional[str], Optional[str], int]
+CountRow = Tuple[Optional[str], int]
+
+
+def null_first(value) -> Tuple:
+    """Sort key component mirroring SQLite's NULLs-first ascending order"""
+    return (0, "") if value is None else (1, value)
+
+
+def country_sort_key(row: CountryRow) -> Tuple:
+    """ORDER BY frequency DESC, country_code, region, language"""
+    country_code, region, language, frequency = row
+    return (-frequency, null_first(country_code), null_first(region), null_first(language))
+
+
+def count_sort_key(row: CountRow) -> Tuple:
+    """ORDER BY total_freq DESC, <attribute>"""
+    value, count = row
+    return (-count, null_first(value))
+
+
+def gender_sort_key(row: CountRow) -> Tuple:
+    """ORDER BY gender"""
+    return null_first(row[0])
+
+
+@dataclass(frozen=True)
+class NameDistribution:
+    """All attribute distributions for one (name, name_type)"""
+    countries: Tuple[CountryRow, ...] = ()
+    regions: Tuple[CountRow, ...] = ()
+    languages: Tuple[CountRow, ...] = ()   # NULL languages excluded
+    religions: Tuple[CountRow, ...] = ()   # NULL religions excluded
+    genders: Tuple[CountRow, ...] = ()
+
+    def counts(self, attribute: str) -> Tuple[CountRow, ...]:
+        """Return the distribution for 'region', 'language' or 'religion'"""
+        if attribute == "region":
+            return self.regions
+        if attribute == "language":
+            return self.languages
+        if attribute == "religion":
+            return self.religions
+        raise ValueError(f"Unknown attribute: {attribute}")
+
+    @property
+    def total(self) -> int:
+        """Number of underlying rows in the names table"""
+        return sum(row[3] for row in self.countries)
+
+
+EMPTY_DISTRIBUTION = NameDistribution()
+
+
+class DistributionBuilder:
+    """Accumulates raw attribute rows into a NameDistribution"""
+
+    def __init__(self):
+        self._countries: Dict[Tuple, int] = {}
+        self._regions: Dict[Optional[str], int] = {}
+        self._languages: Dict[Optional[str], int] = {}
+        self._religions: Dict[Optional[str], int] = {}
+        self._genders: Dict[Optional[str], int] = {}
+
+    def add(
+        self,
+        country_code: Optional[str],
+        region: Optional[str],
+        language: Optional[str],
+        religion: Optional[str],
+        gender: Optional[str],
+        count: int = 1
+    ) -> None:
+        """Add ``count`` rows sharing the given attribute values"""
+        key = (country_code, region, language)
+        self._countries[key] = self._countries.get(key, 0) + count
+        self._regions[region] = self._regions.get(region, 0) + count
+        if language is not None:
+            self._languages[language] = self._languages.get(language, 0) + count
+        if religion is not None:
+            self._religions[religion] = self._religions.get(religion, 0) + count
+        self._genders[gender] = self._genders.get(gender, 0) + count
+
+    def build(self) -> NameDistribution:
+        return NameDistribution(
+            countries=tuple(sorted(
+                ((c, r, lang, n) for (c, r, lang), n in self._countries.items()),
+                key=country_sort_key
+            )),
+            regions=tuple(sorted(self._regions.items(), key=count_sort_key)),
+            languages=tuple(sorted(self._languages.items(), key=count_sort_key)),
+            religions=tuple(sorted(self._religions.items(), key=count_sort_key)),
+            genders=tuple(sorted(self._genders.items(), key=gender_sort_key)),
+        )
+
+
+def aggregate_rows(rows: Iterable[Tuple]) -> NameDistribution:
+    """
+    Build a NameDistribution from (country_code, region, language,
+    religion, gender, count) rows of a single name.
+    """
+    builder = DistributionBuilder()
+    for country_code, region, language, religion, gender, count in rows:
+        builder.add(country_code, region, language, religion, gender, count)
+    return builder.build()
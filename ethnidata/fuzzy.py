@@ -0,0 +1,296 @@
+"""
+EthniData fuzzy name lookup
+
+Misspelled or variant names ("Mohammed" / "Muhammad" / "Mohamad") have no
+rows of their own.  The ``fuzzy_deletes`` table is a SymSpell deletion
+dictionary over the distinct names of the ``names`` table: every known
+name is stored under each string obtained by deleting up to
+``max_distance`` characters from its first ``prefix_length`` characters.
+A query generates its own deletes the same way, fetches the candidates
+sharing one of them with a single indexed ``IN (...)`` read, and keeps
+those within ``max_distance`` edits (insertions, deletions, substitutions
+and adjacent transpositions).
+
+Build it once after creating a database:
+
+    python -m ethnidata.tools.build_fuzzy_index path/to/ethnidata.db
+
+then enable the fallback with ``EthniData(fuzzy=True)``.  The fallback
+allows fewer edits for short names, where one or two edits reach too many
+unrelated names: none below ``MIN_FUZZY_LENGTH`` characters, one below
+``SHORT_NAME_LENGTH``.
+
+License: MIT
+"""
+
+import sqlite3
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from .connection import has_table
+from .name_stats import NAME_STATS_TABLE, name_stats_is_current
+
+FUZZY_TABLE = "fuzzy_deletes"
+FUZZY_META_TABLE = "fuzzy_meta"
+
+FUZZY_SCHEMA = f"""
+    CREATE TABLE {FUZZY_TABLE} (
+        variant TEXT NOT NULL,
+        name_type TEXT NOT NULL,
+        name TEXT NOT NULL,
+        frequency INTEGER NOT NULL,
+        PRIMARY KEY (variant, name_type, name)
+    ) WITHOUT ROWID
+"""
+
+FUZZY_META_SCHEMA = f"""
+    CREATE TABLE {FUZZY_META_TABLE} (
+        key TEXT PRIMARY KEY,
+        value INTEGER NOT NULL
+    )
+"""
+
+DEFAULT_MAX_DISTANCE = 2
+DEFAULT_PREFIX_LENGTH = 7
+
+# Fallback edit budget by name length (see fallback_distance())
+MIN_FUZZY_LENGTH = 4
+SHORT_NAME_LENGTH = 6
+
+# Rows written per executemany() call while building
+_WRITE_BATCH = 10000
+
+
+def has_fuzzy_index(conn: sqlite3.Connection) -> bool:
+    """Return True if the database contains a fuzzy_deletes table"""
+    return has_table(conn, FUZZY_TABLE)
+
+
+def deletes(word: str, max_distance: int) -> Set[str]:
+    """``word`` and every string made by deleting up to ``max_distance`` characters"""
+    found = {word}
+    frontier = {word}
+    for _ in range(max_distance):
+        frontier = {w[:i] + w[i + 1:] for w in frontier if len(w) > 1 for i in range(len(w))} - found
+        found |= frontier
+    return found
+
+
+def edit_distance(a: str, b: str, max_distance: int) -> int:
+    """
+    Optimal string alignment distance between ``a`` and ``b``
+
+    Only the diagonal band of width ``2 * max_distance + 1`` is computed;
+    returns ``max_distance + 1`` as soon as the distance is known to exceed
+    ``max_distance``.
+    """
+    if a == b:
+        return 0
+    too_far = max_distance + 1
+    n, m = len(a), len(b)
+    if abs(n - m) > max_distance:
+        return too_far
+
+    previous2: List[int] = []
+    previous = [j if j <= max_distance else too_far for j in range(m + 1)]
+    for i in range(1, n + 1):
+        char = a[i - 1]
+        low, high = max(1, i - max_distance), min(m, i + max_distance)
+        current = [too_far] * (m + 1)
+        current[0] = i if i <= max_distance else too_far
+        best = current[0]
+        for j in range(low, high + 1):
+            value = previous[j - 1] + (char != b[j - 1])
+            if previous[j] + 1 < value:
+                value = previous[j] + 1
+            if current[j - 1] + 1 < value:
+                value = current[j - 1] + 1
+            if i > 1 and j > 1 and char == b[j - 2] and a[i - 2] == b[j - 1] and previous2[j - 2] + 1 < value:
+                value = previous2[j - 2] + 1
+            current[j] = value
+            if value < best:
+                best = value
+        if best > max_distance:
+            return too_far
+        previous2, previous = previous, current
+    return min(previous[m], too_far)
+
+
+def fallback_distance(name: str, max_distance: int) -> int:
+    """Edits the fuzzy fallback allows for ``name``: 0 if too short, at most 1 if short"""
+    if len(name) < MIN_FUZZY_LENGTH:
+        return 0
+    if len(name) < SHORT_NAME_LENGTH:
+        return min(max_distance, 1)
+    return max_distance
+
+
+def _iter_names(conn: sqlite3.Connection) -> Iterator[Tuple[str, str, int]]:
+    """(name, name_type, frequency) for every distinct key"""
+    if name_stats_is_current(conn):
+        query = f"SELECT name, name_type, total FROM {NAME_STATS_TABLE}"
+    else:
+        query = """
+            SELECT name, name_type, COUNT(*)
+            FROM names
+            WHERE name IS NOT NULL AND name_type IS NOT NULL
+            GROUP BY name, name_type
+        """
+    return conn.execute(query)
+
+
+def build_fuzzy_index(
+    conn: sqlite3.Connection,
+    max_distance: int = DEFAULT_MAX_DISTANCE,
+    prefix_length: int = DEFAULT_PREFIX_LENGTH,
+    progress: Optional[Callable[[int], None]] = None
+) -> int:
+    """
+    (Re)create the fuzzy_deletes table from the distinct names.
+
+    Args:
+        conn: Writable connection to an EthniData database
+        max_distance: Largest edit distance lookups can use
+        prefix_length: Characters of each name that deletes are taken from;
+            longer prefixes give a larger, more selective index
+        progress: Optional callback receiving the number of names indexed so far
+
+    Returns:
+        Number of (name, name_type) keys indexed
+    """
+    if max_distance < 0 or prefix_length <= max_distance:
+        raise ValueError("Need 0 <= max_distance < prefix_length")
+
+    conn.execute(f"DROP TABLE IF EXISTS {FUZZY_TABLE}")
+    conn.execute(f"DROP TABLE IF EXISTS {FUZZY_META_TABLE}")
+    conn.execute(FUZZY_SCHEMA)
+    conn.execute(FUZZY_META_SCHEMA)
+    conn.executemany(
+        f"INSERT INTO {FUZZY_META_TABLE} (key, value) VALUES (?, ?)",
+        [("max_distance", max_distance), ("prefix_length", prefix_length)]
+    )
+
+    insert = f"INSERT INTO {FUZZY_TABLE} (variant, name_type, name, frequency) VALUES (?, ?, ?, ?)"
+    pending = []
+    indexed = 0
+
+    for name, name_type, frequency in _iter_names(conn):
+        pending.extend(
+            (variant, name_type, name, frequency)
+            for variant in deletes(name[:prefix_length], max_distance)
+        )
+        indexed += 1
+
+        if len(pending) >= _WRITE_BATCH:
+            conn.executemany(insert, pending)
+            pending = []
+            if progress:
+                progress(indexed)
+
+    if pending:
+        conn.executemany(insert, pending)
+    if progress:
+        progress(indexed)
+
+    conn.commit()
+    return indexed
+
+
+class FuzzyIndex:
+    """
+    Nearest known names from the fuzzy_deletes table.
+
+    Args:
+        get_conn: Returns the connection to read from (e.g. ConnectionPool.get)
+    """
+
+    def __init__(self, get_conn: Callable[[], sqlite3.Connection]):
+        self._get_conn = get_conn
+        conn = get_conn()
+        if not has_fuzzy_index(conn):
+            raise ValueError(
+                "Database has no fuzzy index; build it with "
+                "python -m ethnidata.tools.build_fuzzy_index"
+            )
+        meta: Dict[str, int] = dict(conn.execute(f"SELECT key, value FROM {FUZZY_META_TABLE}").fetchall())
+        self.max_distance = meta["max_distance"]
+        self.prefix_length = meta["prefix_length"]
+
+    def lookup(
+        self,
+        name: str,
+        name_type: str,
+        max_distance: Optional[int] = None,
+        limit: int = 5
+    ) -> List[Dict]:
+        """
+        Known names within ``max_distance`` edits of a normalized ``name``
+
+        Returns:
+            Up to ``limit`` dicts ``{'name', 'distance', 'frequency'}``,
+            nearest first, then most frequent, then alphabetical
+        """
+        if max_distance is None:
+            max_distance = self.max_distance
+        elif max_distance > self.max_distance:
+            raise ValueError(f"Index was built for max_distance <= {self.max_distance}")
+
+        # Widen one edit at a time: every name within d edits shares a
+        # variant with d or fewer deletes, so once ``limit`` matches are that
+        # close the remaining (farther) candidates cannot make the cut
+        prefix = name[:self.prefix_length]
+        fetched: Set[str] = set()
+        seen: Set[str] = set()
+        matches = []
+        for level in range(max_distance + 1):
+            variants = sorted(deletes(prefix, level) - fetched)
+            fetched.update(variants)
+            for candidate, frequency in self._candidates(variants, name_type):
+                if candidate in seen:
+                    continue
+                seen.add(candidate)
+                distance = edit_distance(name, candidate, max_distance)
+                if distance <= max_distance:
+                    matches.append({'name': candidate, 'distance': distance, 'frequency': frequency})
+
+            if sum(1 for match in matches if match['distance'] <= level) >= limit:
+                break
+
+        matches.sort(key=lambda m: (m['distance'], -m['frequency'], m['name']))
+        return matches[:limit]
+
+    def _candidates(self, variants: List[str], name_type: str) -> List[Tuple[str, int]]:
+        if not variants:
+            return []
+        placeholders = ",".join("?" * len(variants))
+        return self._get_conn().execute(
+            f"SELECT DISTINCT name, frequency FROM {FUZZY_TABLE} "
+            f"WHERE name_type = ? AND variant IN ({placeholders})",
+            [name_type] + variants
+        ).fetchall()
+
+    def nearest(self, name: str, name_type: str,
+                max_distance: Optional[int] = None) -> Optional[Dict]:
+        """
+        The best lookup() match other than ``name`` itself, or None
+
+        Without ``max_distance`` the edit budget scales with the length of
+        ``name`` (fallback_distance()).
+        """
+        if max_distance is None:
+            max_distance = fallback_distance(name, self.max_distance)
+        if max_distance == 0:
+            return None
+        for match in self.lookup(name, name_type, max_distance, limit=2):
+            if match['name'] != name:
+                return match
+        return None
+
+    def nearest_many(self, names: Iterable[str], name_type: str,
+                     max_distance: Optional[int] = None) -> Dict[str, Dict]:
+        """nearest() for several names; names without a neighbour are left out"""
+        found = {}
+        for name in names:
+            match = self.nearest(name, name_type, max_distance)
+            if match is not None:
+                found[name] = match
+        return found
@@ -0,0 +1,226 @@
+"""
+EthniData instrumentation
+
+Optional per-stage timing for the predictor hot path.  Pass an
+Instrumentation to the predictor and every call records how long each
+stage took:
+
+    predict_*          whole public call (nested calls are recorded too,
+                       e.g. predict_full_name() -> predict_nationality())
+    normalize          name normalization
+    lookup             storage backend reads (also counts ``queries`` and
+                       ``rows`` returned)
+    fuzzy              nearest-name search for unknown names
+    rank               probabilities and country names of the ranked rows
+    corrections        post-ranking correction pipeline (morphology boosts)
+    explain            explanation generation (explain=True)
+
+Each stage keeps a count, a sum and a latency histogram.  Without an
+Instrumentation the predictor skips all of this: the public methods are
+not wrapped and each stage boundary costs a single ``is None`` check.
+
+Usage:
+    instr = Instrumentation()
+    ed = EthniData(instrumentation=instr)
+    ed.predict_nationality("Ahmet")
+
+    ed.stats()                  # stages, counters and result-cache counters
+    print(ed.metrics_text())    # Prometheus text exposition format
+
+    # OpenTelemetry-style hook: forward every measurement
+    instr.add_observer(lambda stage, seconds: histogram.record(seconds, {"stage": stage}))
+
+License: MIT
+"""
+
+import functools
+import threading
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, List, Mapping, Optional, Sequence
+
+# Histogram upper bounds in seconds (+Inf is implicit)
+DEFAULT_BUCKETS = (
+    0.000005, 0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005,
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0,
+)
+
+Observer = Callable[[str, float], None]
+
+
+class _Histogram:
+    __slots__ = ("buckets", "count", "sum", "max")
+
+    def __init__(self, n_bounds: int):
+        self.buckets = [0] * (n_bounds + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+
+class Instrumentation:
+    """
+    Stage timers, counters and observers shared by one or more predictors
+
+    Args:
+        buckets: Ascending histogram upper bounds in seconds
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.bounds = tuple(buckets)
+        if list(self.bounds) != sorted(set(self.bounds)):
+            raise ValueError("buckets must be strictly ascending")
+        self._stages: Dict[str, _Histogram] = {}
+        self._counters: Dict[str, int] = {}
+        self._observers: List[Observer] = []
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def start() -> float:
+        """Clock reading to pass to record()"""
+        return time.perf_counter()
+
+    def record(self, stage: str, started: float) -> None:
+        """Record the time elapsed since ``started`` (from start()) under ``stage``"""
+        self.observe(stage, time.perf_counter() - started)
+
+    def observe(self, stage: str, seconds: float) -> None:
+        """Record a duration in seconds under ``stage``"""
+        with self._lock:
+            histogram = self._stages.get(stage)
+            if histogram is None:
+                histogram = self._stages[stage] = _Histogram(len(self.bounds))
+            histogram.buckets[bisect_left(self.bounds, seconds)] += 1
+            histogram.count += 1
+            histogram.sum += seconds
+            if seconds > histogram.max:
+                histogram.max = seconds
+        for observer in self._observers:
+            observer(stage, seconds)
+
+    def count(self, counter: str, n: int = 1) -> None:
+        """Add ``n`` to ``counter``"""
+        with self._lock:
+            self._counters[counter] = self._counters.get(counter, 0) + n
+
+    def add_observer(self, observer: Observer) -> None:
+        """Call ``observer(stage, seconds)`` for every recorded duration"""
+        self._observers = self._observers + [observer]
+
+    def remove_observer(self, observer: Observer) -> None:
+        self._observers = [o for o in self._observers if o is not observer]
+
+    def reset(self) -> None:
+        """Drop all recorded stages and counters"""
+        with self._lock:
+            self._stages.clear()
+            self._counters.clear()
+
+    def snapshot(self) -> Dict:
+        """
+        Recorded values
+
+        Returns:
+            {
+                'stages': {stage: {'count', 'total_s', 'mean_us', 'max_us',
+                                   'buckets': [(upper bound s, cumulative count), ...]}},
+                'counters': {counter: int}
+            }
+        """
+        with self._lock:
+            stages = {}
+            for stage, histogram in sorted(self._stages.items()):
+                cumulative, buckets = 0, []
+                for bound, n in zip(self.bounds + (float("inf"),), histogram.buckets):
+                    cumulative += n
+                    buckets.append((bound, cumulative))
+                stages[stage] = {
+                    'count': histogram.count,
+                    'total_s': histogram.sum,
+                    'mean_us': histogram.sum / histogram.count * 1e6 if histogram.count else 0.0,
+                    'max_us': histogram.max * 1e6,
+                    'buckets': buckets,
+                }
+            return {'stages': stages, 'counters': dict(sorted(self._counters.items()))}
+
+    def prometheus(self, prefix: str = "ethnidata", counters: Optional[Mapping[str, float]] = None,
+                   gauges: Optional[Mapping[str, float]] = None) -> str:
+        """
+        Prometheus text exposition of the recorded values
+
+        Args:
+            prefix: Metric name prefix
+            counters: Extra monotonic counters to export (``<prefix>_<name>_total``)
+            gauges: Extra gauges to export (``<prefix>_<name>``)
+        """
+        snapshot = self.snapshot()
+        metric = f"{prefix}_stage_seconds"
+        lines = [
+            f"# HELP {metric} Time spent in each predictor stage",
+            f"# TYPE {metric} histogram",
+        ]
+        for stage, values in snapshot['stages'].items():
+            for bound, cumulative in values['buckets']:
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f'{metric}_bucket{{stage="{stage}",le="{le}"}} {cumulative}')
+            lines.append(f'{metric}_sum{{stage="{stage}"}} {values["total_s"]!r}')
+            lines.append(f'{metric}_count{{stage="{stage}"}} {values["count"]}')
+
+        for name, value in {**snapshot['counters'], **(counters or {})}.items():
+            lines += [f"# TYPE {prefix}_{name}_total counter", f"{prefix}_{name}_total {value}"]
+        for name, value in (gauges or {}).items():
+            lines += [f"# TYPE {prefix}_{name} gauge", f"{prefix}_{name} {value}"]
+        return "\n".join(lines) + "\n"
+
+
+def timed(method: Callable, instrumentation: Instrumentation, stage: str) -> Callable:
+    """``method`` wrapped to record each call under ``stage``"""
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        started = instrumentation.start()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            instrumentation.record(stage, started)
+    return wrapper
+
+
+class InstrumentedBackend:
+    """Storage backend proxy timing every read under ``lookup``"""
+
+    def __init__(self, backend, instrumentation: Instrumentation):
+        self._backend = backend
+        self._instrumentation = instrumentation
+
+    def __getattr__(self, attribute):
+        return getattr(self._backend, attribute)
+
+    def __len__(self) -> int:
+        return len(self._backend)
+
+    def _read(self, method: str, rows: Callable, *args):
+        instrumentation = self._instrumentation
+        started = instrumentation.start()
+        result = getattr(self._backend, method)(*args)
+        instrumentation.record("lookup", started)
+        instrumentation.count("queries")
+        instrumentation.count("rows", rows(result))
+        return result
+
+    def distribution(self, name, name_type):
+        return self._read("distribution", lambda dist: 1 if dist.countries else 0, name, name_type)
+
+    def distributions_many(self, names, name_type):
+        return self._read("distributions_many", len, names, name_type)
+
+    def countries(self, name, name_type, top_n):
+        return self._read("countries", len, name, name_type, top_n)
+
+    def countries_many(self, names, name_type, top_n):
+        return self._read("countries_many", lambda found: sum(map(len, found.values())), names, name_type, top_n)
+
+    def counts(self, name, name_type, attribute, top_n=None):
+        return self._read("counts", len, name, name_type, attribute, top_n)
+
+    def genders(self, name):
+        return self._read("genders", len, name)
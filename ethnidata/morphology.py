@@ -7,95 +7,68 @@ Detects cultural/linguistic patterns in names (suffixes, prefixes, etc.)
 License: MIT
 """
 
-from typing import Dict, List, Optional
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
 import re
 
+from .rule_packs import AffixTrie, CompiledPatterns, RulePack, load_rule_pack  # noqa: F401
+
+
+class _FromRulePack:
+    """Class attribute read from the active rule pack (loaded on first access)"""
+
+    def __init__(self, attribute: str):
+        self.attribute = attribute
+
+    def __get__(self, instance, owner):
+        return getattr(owner.rule_pack(), self.attribute)
+
 
 class MorphologyEngine:
     """
     Detects morphological patterns in names (rule-based, no ML required).
     """
 
+    # Active rule pack (see rule_packs and rules/default.json); loaded on
+    # first use so importing the module does not touch the cache directory
+    _rule_pack: Optional[RulePack] = None
+
     # Suffix/Prefix patterns by cultural/linguistic group
-    PATTERNS = {
-        # Slavic patterns
-        "slavic": {
-            "suffixes": ["-ov", "-ova", "-ev", "-eva", "-ski", "-ska", "-sky", "-ic", "-vić", "-vich"],
-            "prefixes": [],
-            "regions": ["Eastern Europe", "Balkans", "Russia"],
-            "countries": ["RUS", "UKR", "POL", "CZE", "SRB", "BIH"]
-        },
-
-        # Turkic patterns
-        "turkic": {
-            "suffixes": ["-oğlu", "-oglu", "-soy", "-gil", "-başı", "-can", "-han", "-bey", "-yilmaz", "-yılmaz", "-demir", "-kaya", "-arslan"],
-            "prefixes": [],
-            "regions": ["Anatolia", "Balkans", "Central Asia"],
-            "countries": ["TUR", "AZE", "KAZ", "UZB", "TKM"],
-            "common_surnames": ["yilmaz", "yılmaz", "demir", "kaya", "arslan", "celik", "çelik", "sahin", "şahin", "yildiz", "yıldız"],
-            "turkish_chars": set("ığşçöü")
-        },
-
-        # Nordic patterns
-        "nordic": {
-            "suffixes": ["-son", "-sen", "-sson", "-dóttir", "-dottir", "-berg", "-ström", "-lund"],
-            "prefixes": [],
-            "regions": ["Scandinavia", "Iceland"],
-            "countries": ["SWE", "NOR", "DNK", "ISL", "FIN"]
-        },
-
-        # Arabic patterns
-        "arabic": {
-            "suffixes": [],
-            "prefixes": ["al-", "el-", "bin", "binti", "ibn", "abu", "abd", "abdul"],
-            "regions": ["Middle East", "North Africa"],
-            "countries": ["SAU", "EGY", "IRQ", "SYR", "JOR", "MAR", "DZA"]
-        },
-
-        # Gaelic/Celtic patterns
-        "gaelic": {
-            "suffixes": [],
-            "prefixes": ["mc", "mac", "o'", "ó"],
-            "regions": ["Ireland", "Scotland"],
-            "countries": ["IRL", "GBR"]
-        },
-
-        # Iberian patterns
-        "iberian": {
-            "suffixes": ["-ez", "-es", "-az", "-is", "-os"],
-            "prefixes": ["de", "del", "da", "dos"],
-            "regions": ["Iberia", "Latin America"],
-            "countries": ["ESP", "PRT", "MEX", "ARG", "BRA"]
-        },
-
-        # Germanic patterns
-        "germanic": {
-            "suffixes": ["-mann", "-schmidt", "-schneider", "-meyer", "-müller", "-bauer"],
-            "prefixes": ["von", "van", "der", "de"],
-            "regions": ["Central Europe", "Netherlands"],
-            "countries": ["DEU", "AUT", "CHE", "NLD", "BEL"]
-        },
-
-        # East Asian patterns
-        "east_asian": {
-            "suffixes": [],
-            "prefixes": [],  # East Asian names typically don't have affixes
-            "regions": ["East Asia"],
-            "countries": ["CHN", "JPN", "KOR", "TWN"],
-            "note": "East Asian names follow different morphological rules",
-            "japanese_common": {"tanaka", "suzuki", "sato", "ito", "watanabe", "yamamoto", "nakamura", "kobayashi", "kato", "yoshida"},
-            "chinese_common": {"zhang", "wang", "li", "chen", "liu", "yang", "huang", "zhao", "wu", "zhou"},
-            "korean_common": {"kim", "lee", "park", "choi", "jung", "kang", "cho", "yoon", "jang", "lim"}
-        },
-
-        # South Asian patterns
-        "south_asian": {
-            "suffixes": ["-kumar", "-singh", "-sharma", "-patel", "-reddy", "-rao"],
-            "prefixes": ["sri", "shri"],
-            "regions": ["South Asia"],
-            "countries": ["IND", "PAK", "BGD", "LKA", "NPL"]
-        }
-    }
+    PATTERNS: Dict[str, Dict] = _FromRulePack("patterns")
+
+    @classmethod
+    def rule_pack(cls) -> RulePack:
+        """The rule pack PATTERNS and the predictor's boosts come from"""
+        pack = cls._rule_pack
+        if pack is None:
+            pack = cls.use_rule_pack()
+        return pack
+
+    @classmethod
+    def use_rule_pack(cls, path: Optional[Path] = None) -> RulePack:
+        """
+        Switch to another rule pack (None restores the bundled default).
+
+        Affects MorphologyEngine and the morphology correction in
+        EthniData.predict_nationality().  Results already held in an
+        EthniData result cache are not recomputed; call clear_cache().
+        """
+        pack = load_rule_pack(path)
+        cls._rule_pack = pack
+        return pack
+
+    @classmethod
+    def compiled_patterns(cls) -> "CompiledPatterns":
+        """PATTERNS compiled into affix tries (the pack's, or built once per subclass overriding PATTERNS)"""
+        pack = cls.rule_pack()
+        patterns = cls.PATTERNS
+        if patterns is pack.patterns:
+            return pack.compiled
+        compiled = cls.__dict__.get("_compiled")
+        if compiled is None:
+            compiled = CompiledPatterns(patterns)
+            cls._compiled = compiled
+        return compiled
 
     @staticmethod
     def normalize_for_pattern(name: str) -> str:
@@ -117,12 +90,12 @@ class MorphologyEngine:
         name_lower = name.lower()
         detected = []
 
+        matcher = cls.compiled_patterns()
+
         # PRIORITY CHECK: Turkish character/surname detection (override Iberian -az)
         turkic_data = cls.PATTERNS.get("turkic", {})
-        turkish_chars = turkic_data.get("turkish_chars", set())
-        common_turkish = turkic_data.get("common_surnames", [])
 
-        if any(c in name_lower for c in turkish_chars) or name_lower in common_turkish:
+        if not matcher.turkish_chars.isdisjoint(name_lower) or name_lower in matcher.common_turkish:
             detected.append({
                 "pattern_type": "turkic",
                 "pattern": "Turkish characters/surname",
@@ -134,12 +107,7 @@ class MorphologyEngine:
             return detected  # Return immediately, Turkish takes priority
 
         # PRIORITY CHECK: East Asian common surnames
-        east_asian_data = cls.PATTERNS.get("east_asian", {})
-        jpn_common = east_asian_data.get("japanese_common", set())
-        chn_common = east_asian_data.get("chinese_common", set())
-        kor_common = east_asian_data.get("korean_common", set())
-
-        if name_lower in jpn_common:
+        if name_lower in matcher.japanese_common:
             detected.append({
                 "pattern_type": "east_asian",
                 "pattern": "Japanese common surname",
@@ -149,7 +117,7 @@ class MorphologyEngine:
                 "confidence": 0.9
             })
             return detected
-        elif name_lower in chn_common:
+        elif name_lower in matcher.chinese_common:
             detected.append({
                 "pattern_type": "east_asian",
                 "pattern": "Chinese common surname",
@@ -159,7 +127,7 @@ class MorphologyEngine:
                 "confidence": 0.9
             })
             return detected
-        elif name_lower in kor_common:
+        elif name_lower in matcher.korean_common:
             detected.append({
                 "pattern_type": "east_asian",
                 "pattern": "Korean common surname",
@@ -171,37 +139,54 @@ class MorphologyEngine:
             return detected
 
         # Standard pattern detection (suffixes/prefixes)
-        for pattern_type, pattern_data in cls.PATTERNS.items():
-            # Check suffixes
-            for suffix in pattern_data.get("suffixes", []):
-                suffix_norm = suffix.lower().replace("-", "")
-                if normalized.endswith(suffix_norm):
-                    detected.append({
-                        "pattern_type": pattern_type,
-                        "pattern": suffix,
-                        "match_type": "suffix",
-                        "regions": pattern_data.get("regions", []),
-                        "likely_countries": pattern_data.get("countries", []),
-                        "confidence": 0.8  # High confidence for suffix match
-                    })
-                    break  # One suffix per type
-
-            # Check prefixes
-            for prefix in pattern_data.get("prefixes", []):
-                prefix_norm = prefix.lower().replace("-", "").replace("'", "")
-                if normalized.startswith(prefix_norm):
-                    detected.append({
-                        "pattern_type": pattern_type,
-                        "pattern": prefix,
-                        "match_type": "prefix",
-                        "regions": pattern_data.get("regions", []),
-                        "likely_countries": pattern_data.get("countries", []),
-                        "confidence": 0.75  # Slightly lower for prefix (more ambiguous)
-                    })
-                    break  # One prefix per type
+        suffix_hits = matcher.suffixes.first_matches(reversed(normalized))
+        prefix_hits = matcher.prefixes.first_matches(normalized)
+
+        for group, (pattern_type, pattern_data) in enumerate(matcher.groups):
+            if group in suffix_hits:
+                detected.append({
+                    "pattern_type": pattern_type,
+                    "pattern": suffix_hits[group][1],
+                    "match_type": "suffix",
+                    "regions": pattern_data.get("regions", []),
+                    "likely_countries": pattern_data.get("countries", []),
+                    "confidence": 0.8  # High confidence for suffix match
+                })
+
+            if group in prefix_hits:
+                detected.append({
+                    "pattern_type": pattern_type,
+                    "pattern": prefix_hits[group][1],
+                    "match_type": "prefix",
+                    "regions": pattern_data.get("regions", []),
+                    "likely_countries": pattern_data.get("countries", []),
+                    "confidence": 0.75  # Slightly lower for prefix (more ambiguous)
+                })
 
         return detected
 
+    @classmethod
+    def detect_patterns_batch(cls, names: Iterable[str]) -> List[List[Dict[str, any]]]:
+        """
+        detect_patterns() for a list of names.
+
+        Each distinct name is analyzed once; repeated names get their own
+        copies of the result.
+
+        Returns:
+            One list of detected patterns per input name, in input order
+        """
+        seen: Dict[str, List[Dict[str, any]]] = {}
+        results = []
+        for name in names:
+            patterns = seen.get(name)
+            if patterns is None:
+                patterns = seen[name] = cls.detect_patterns(name)
+                results.append(patterns)
+            else:
+                results.append([dict(p) for p in patterns])
+        return results
+
     @classmethod
     def get_morphological_signal(cls, name: str, name_type: str = "last") -> Optional[Dict[str, any]]:
         """
@@ -0,0 +1,181 @@
+"""
+EthniData precomputed name statistics
+
+Materializes the ``name_stats`` table: one row per (name, name_type) with
+the country, region, language, religion and gender distributions already
+aggregated, so the predictor can answer with a single indexed point read
+instead of a GROUP BY over the raw ``names`` rows.
+
+Build it once after creating a database:
+
+    python scripts/30_build_name_stats.py path/to/ethnidata.db
+
+The build records the largest ``names`` rowid next to the table.  Readers
+check it with name_stats_is_current() and fall back to the raw table once
+rows have been added or removed since; scripts that update rows in place
+drop the derived tables (see db_metadata.invalidate_derived_tables).
+
+License: MIT
+"""
+
+import json
+import sqlite3
+from typing import Callable, Iterator, Optional, Tuple
+
+from .connection import has_table
+from .distributions import DistributionBuilder, NameDistribution
+
+NAME_STATS_TABLE = "name_stats"
+
+NAME_STATS_SCHEMA = f"""
+    CREATE TABLE {NAME_STATS_TABLE} (
+        name TEXT NOT NULL,
+        name_type TEXT NOT NULL,
+        total INTEGER NOT NULL,
+        countries TEXT NOT NULL,
+        regions TEXT NOT NULL,
+        languages TEXT NOT NULL,
+        religions TEXT NOT NULL,
+        genders TEXT NOT NULL,
+        PRIMARY KEY (name, name_type)
+    ) WITHOUT ROWID
+"""
+
+NAME_STATS_COLUMNS = "countries, regions, languages, religions, genders"
+
+# Watermark of the names table at build time (single row)
+NAME_STATS_SOURCE_TABLE = "name_stats_source"
+
+_SOURCE_QUERY = """
+    SELECT name, name_type, country_code, region, language, religion, gender, COUNT(*)
+    FROM names
+    WHERE name IS NOT NULL AND name_type IS NOT NULL
+    GROUP BY name, name_type, country_code, region, language, religion, gender
+    ORDER BY name, name_type
+"""
+
+# Rows written per executemany() call while building
+_WRITE_BATCH = 10000
+
+
+def has_name_stats(conn: sqlite3.Connection) -> bool:
+    """Return True if the database contains a name_stats table"""
+    return has_table(conn, NAME_STATS_TABLE)
+
+
+def names_watermark(conn: sqlite3.Connection) -> int:
+    """Largest rowid of the names table (0 when empty); an indexed read"""
+    return conn.execute("SELECT COALESCE(MAX(rowid), 0) FROM names").fetchone()[0]
+
+
+def name_stats_is_current(conn: sqlite3.Connection) -> bool:
+    """
+    True if name_stats exists and names has not grown or shrunk since it
+    was built.  Tables built before the watermark was recorded are trusted.
+    """
+    if not has_name_stats(conn):
+        return False
+    if not has_table(conn, NAME_STATS_SOURCE_TABLE):
+        return True
+    row = conn.execute(f"SELECT names_max_rowid FROM {NAME_STATS_SOURCE_TABLE}").fetchone()
+    return row is not None and row[0] == names_watermark(conn)
+
+
+def encode_distribution(distribution: NameDistribution) -> tuple:
+    """Serialize a distribution into name_stats column values"""
+    return (
+        distribution.total,
+        json.dumps(distribution.countries, separators=(",", ":")),
+        json.dumps(distribution.regions, separators=(",", ":")),
+        json.dumps(distribution.languages, separators=(",", ":")),
+        json.dumps(distribution.religions, separators=(",", ":")),
+        json.dumps(distribution.genders, separators=(",", ":")),
+    )
+
+
+def decode_distribution(countries: str, regions: str, languages: str,
+                        religions: str, genders: str) -> NameDistribution:
+    """Inverse of encode_distribution() (without the total column)"""
+    return NameDistribution(
+        countries=tuple(tuple(row) for row in json.loads(countries)),
+        regions=tuple(tuple(row) for row in json.loads(regions)),
+        languages=tuple(tuple(row) for row in json.loads(languages)),
+        religions=tuple(tuple(row) for row in json.loads(religions)),
+        genders=tuple(tuple(row) for row in json.loads(genders)),
+    )
+
+
+def iter_distributions(conn: sqlite3.Connection) -> Iterator[Tuple[str, str, NameDistribution]]:
+    """
+    Stream (name, name_type, NameDistribution) for every key of the raw
+    names table, ordered by name then name_type.
+    """
+    current_key = None
+    builder = DistributionBuilder()
+
+    for name, name_type, country_code, region, language, religion, gender, count in conn.execute(_SOURCE_QUERY):
+        key = (name, name_type)
+        if key != current_key:
+            if current_key is not None:
+                yield current_key + (builder.build(),)
+            current_key = key
+            builder = DistributionBuilder()
+        builder.add(country_code, region, language, religion, gender, count)
+
+    if current_key is not None:
+        yield current_key + (builder.build(),)
+
+
+def iter_name_stats(conn: sqlite3.Connection) -> Iterator[Tuple[str, str, NameDistribution]]:
+    """Stream (name, name_type, NameDistribution) from an existing name_stats table"""
+    query = f"SELECT name, name_type, {NAME_STATS_COLUMNS} FROM {NAME_STATS_TABLE}"
+    for name, name_type, *columns in conn.execute(query):
+        yield name, name_type, decode_distribution(*columns)
+
+
+def build_name_stats(
+    conn: sqlite3.Connection,
+    progress: Optional[Callable[[int], None]] = None
+) -> int:
+    """
+    (Re)create the name_stats table from the raw names table.
+
+    Args:
+        conn: Writable connection to an EthniData database
+        progress: Optional callback receiving the number of keys written so far
+
+    Returns:
+        Number of (name, name_type) keys written
+    """
+    conn.execute(f"DROP TABLE IF EXISTS {NAME_STATS_TABLE}")
+    conn.execute(NAME_STATS_SCHEMA)
+    conn.execute(f"DROP TABLE IF EXISTS {NAME_STATS_SOURCE_TABLE}")
+    conn.execute(f"CREATE TABLE {NAME_STATS_SOURCE_TABLE} (names_max_rowid INTEGER NOT NULL)")
+    conn.execute(f"INSERT INTO {NAME_STATS_SOURCE_TABLE} VALUES (?)", (names_watermark(conn),))
+
+    insert = (
+        f"INSERT INTO {NAME_STATS_TABLE} "
+        f"(name, name_type, total, {NAME_STATS_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+    )
+
+    pending = []
+    written = 0
+
+    for name, name_type, distribution in iter_distributions(conn):
+        pending.append((name, name_type) + encode_distribution(distribution))
+
+        if len(pending) >= _WRITE_BATCH:
+            conn.executemany(insert, pending)
+            written += len(pending)
+            pending = []
+            if progress:
+                progress(written)
+
+    if pending:
+        conn.executemany(insert, pending)
+        written += len(pending)
+        if progress:
+            progress(written)
+
+    conn.commit()
+    return written
@@ -0,0 +1,52 @@
+"""
+EthniData name normalization
+
+Every lookup key is ``unidecode(name.strip().lower())``.  Transliteration
+is the expensive part, and most names are plain ASCII already, where
+unidecode is the identity: those skip it entirely.  Non-ASCII names go
+through a bounded memo, so repeated names ("Müller", "Yılmaz") are
+transliterated once.
+
+Usage:
+    normalize_name("  José ")                 # 'jose'
+    normalize_many(["Ahmet", "Öztürk"])       # ['ahmet', 'ozturk']
+
+License: MIT
+"""
+
+from functools import lru_cache
+from typing import Dict, Iterable, List
+
+from unidecode import unidecode
+
+# Distinct non-ASCII names whose transliteration is memoized
+NORMALIZE_CACHE_SIZE = 65536
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def _transliterate(name: str) -> str:
+    return unidecode(name)
+
+
+def normalize_name(name: str) -> str:
+    """Normalize name (lowercase, remove accents)"""
+    name = name.strip().lower()
+    if name.isascii():
+        return name
+    return _transliterate(name)
+
+
+def normalize_many(names: Iterable[str]) -> List[str]:
+    """normalize_name() for many names; each distinct name is normalized once"""
+    names = list(names)
+    normalized: Dict[str, str] = {name: normalize_name(name) for name in dict.fromkeys(names)}
+    return [normalized[name] for name in names]
+
+
+def cache_info():
+    """Hit/miss statistics of the transliteration memo"""
+    return _transliterate.cache_info()
+
+
+def clear_cache() -> None:
+    _transliterate.cache_clear()
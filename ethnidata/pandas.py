@@ -0,0 +1,217 @@
+"""
+EthniData pandas / Arrow integration
+
+Importing this module registers a ``DataFrame.ethnidata`` accessor:
+
+    import ethnidata.pandas  # noqa: F401
+
+    people = df.ethnidata.predict(first="first", last="last")
+    df = df.join(people)
+
+Instead of one predict_full_name() call per row, each column is factorized,
+the distinct names are resolved in bulk (predict_nationality_batch, i.e.
+chunked ``IN (...)`` lookups against the aggregated distributions) and the
+0.4 / 0.6 first/last score combination runs in NumPy over the distinct
+(first, last) pairs.  Results are broadcast back to every row as typed
+columns:
+
+    country, country_name, region, language   string (missing: <NA>)
+    confidence                                float64
+
+They match predict_full_name() (or predict_nationality() in single-name
+mode) for the same names, including ties and morphology corrections.
+Rows with a missing name get missing values and confidence 0.0.
+
+Requires pandas and numpy (``pip install ethnidata[pandas]``);
+predict_table() additionally needs pyarrow.
+
+License: MIT
+"""
+
+from typing import List, Literal, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+    import pandas as pd
+except ImportError:
+    raise ImportError("ethnidata.pandas requires pandas and numpy: pip install ethnidata[pandas]") from None
+
+from .countries import country_name
+from .predictor import EthniData
+from .vectorized import CountryIndex, TopCountrySlots, rank_pairs
+
+RESULT_COLUMNS = ("country", "country_name", "region", "language", "confidence")
+
+# Distinct (first, last) pairs combined per NumPy block
+PAIR_BLOCK_SIZE = 65536
+
+_default_predictor: Optional[EthniData] = None
+
+
+def _predictor(predictor: Optional[EthniData]) -> EthniData:
+    global _default_predictor
+    if predictor is not None:
+        return predictor
+    if _default_predictor is None:
+        _default_predictor = EthniData()
+    return _default_predictor
+
+
+def _factorize(values) -> Tuple[np.ndarray, List[str]]:
+    """Codes per row (-1 for missing) and the distinct names as str"""
+    codes, uniques = pd.factorize(pd.Series(values, dtype=object), sort=False)
+    return codes, [str(value) for value in uniques]
+
+
+def _columns(index, codes: np.ndarray, country: List, region: List,
+             language: List, confidence: List) -> pd.DataFrame:
+    """Broadcast per-distinct results to rows; code -1 -> missing"""
+    def strings(values):
+        table = np.array(list(values) + [None], dtype=object)
+        return pd.array(table[codes], dtype="string")
+
+    names = [country_name(code) if code is not None else None for code in country]
+    return pd.DataFrame({
+        'country': strings(country),
+        'country_name': strings(names),
+        'region': strings(region),
+        'language': strings(language),
+        'confidence': np.append(np.asarray(confidence, dtype=np.float64), 0.0)[codes],
+    }, index=index)
+
+
+def _predict_full_names(ed: EthniData, first_values, last_values, index, top_n: int) -> pd.DataFrame:
+    first_codes, first_names = _factorize(first_values)
+    last_codes, last_names = _factorize(last_values)
+
+    countries = CountryIndex(())
+    first = TopCountrySlots([pred['top_countries'] for pred in
+                             ed.predict_nationality_batch(first_names, "first", top_n=top_n)], countries, False)
+    last = TopCountrySlots([pred['top_countries'] for pred in
+                            ed.predict_nationality_batch(last_names, "last", top_n=top_n)], countries, True)
+    codes_by_id = np.array(countries.codes, dtype=object)
+
+    # Distinct (first, last) pairs among rows where both names are present
+    present = (first_codes >= 0) & (last_codes >= 0)
+    stride = max(len(last_names), 1)
+    pair_codes = np.full(len(first_codes), -1, dtype=np.int64)
+    pair_codes[present], pair_keys = pd.factorize(
+        first_codes[present].astype(np.int64) * stride + last_codes[present], sort=False
+    )
+    fi, li = pair_keys // stride, pair_keys % stride
+
+    country = np.full(len(pair_keys), None, dtype=object)
+    region = np.full(len(pair_keys), None, dtype=object)
+    language = np.full(len(pair_keys), None, dtype=object)
+    scores = np.zeros(len(pair_keys), dtype=np.float64)
+    for start in range(0, len(pair_keys), PAIR_BLOCK_SIZE):
+        block = slice(start, start + PAIR_BLOCK_SIZE)
+        pair, ids, best, best_region, best_language = rank_pairs(first, last, fi[block], li[block], 1)
+        pair = pair + start
+        country[pair] = codes_by_id[ids]
+        region[pair] = best_region
+        language[pair] = best_language
+        scores[pair] = best
+
+    # Python's round() (correctly rounded), as in predict_full_name()
+    confidence = [round(score, 4) for score in scores.tolist()]
+
+    return _columns(index, pair_codes, country, region, language, confidence)
+
+
+def _predict_names(ed: EthniData, values, index, name_type: str, top_n: int) -> pd.DataFrame:
+    codes, names = _factorize(values)
+    preds = ed.predict_nationality_batch(names, name_type, top_n=top_n)
+    return _columns(
+        index, codes,
+        [pred['country'] for pred in preds],
+        [pred['region'] for pred in preds],
+        [pred['language'] for pred in preds],
+        [pred['confidence'] for pred in preds],
+    )
+
+
+def predict_frame(
+    df: pd.DataFrame,
+    first: Optional[str] = None,
+    last: Optional[str] = None,
+    name: Optional[str] = None,
+    name_type: Literal["first", "last"] = "first",
+    predictor: Optional[EthniData] = None,
+    top_n: int = 5,
+    prefix: str = ""
+) -> pd.DataFrame:
+    """
+    Vectorized predictions for a DataFrame
+
+    Args:
+        df: Input frame
+        first, last: Name columns for full-name predictions
+            (same result as predict_full_name(first, last, top_n))
+        name: Single name column, predicted as ``name_type``
+            (same result as predict_nationality(name, name_type, top_n))
+        predictor: EthniData to use (default: a shared EthniData())
+        top_n: Countries considered per name
+        prefix: Prepended to the result column names
+
+    Returns:
+        DataFrame with RESULT_COLUMNS, indexed like ``df``
+    """
+    if name is not None:
+        if first is not None or last is not None:
+            raise ValueError("Pass either name= or first=/last=, not both")
+        result = _predict_names(_predictor(predictor), df[name], df.index, name_type, top_n)
+    elif first is not None and last is not None:
+        result = _predict_full_names(_predictor(predictor), df[first], df[last], df.index, top_n)
+    else:
+        raise ValueError("Pass first= and last= columns, or a single name= column")
+
+    if prefix:
+        result = result.add_prefix(prefix)
+    return result
+
+
+def predict_table(
+    table,
+    first: Optional[str] = None,
+    last: Optional[str] = None,
+    name: Optional[str] = None,
+    name_type: Literal["first", "last"] = "first",
+    predictor: Optional[EthniData] = None,
+    top_n: int = 5,
+    prefix: str = ""
+):
+    """
+    predict_frame() for a pyarrow Table; returns the input with result
+    columns appended
+    """
+    import pyarrow as pa
+
+    columns: Sequence[str] = [c for c in (first, last, name) if c is not None]
+    df = pd.DataFrame({column: table.column(column).to_pandas() for column in columns})
+    result = predict_frame(df, first=first, last=last, name=name, name_type=name_type,
+                           predictor=predictor, top_n=top_n, prefix=prefix)
+    for column in result.columns:
+        table = table.append_column(column, pa.Array.from_pandas(result[column]))
+    return table
+
+
+@pd.api.extensions.register_dataframe_accessor("ethnidata")
+class EthniDataAccessor:
+    """``df.ethnidata.predict(...)``; see predict_frame()"""
+
+    def __init__(self, df: pd.DataFrame):
+        self._df = df
+
+    def predict(
+        self,
+        first: Optional[str] = None,
+        last: Optional[str] = None,
+        name: Optional[str] = None,
+        name_type: Literal["first", "last"] = "first",
+        predictor: Optional[EthniData] = None,
+        top_n: int = 5,
+        prefix: str = ""
+    ) -> pd.DataFrame:
+        return predict_frame(self._df, first=first, last=last, name=name, name_type=name_type,
+                             predictor=predictor, top_n=top_n, prefix=prefix)
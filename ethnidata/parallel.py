@@ -0,0 +1,139 @@
+"""
+EthniData multi-process prediction
+
+ParallelPredictor shards batch predictions across a process pool.  Every
+worker opens the database read-only once (in the pool initializer) and
+keeps its own EthniData for the lifetime of the pool; results are
+reassembled in input order.
+
+Usage:
+    with ParallelPredictor(n_workers=8) as pp:
+        results = pp.predict_full_name_batch(pairs)
+
+With backend="snapshot" all workers share one memory-mapped copy of the
+data through the OS page cache; backend="memory" loads a full copy per
+worker.
+
+License: MIT
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Hashable, Iterable, List, Literal, Optional, Sequence, Tuple
+
+from .cache import copy_result
+from .predictor import EthniData
+
+# Names per task sent to a worker
+DEFAULT_CHUNK_SIZE = 2000
+
+_worker: Optional[EthniData] = None
+
+
+def _init_worker(options: Dict[str, Any]) -> None:
+    global _worker
+    _worker = EthniData(pooled=True, **options)
+
+
+def _run(method: str, items: List, args: Tuple) -> List[Dict]:
+    return getattr(_worker, method)(items, *args)
+
+
+class ParallelPredictor:
+    """Batch predictions on a pool of worker processes"""
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        use_v3: bool = False,
+        n_workers: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        cache_size: int = 0,
+        backend: Literal["sqlite", "memory", "snapshot"] = "sqlite",
+        snapshot_path: Optional[str] = None,
+        immutable: bool = False,
+        mp_context=None
+    ):
+        """
+        Args:
+            db_path, use_v3, cache_size, backend, snapshot_path, immutable:
+                Passed to each worker's EthniData (always pooled, read-only)
+            n_workers: Worker processes (default: os.cpu_count())
+            chunk_size: Names per task; smaller chunks balance better,
+                larger ones cost less inter-process traffic
+            mp_context: multiprocessing context (e.g. get_context("spawn"))
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        self.n_workers = n_workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        options = {
+            'db_path': db_path,
+            'use_v3': use_v3,
+            'cache_size': cache_size,
+            'backend': backend,
+            'snapshot_path': snapshot_path,
+            'immutable': immutable,
+        }
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.n_workers,
+            mp_context=mp_context,
+            initializer=_init_worker,
+            initargs=(options,)
+        )
+
+    def _map(self, method: str, items: Sequence[Hashable], *args) -> List[Dict]:
+        """Run ``method`` over the distinct items in chunks; return results in input order"""
+        unique = list(dict.fromkeys(items))
+        chunks = [unique[i:i + self.chunk_size] for i in range(0, len(unique), self.chunk_size)]
+
+        by_item: Dict[Hashable, Dict] = {}
+        for chunk, results in zip(chunks, self._executor.map(_run, [method] * len(chunks), chunks,
+                                                             [args] * len(chunks))):
+            by_item.update(zip(chunk, results))
+
+        seen = set()
+        ordered = []
+        for item in items:
+            result = by_item[item]
+            # Repeated items get their own copies, like the single-process batch APIs
+            ordered.append(copy_result(result) if item in seen else result)
+            seen.add(item)
+        return ordered
+
+    def predict_nationality_batch(
+        self,
+        names: Iterable[str],
+        name_type: Literal["first", "last"] = "first",
+        top_n: int = 5,
+        explain: bool = False
+    ) -> List[Dict]:
+        """EthniData.predict_nationality_batch() across the worker pool"""
+        return self._map('predict_nationality_batch', list(names), name_type, top_n, explain)
+
+    def predict_full_name_batch(
+        self,
+        names: Iterable[Tuple[str, str]],
+        top_n: int = 5,
+        explain: bool = False
+    ) -> List[Dict]:
+        """EthniData.predict_full_name_batch() across the worker pool"""
+        return self._map('predict_full_name_batch', [tuple(pair) for pair in names], top_n, explain)
+
+    def predict_all_batch(
+        self,
+        names: Iterable[str],
+        name_type: Literal["first", "last"] = "first"
+    ) -> List[Dict]:
+        """EthniData.predict_all_batch() across the worker pool"""
+        return self._map('predict_all_batch', list(names), name_type)
+
+    def close(self) -> None:
+        """Shut down the worker processes"""
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> "ParallelPredictor":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
@@ -10,20 +10,62 @@ Yeni özellikler:
 - Confidence breakdown (Güven skoru ayrıştırması)
 """
 
+import math
 import sqlite3
+import threading
 from pathlib import Path
-from typing import Dict, Optional, Literal
-from unidecode import unidecode
-import pycountry
+from typing import Callable, Dict, Iterable, List, Literal, Optional, Tuple
 
 # v4.0.0 new modules
 from .explainability import ExplainabilityEngine
 from .morphology import MorphologyEngine
+from .backends import MemoryBackend, NameStatsBackend, SnapshotBackend, SQLiteBackend
+from .cache import CacheInfo, LRUCache, copy_result
+from .connection import ConnectionPool
+from .corrections import Correction, CorrectionPipeline, Ranking
+from .countries import country_name
+from .db_metadata import database_stats
+from .distributions import EMPTY_DISTRIBUTION, NameDistribution
+from .fuzzy import FuzzyIndex
+from .instrumentation import InstrumentedBackend, Instrumentation, timed
+from .name_stats import name_stats_is_current
+from .normalize import normalize_many, normalize_name
+from .prefix_search import PrefixIndex, load_vocabulary
+from .snapshot import default_snapshot_path
+
+# predict_full_name_batch() switches to NumPy scoring from this many pairs
+VECTORIZE_MIN_PAIRS = 256
+
+# Public methods timed as a stage of their own when instrumentation is on
+TIMED_METHODS = (
+    "predict_nationality", "predict_nationality_batch", "predict_full_name", "predict_full_name_batch",
+    "predict_gender", "predict_region", "predict_language", "predict_religion", "predict_all",
+    "predict_all_batch", "search_prefix", "fuzzy_lookup",
+)
+
+
+def _vectorized():
+    """ethnidata.vectorized if NumPy is installed, else None; NumPy is imported on first use"""
+    from . import vectorized
+    return vectorized if vectorized.HAS_NUMPY else None
+
 
 class EthniData:
     """Ethnicity, Nationality, Gender, Region and Language predictor"""
 
-    def __init__(self, db_path: Optional[str] = None, use_v3: bool = False):
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        use_v3: bool = False,
+        cache_size: int = 0,
+        pooled: bool = False,
+        immutable: bool = False,
+        backend: Literal["sqlite", "memory", "snapshot"] = "sqlite",
+        snapshot_path: Optional[str] = None,
+        corrections: Optional[Iterable[Correction]] = None,
+        fuzzy: bool = False,
+        instrumentation: Optional[Instrumentation] = None
+    ):
         """
         Initialize EthniData predictor
 
@@ -31,6 +73,33 @@ class EthniData:
             db_path: Path to SQLite database. If None, uses default location.
             use_v3: If True, attempts to use v3.0.0 database (5.8M records).
                    If False, uses v2.0.0 database (415K records, included in package).
+            cache_size: Maximum number of predictions kept in an in-process LRU
+                   cache (0 disables caching). Cached names skip the database.
+            pooled: If True, every thread gets its own read-only connection
+                   (``mode=ro``), so one instance can be shared across threads.
+            immutable: With pooled=True, also open connections with
+                   ``immutable=1`` (skips locking; only for files nobody writes).
+            backend: "sqlite" queries the file per call; "memory" loads every
+                   name's distributions into dictionaries at startup;
+                   "snapshot" memory-maps a binary snapshot exported with
+                   ``python -m ethnidata.tools.export_snapshot``.
+            snapshot_path: Snapshot file for backend="snapshot"
+                   (default: db_path with a ``.snap`` suffix).
+            corrections: Post-ranking correction stages for predict_nationality()
+                   (default: the built-in Turkish/Japanese/Chinese boosts;
+                   ``[]`` disables them). See ``ethnidata.corrections``.
+            fuzzy: If True, predict_nationality() and predict_all() (and
+                   their batch variants) fall back to the nearest known name
+                   (within the index's edit distance) for names with no
+                   rows and report it under ``fuzzy_match``. Needs
+                   ``python -m ethnidata.tools.build_fuzzy_index``.
+            instrumentation: Records per-stage timings, backend query and
+                   row counts (see ``ethnidata.instrumentation``, stats()
+                   and metrics_text()). None (default) adds no overhead.
+
+        Databases that contain a precomputed ``name_stats`` table (see
+        scripts/30_build_name_stats.py) are served from it automatically,
+        unless rows were added to or removed from ``names`` after it was built.
         """
         if db_path is None:
             package_dir = Path(__file__).parent
@@ -57,18 +126,114 @@ class EthniData:
                 f"Please reinstall: pip install --upgrade --force-reinstall ethnidata"
             )
 
-        self.conn = sqlite3.connect(self.db_path)
-        self.conn.row_factory = sqlite3.Row
+        self._pool = ConnectionPool(self.db_path, per_thread=pooled, immutable=immutable)
+
+        if backend == "memory":
+            self._backend = MemoryBackend.load(self.conn)
+        elif backend == "snapshot":
+            self._backend = SnapshotBackend(snapshot_path or default_snapshot_path(self.db_path))
+        elif backend != "sqlite":
+            raise ValueError(f"Unknown backend: {backend}. Available: ['sqlite', 'memory', 'snapshot']")
+        # Prefer the precomputed name_stats table while it matches the names rows
+        elif name_stats_is_current(self.conn):
+            self._backend = NameStatsBackend(self._pool)
+        else:
+            self._backend = SQLiteBackend(self._pool)
+
+        self.instrumentation = instrumentation
+        if instrumentation is not None:
+            self._backend = InstrumentedBackend(self._backend, instrumentation)
+            for method in TIMED_METHODS:
+                setattr(self, method, timed(getattr(self, method), instrumentation, method))
+
+        self.corrections = CorrectionPipeline(corrections)
+        self._cache = LRUCache(cache_size) if cache_size > 0 else None
+        self.fuzzy = fuzzy
+        self._fuzzy_index = FuzzyIndex(self._pool.get) if fuzzy else None
+        self._prefix_indexes: Dict[str, PrefixIndex] = {}
+        self._prefix_lock = threading.Lock()
+
+    @property
+    def backend(self) -> str:
+        """Name of the active storage backend ('sqlite', 'name_stats', 'memory' or 'snapshot')"""
+        return self._backend.name
+
+    @property
+    def data_path(self) -> Path:
+        """File the backend reads at prediction time (the snapshot for backend="snapshot")"""
+        reader = getattr(self._backend, "reader", None)
+        return reader.path if reader is not None else self.db_path
+
+    def cache_info(self) -> CacheInfo:
+        """Return (hits, misses, evictions, maxsize, currsize) of the result cache"""
+        if self._cache is None:
+            return CacheInfo(0, 0, 0, 0, 0)
+        return self._cache.info()
+
+    def clear_cache(self) -> None:
+        """Empty the result cache and reset its counters"""
+        if self._cache is not None:
+            self._cache.clear()
+
+    def stats(self) -> Dict:
+        """
+        Instrumentation snapshot plus result-cache counters
+
+        Returns:
+            {'stages': {...}, 'counters': {...}, 'cache': {hits, misses, ...}};
+            stages and counters are empty without instrumentation
+        """
+        stats = self.instrumentation.snapshot() if self.instrumentation is not None else {'stages': {}, 'counters': {}}
+        stats['cache'] = self.cache_info()._asdict()
+        return stats
+
+    def metrics_text(self, prefix: str = "ethnidata") -> str:
+        """stats() in the Prometheus text exposition format"""
+        instrumentation = self.instrumentation if self.instrumentation is not None else Instrumentation()
+        info = self.cache_info()
+        return instrumentation.prometheus(
+            prefix,
+            counters={'cache_hits': info.hits, 'cache_misses': info.misses, 'cache_evictions': info.evictions},
+            gauges={'cache_size': info.currsize, 'cache_maxsize': info.maxsize}
+        )
+
+    def _cached(self, key: Tuple, compute: Callable[[], Dict]) -> Dict:
+        """Return a copy of the cached result for ``key``, computing it on a miss"""
+        if self._cache is None:
+            return compute()
+
+        found, value = self._cache.get(key)
+        if not found:
+            value = compute()
+            self._cache.put(key, value)
+        return copy_result(value)
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Database connection for the calling thread"""
+        return self._pool.get()
+
+    def close(self) -> None:
+        """Close all database connections (and snapshot mappings) held by this predictor"""
+        if hasattr(self, '_backend'):
+            self._backend.close()
+        if hasattr(self, '_pool'):
+            self._pool.close()
+
+    def __enter__(self) -> "EthniData":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
 
     def __del__(self):
-        """Close database connection"""
-        if hasattr(self, 'conn'):
-            self.conn.close()
+        """Close database connections if close() was never called"""
+        self.close()
 
     @staticmethod
     def normalize_name(name: str) -> str:
         """Normalize name (lowercase, remove accents)"""
-        return unidecode(name.strip().lower())
+        return normalize_name(name)
 
     def predict_nationality(
         self,
@@ -104,21 +269,203 @@ class EthniData:
             }
         """
 
-        normalized = self.normalize_name(name)
+        # Keyed on the lower-cased input rather than the normalized name:
+        # morphology boosts and explanations look at diacritics (Yılmaz vs Yilmaz)
+        return self._cached(
+            ('nationality', name.lower(), name_type, top_n, explain),
+            lambda: self._predict_nationality(name, name_type, top_n, explain)
+        )
 
-        query = """
-            SELECT country_code, region, language, COUNT(*) as frequency
-            FROM names
-            WHERE name = ? AND name_type = ?
-            GROUP BY country_code, region, language
-            ORDER BY frequency DESC
-            LIMIT ?
+    def _predict_nationality(self, name: str, name_type: str, top_n: int, explain: bool) -> Dict:
+        normalized = self._normalize(name)
+        return self._nationality_result(
+            name, normalized, name_type, *self._country_rows(normalized, name_type, top_n), explain
+        )
+
+    def _clock(self) -> Optional[float]:
+        """Start of a stage for _record(), None without instrumentation"""
+        instrumentation = self.instrumentation
+        return None if instrumentation is None else instrumentation.start()
+
+    def _record(self, stage: str, started: Optional[float]) -> None:
+        """Record ``stage`` as running since ``started`` (from _clock())"""
+        if started is not None:
+            self.instrumentation.record(stage, started)
+
+    def _normalize(self, name: str) -> str:
+        started = self._clock()
+        normalized = normalize_name(name)
+        self._record("normalize", started)
+        return normalized
+
+    def _normalize_many(self, names: List[str]) -> Dict[str, str]:
+        """{name: normalized} for distinct ``names``"""
+        started = self._clock()
+        normalized = dict(zip(names, normalize_many(names)))
+        self._record("normalize", started)
+        return normalized
+
+    def _country_rows(self, normalized: str, name_type: str, top_n: int) -> Tuple[List[Tuple], Optional[Dict]]:
+        """Country rows for a name, or for its nearest known name when fuzzy lookups are on"""
+        rows = self._backend.countries(normalized, name_type, top_n)
+        if rows or not self.fuzzy:
+            return rows, None
+        match = self._nearest_many([normalized], name_type).get(normalized)
+        if match is None:
+            return rows, None
+        return self._backend.countries(match['name'], name_type, top_n), match
+
+    def _distribution(self, normalized: str, name_type: str) -> Tuple[NameDistribution, Optional[Dict]]:
+        """_country_rows() for the full distribution behind predict_all()"""
+        dist = self._backend.distribution(normalized, name_type)
+        if dist.countries or not self.fuzzy:
+            return dist, None
+        match = self._nearest_many([normalized], name_type).get(normalized)
+        if match is None:
+            return dist, None
+        return self._backend.distribution(match['name'], name_type), match
+
+    def _nearest_many(self, unknown: Iterable[str], name_type: str) -> Dict[str, Dict]:
+        """{normalized: nearest known name} for names without rows"""
+        started = self._clock()
+        neighbours = self._fuzzy_index.nearest_many(unknown, name_type)
+        self._record("fuzzy", started)
+        return neighbours
+
+    def fuzzy_lookup(
+        self,
+        name: str,
+        name_type: Literal["first", "last"] = "first",
+        max_distance: Optional[int] = None,
+        limit: int = 5
+    ) -> List[Dict]:
+        """
+        Known names within ``max_distance`` edits of ``name``
+
+        Needs the fuzzy index (``python -m ethnidata.tools.build_fuzzy_index``).
+
+        Returns:
+            Up to ``limit`` dicts ``{'name', 'distance', 'frequency'}``,
+            nearest and most frequent first
         """
+        if self._fuzzy_index is None:
+            self._fuzzy_index = FuzzyIndex(self._pool.get)
+        return self._fuzzy_index.lookup(self.normalize_name(name), name_type, max_distance, limit)
 
-        cursor = self.conn.cursor()
-        cursor.execute(query, (normalized, name_type, top_n))
-        results = cursor.fetchall()
+    def search_prefix(
+        self,
+        prefix: str,
+        name_type: Literal["first", "last"] = "first",
+        limit: int = 10
+    ) -> List[Dict]:
+        """
+        Known names starting with ``prefix``, for type-ahead
+
+        The first call per name type loads a sorted index of the distinct
+        names (see ethnidata.prefix_search); later calls do not query the
+        database.
 
+        Returns:
+            Up to ``limit`` dicts ``{'name', 'frequency'}``, most frequent first
+        """
+        index = self._prefix_indexes.get(name_type)
+        if index is None:
+            with self._prefix_lock:
+                index = self._prefix_indexes.get(name_type)
+                if index is None:
+                    index = self._prefix_indexes[name_type] = PrefixIndex(load_vocabulary(self.conn, name_type))
+        return index.search(self.normalize_name(prefix), limit)
+
+    def predict_nationality_batch(
+        self,
+        names: Iterable[str],
+        name_type: Literal["first", "last"] = "first",
+        top_n: int = 5,
+        explain: bool = False
+    ) -> List[Dict]:
+        """
+        Predict nationality for many names with chunked SQL lookups
+
+        Each distinct name is normalized once and resolved through
+        ``IN (...)`` queries of at most ``backends.BATCH_CHUNK_SIZE`` names.
+
+        Args:
+            names: Iterable of first or last names
+            name_type: "first" or "last"
+            top_n: Number of top predictions per name
+            explain: If True, includes explainability layer
+
+        Returns:
+            List of results in input order, each shaped exactly like
+            predict_nationality()
+        """
+        names = list(names)
+        results: Dict[str, Dict] = {}
+
+        if self._cache is not None:
+            for name in set(names):
+                found, value = self._cache.get(('nationality', name.lower(), name_type, top_n, explain))
+                if found:
+                    results[name] = value
+
+        missing = [name for name in dict.fromkeys(names) if name not in results]
+        normalized = self._normalize_many(missing)
+        rows_by_name = self._backend.countries_many(set(normalized.values()), name_type, top_n)
+
+        neighbours: Dict[str, Dict] = {}
+        if self.fuzzy:
+            unknown = {key for key in normalized.values() if not rows_by_name.get(key)}
+            neighbours = self._nearest_many(unknown, name_type)
+            neighbour_rows = self._backend.countries_many(
+                {match['name'] for match in neighbours.values()}, name_type, top_n
+            )
+            for key, match in neighbours.items():
+                rows_by_name[key] = neighbour_rows.get(match['name'], [])
+
+        for name in missing:
+            result = self._nationality_result(
+                name, normalized[name], name_type,
+                rows_by_name.get(normalized[name], []), neighbours.get(normalized[name]), explain
+            )
+            results[name] = result
+            if self._cache is not None:
+                self._cache.put(('nationality', name.lower(), name_type, top_n, explain), result)
+
+        return [copy_result(results[name]) for name in names]
+
+    def _nationality_result(
+        self,
+        name: str,
+        normalized: str,
+        name_type: str,
+        results: List[Tuple],
+        fuzzy_match: Optional[Dict],
+        explain: bool
+    ) -> Dict:
+        """
+        Build a predict_nationality() result from sorted country rows
+
+        ``fuzzy_match`` is the nearest known name whose rows stand in for an
+        unknown name (see ethnidata.fuzzy); the result reports it.
+        """
+        result = self._nationality_rows_result(name, normalized, name_type, results, explain)
+        if fuzzy_match is not None:
+            result['fuzzy_match'] = fuzzy_match
+            if explain:
+                result['explanation']['why'].insert(
+                    0, f"Name not found; using nearest known name '{fuzzy_match['name']}' "
+                       f"(edit distance {fuzzy_match['distance']})"
+                )
+        return result
+
+    def _nationality_rows_result(
+        self,
+        name: str,
+        normalized: str,
+        name_type: str,
+        results: List[Tuple],
+        explain: bool
+    ) -> Dict:
         if not results:
             base_result = {
                 'name': normalized,
@@ -153,26 +500,22 @@ class EthniData:
 
             return base_result
 
+        started = self._clock()
+
         # Calculate probabilities
-        total_freq = sum(row['frequency'] for row in results)
+        total_freq = sum(row[3] for row in results)
 
         top_countries = []
-        for row in results:
-            prob = row['frequency'] / total_freq
-
-            try:
-                country = pycountry.countries.get(alpha_3=row['country_code'])
-                country_name = country.name if country else row['country_code']
-            except Exception:
-                country_name = row['country_code']
+        for country_code, region, language, frequency in results:
+            prob = frequency / total_freq
 
             top_countries.append({
-                'country': row['country_code'],
-                'country_name': country_name,
-                'region': row['region'],
-                'language': row['language'],
+                'country': country_code,
+                'country_name': country_name(country_code),
+                'region': region,
+                'language': language,
                 'probability': round(prob, 4),
-                'frequency': row['frequency']
+                'frequency': frequency
             })
 
         top = top_countries[0]
@@ -183,7 +526,6 @@ class EthniData:
         data_quality = min(1.0, total_freq / 100.0)  # Higher total = better quality
 
         # Calculate entropy (ambiguity)
-        import math
         probs = [c['probability'] for c in top_countries]
         entropy = -sum(p * math.log2(p) if p > 0 else 0 for p in probs)
         max_entropy = math.log2(len(probs)) if len(probs) > 1 else 1
@@ -196,119 +538,16 @@ class EthniData:
             (1 - normalized_entropy) * 0.2  # Low entropy = high confidence
         )
 
-        # MORPHOLOGY-BASED CORRECTION for poor database coverage
-        morphology_boost_applied = False
-        name_lower = name.lower()
-        turkish_chars = set('ığşçöü')
-        turkish_suffixes = [
-            'oğlu', 'oglu', 'yilmaz', 'yılmaz', 'ilmaz', 'maz', 'mez',
-            'er', 'can', 'han', 'gül', 'demir', 'kaya', 'öz', 'kurt'
-        ]
+        self._record("rank", started)
+        started = self._clock()
 
-        has_turkish_chars = any(c in name_lower for c in turkish_chars)
-        has_turkish_suffix = any(name_lower.endswith(suffix) for suffix in turkish_suffixes)
-
-        # Simple Japanese surname patterns to avoid Bhutan-style mislabels
-        japanese_common = {'tanaka', 'suzuki', 'sato', 'ito', 'watanabe', 'kobayashi', 'yamamoto', 'nakamura', 'kato', 'yoshida'}
-        has_japanese_pattern = name_lower in japanese_common
-
-        chinese_common = {'zhang', 'li', 'wang', 'chen', 'liu', 'yang', 'zhao', 'huang', 'wu', 'zhou'}
-
-        if data_quality < 0.4 or has_turkish_chars or has_turkish_suffix or has_japanese_pattern or name_lower in chinese_common:
-            morphology_signal = None
-
-            # Turkish boost logic
-            if has_turkish_chars or has_turkish_suffix:
-                tur_found = False
-                for i, country_data in enumerate(top_countries):
-                    if country_data['country'] == 'TUR':
-                        top_countries.insert(0, top_countries.pop(i))
-                        top = top_countries[0]
-                        confidence = max(confidence, 0.70)
-                        morphology_boost_applied = True
-                        morphology_signal = 'Turkish'
-                        tur_found = True
-                        break
-
-                if not tur_found and has_turkish_chars and has_turkish_suffix:
-                    try:
-                        country = pycountry.countries.get(alpha_3='TUR')
-                        top_countries.insert(0, {
-                            'country': 'TUR',
-                            'country_name': country.name if country else 'Turkey',
-                            'region': 'Asia',
-                            'language': 'Turkish',
-                            'probability': 0.80,
-                            'frequency': 0
-                        })
-                        top = top_countries[0]
-                        confidence = 0.65
-                        morphology_boost_applied = True
-                        morphology_signal = 'Turkish'
-                    except Exception:
-                        pass
-
-            # Japanese boost logic
-            elif has_japanese_pattern:
-                jpn_found = False
-                for i, country_data in enumerate(top_countries):
-                    if country_data['country'] == 'JPN':
-                        top_countries.insert(0, top_countries.pop(i))
-                        top = top_countries[0]
-                        confidence = max(confidence, 0.75)
-                        morphology_boost_applied = True
-                        morphology_signal = 'Japanese'
-                        jpn_found = True
-                        break
-
-                if not jpn_found:
-                    try:
-                        country = pycountry.countries.get(alpha_3='JPN')
-                        top_countries.insert(0, {
-                            'country': 'JPN',
-                            'country_name': country.name if country else 'Japan',
-                            'region': 'Asia',
-                            'language': 'Japanese',
-                            'probability': 0.85,
-                            'frequency': 0
-                        })
-                        top = top_countries[0]
-                        confidence = 0.70
-                        morphology_boost_applied = True
-                        morphology_signal = 'Japanese'
-                    except Exception:
-                        pass
-
-            # Chinese boost logic
-            elif name_lower in chinese_common:
-                chn_found = False
-                for i, country_data in enumerate(top_countries):
-                    if country_data['country'] == 'CHN':
-                        top_countries.insert(0, top_countries.pop(i))
-                        top = top_countries[0]
-                        confidence = max(confidence, 0.75)
-                        morphology_boost_applied = True
-                        morphology_signal = 'Chinese'
-                        chn_found = True
-                        break
-
-                if not chn_found:
-                    try:
-                        country = pycountry.countries.get(alpha_3='CHN')
-                        top_countries.insert(0, {
-                            'country': 'CHN',
-                            'country_name': country.name if country else 'China',
-                            'region': 'Asia',
-                            'language': 'Chinese',
-                            'probability': 0.85,
-                            'frequency': 0
-                        })
-                        top = top_countries[0]
-                        confidence = 0.70
-                        morphology_boost_applied = True
-                        morphology_signal = 'Chinese'
-                    except Exception:
-                        pass
+        # MORPHOLOGY-BASED CORRECTION for poor database coverage
+        ranking = self.corrections.apply(Ranking(name.lower(), top_countries, confidence))
+        self._record("corrections", started)
+        top = top_countries[0]
+        confidence = ranking.confidence
+        morphology_boost_applied = ranking.applied
+        morphology_signal = ranking.signal
 
         # Apply minimum confidence threshold
         MIN_CONFIDENCE = 0.15
@@ -354,6 +593,8 @@ class EthniData:
 
         # v4.0.0: Add explainability features if requested
         if explain:
+            started = self._clock()
+
             # Calculate ambiguity score (Shannon entropy)
             probs = [c['probability'] for c in top_countries]
             ambiguity = ExplainabilityEngine.calculate_ambiguity_score(probs)
@@ -390,6 +631,8 @@ class EthniData:
             result['morphology_signal'] = morphology_signal
             result['explanation'] = explanation['explanation']
 
+            self._record("explain", started)
+
         return result
 
     def predict_gender(
@@ -411,18 +654,15 @@ class EthniData:
             }
         """
 
-        normalized = self.normalize_name(name)
+        normalized = self._normalize(name)
 
-        query = """
-            SELECT gender, COUNT(*) as count
-            FROM names
-            WHERE name = ? AND name_type = 'first'
-            GROUP BY gender
-        """
+        return self._cached(
+            ('gender', normalized),
+            lambda: self._gender_result(normalized, self._backend.genders(normalized))
+        )
 
-        cursor = self.conn.cursor()
-        cursor.execute(query, (normalized,))
-        results = cursor.fetchall()
+    def _gender_result(self, normalized: str, results: List[Tuple]) -> Dict:
+        """Build a predict_gender() result from (gender, count) rows"""
 
         if not results:
             return {
@@ -436,9 +676,7 @@ class EthniData:
         gender_counts = {}
         total = 0
 
-        for row in results:
-            gender = row['gender']
-            count = row['count']
+        for gender, count in results:
             gender_counts[gender] = count
             total += count
 
@@ -477,19 +715,15 @@ class EthniData:
             }
         """
 
-        normalized = self.normalize_name(name)
+        normalized = self._normalize(name)
 
-        query = """
-            SELECT region, COUNT(*) as total_freq
-            FROM names
-            WHERE name = ? AND name_type = ?
-            GROUP BY region
-            ORDER BY total_freq DESC
-        """
+        return self._cached(
+            ('region', normalized, name_type),
+            lambda: self._region_result(normalized, self._backend.counts(normalized, name_type, 'region'))
+        )
 
-        cursor = self.conn.cursor()
-        cursor.execute(query, (normalized, name_type))
-        results = cursor.fetchall()
+    def _region_result(self, normalized: str, results: List[Tuple]) -> Dict:
+        """Build a predict_region() result from (region, count) rows"""
 
         if not results:
             return {
@@ -499,16 +733,15 @@ class EthniData:
                 'distribution': {}
             }
 
-        total = sum(row['total_freq'] for row in results)
+        total = sum(count for _, count in results)
 
         distribution = {}
-        for row in results:
-            region = row['region']
-            prob = row['total_freq'] / total
+        for region, count in results:
+            prob = count / total
             distribution[region] = round(prob, 4)
 
-        top_region = results[0]['region']
-        confidence = results[0]['total_freq'] / total
+        top_region, top_count = results[0]
+        confidence = top_count / total
 
         return {
             'name': normalized,
@@ -540,20 +773,15 @@ class EthniData:
             }
         """
 
-        normalized = self.normalize_name(name)
+        normalized = self._normalize(name)
 
-        query = """
-            SELECT language, COUNT(*) as total_freq
-            FROM names
-            WHERE name = ? AND name_type = ? AND language IS NOT NULL
-            GROUP BY language
-            ORDER BY total_freq DESC
-            LIMIT ?
-        """
+        return self._cached(
+            ('language', normalized, name_type, top_n),
+            lambda: self._language_result(normalized, self._backend.counts(normalized, name_type, 'language', top_n))
+        )
 
-        cursor = self.conn.cursor()
-        cursor.execute(query, (normalized, name_type, top_n))
-        results = cursor.fetchall()
+    def _language_result(self, normalized: str, results: List[Tuple]) -> Dict:
+        """Build a predict_language() result from (language, count) rows"""
 
         if not results:
             return {
@@ -563,12 +791,11 @@ class EthniData:
                 'top_languages': []
             }
 
-        total = sum(row['total_freq'] for row in results)
+        total = sum(count for _, count in results)
 
         top_languages = []
-        for row in results:
-            lang = row['language']
-            prob = row['total_freq'] / total
+        for lang, count in results:
+            prob = count / total
             top_languages.append({
                 'language': lang,
                 'probability': round(prob, 4)
@@ -604,20 +831,15 @@ class EthniData:
             }
         """
 
-        normalized = self.normalize_name(name)
+        normalized = self._normalize(name)
 
-        query = """
-            SELECT religion, COUNT(*) as total_freq
-            FROM names
-            WHERE name = ? AND name_type = ? AND religion IS NOT NULL
-            GROUP BY religion
-            ORDER BY total_freq DESC
-            LIMIT ?
-        """
+        return self._cached(
+            ('religion', normalized, name_type, top_n),
+            lambda: self._religion_result(normalized, self._backend.counts(normalized, name_type, 'religion', top_n))
+        )
 
-        cursor = self.conn.cursor()
-        cursor.execute(query, (normalized, name_type, top_n))
-        results = cursor.fetchall()
+    def _religion_result(self, normalized: str, results: List[Tuple]) -> Dict:
+        """Build a predict_religion() result from (religion, count) rows"""
 
         if not results:
             return {
@@ -627,12 +849,11 @@ class EthniData:
                 'top_religions': []
             }
 
-        total = sum(row['total_freq'] for row in results)
+        total = sum(count for _, count in results)
 
         top_religions = []
-        for row in results:
-            religion = row['religion']
-            prob = row['total_freq'] / total
+        for religion, count in results:
+            prob = count / total
             top_religions.append({
                 'religion': religion,
                 'probability': round(prob, 4)
@@ -655,6 +876,11 @@ class EthniData:
         # Use nationality as ethnicity proxy since we don't have separate ethnicity data
         nationality = self.predict_nationality(name, name_type, top_n=1)
 
+        return self._ethnicity_result(nationality)
+
+    @staticmethod
+    def _ethnicity_result(nationality: Dict) -> Dict:
+        """Build a predict_ethnicity() result from a top-1 nationality result"""
         return {
             'name': nationality['name'],
             'ethnicity': nationality['country_name'],  # Use country as ethnicity
@@ -687,6 +913,67 @@ class EthniData:
         first_pred = self.predict_nationality(first_name, "first", top_n=top_n, explain=False)
         last_pred = self.predict_nationality(last_name, "last", top_n=top_n, explain=False)
 
+        top_countries = self._combine_top_countries(first_pred, last_pred, top_n)
+        return self._full_name_result(first_name, last_name, first_pred['name'], last_pred['name'],
+                                      top_countries, explain)
+
+    def predict_full_name_batch(
+        self,
+        names: Iterable[Tuple[str, str]],
+        top_n: int = 5,
+        explain: bool = False
+    ) -> List[Dict]:
+        """
+        Predict from many (first_name, last_name) pairs at once
+
+        First and last names are resolved with one batched lookup each
+        (see predict_nationality_batch).
+
+        Args:
+            names: Iterable of (first_name, last_name) tuples
+            top_n: Number of top predictions per name
+            explain: If True, includes explainability layer
+
+        Returns:
+            List of results in input order, each shaped exactly like
+            predict_full_name()
+        """
+        pairs = list(names)
+        firsts = list(dict.fromkeys(first for first, _ in pairs))
+        lasts = list(dict.fromkeys(last for _, last in pairs))
+        first_preds = self.predict_nationality_batch(firsts, "first", top_n=top_n, explain=False)
+        last_preds = self.predict_nationality_batch(lasts, "last", top_n=top_n, explain=False)
+
+        vectorized = _vectorized() if len(pairs) >= VECTORIZE_MIN_PAIRS else None
+        if vectorized is not None:
+            first_ids = {first: i for i, first in enumerate(firsts)}
+            last_ids = {last: i for i, last in enumerate(lasts)}
+            combined = vectorized.combine_top_countries(
+                [pred['top_countries'] for pred in first_preds],
+                [pred['top_countries'] for pred in last_preds],
+                top_n,
+                first_ids=[first_ids[first] for first, _ in pairs],
+                last_ids=[last_ids[last] for _, last in pairs]
+            )
+        else:
+            first_by_name = dict(zip(firsts, first_preds))
+            last_by_name = dict(zip(lasts, last_preds))
+            combined = [
+                self._combine_top_countries(first_by_name[first], last_by_name[last], top_n)
+                for first, last in pairs
+            ]
+
+        first_keys = {first: pred['name'] for first, pred in zip(firsts, first_preds)}
+        last_keys = {last: pred['name'] for last, pred in zip(lasts, last_preds)}
+        return [
+            self._full_name_result(first, last, first_keys[first], last_keys[last], top_countries, explain)
+            for (first, last), top_countries in zip(pairs, combined)
+        ]
+
+    @staticmethod
+    def _combine_top_countries(first_pred: Dict, last_pred: Dict, top_n: int) -> List[Dict]:
+        """Weighted first (0.4) / last (0.6) merge of two top_countries lists"""
+
         # Combine scores
         combined_scores = {}
 
@@ -717,26 +1004,33 @@ class EthniData:
         # Format
         top_countries = []
         for country_code, data in sorted_countries:
-            try:
-                country = pycountry.countries.get(alpha_3=country_code)
-                country_name = country.name if country else country_code
-            except Exception:
-                country_name = country_code
-
             top_countries.append({
                 'country': country_code,
-                'country_name': country_name,
+                'country_name': country_name(country_code),
                 'region': data['region'],
                 'language': data['language'],
                 'probability': round(data['score'], 4)
             })
 
+        return top_countries
+
+    def _full_name_result(
+        self,
+        first_name: str,
+        last_name: str,
+        first_normalized: str,
+        last_normalized: str,
+        top_countries: List[Dict],
+        explain: bool
+    ) -> Dict:
+        """Build a predict_full_name() result from the combined top_countries"""
+
         top = top_countries[0] if top_countries else {}
 
         # Base result
         result = {
-            'first_name': self.normalize_name(first_name),
-            'last_name': self.normalize_name(last_name),
+            'first_name': first_normalized,
+            'last_name': last_normalized,
             'country': top.get('country'),
             'country_name': top.get('country_name'),
             'region': top.get('region'),
@@ -747,6 +1041,8 @@ class EthniData:
 
         # v4.0.0: Add explainability features if requested
         if explain:
+            started = self._clock()
+
             # Calculate ambiguity score
             probs = [c['probability'] for c in top_countries]
             ambiguity = ExplainabilityEngine.calculate_ambiguity_score(probs)
@@ -794,6 +1090,8 @@ class EthniData:
             }
             result['explanation'] = explanation['explanation']
 
+            self._record("explain", started)
+
         return result
 
     def predict_all(
@@ -821,43 +1119,93 @@ class EthniData:
             }
         """
 
-        normalized = self.normalize_name(name)
+        return self._cached(
+            ('all', name.lower(), name_type),
+            lambda: self._predict_all(name, name_type)
+        )
+
+    def _predict_all(self, name: str, name_type: str) -> Dict:
+        normalized = self._normalize(name)
+        return self._all_result(name, normalized, name_type, *self._distribution(normalized, name_type))
+
+    def predict_all_batch(
+        self,
+        names: Iterable[str],
+        name_type: Literal["first", "last"] = "first"
+    ) -> List[Dict]:
+        """
+        predict_all() for many names with chunked lookups
+
+        Args:
+            names: Iterable of first or last names
+            name_type: "first" or "last"
+
+        Returns:
+            List of results in input order, each shaped exactly like
+            predict_all()
+        """
+        names = list(names)
+        results: Dict[str, Dict] = {}
+
+        if self._cache is not None:
+            for name in set(names):
+                found, value = self._cache.get(('all', name.lower(), name_type))
+                if found:
+                    results[name] = value
+
+        missing = [name for name in dict.fromkeys(names) if name not in results]
+        normalized = self._normalize_many(missing)
+        dists = self._backend.distributions_many(set(normalized.values()), name_type)
+
+        neighbours: Dict[str, Dict] = {}
+        if self.fuzzy:
+            unknown = {key for key in normalized.values() if key not in dists or not dists[key].countries}
+            neighbours = self._nearest_many(unknown, name_type)
+            neighbour_dists = self._backend.distributions_many(
+                {match['name'] for match in neighbours.values()}, name_type
+            )
+            for key, match in neighbours.items():
+                dists[key] = neighbour_dists.get(match['name'], EMPTY_DISTRIBUTION)
+
+        for name in missing:
+            dist = dists.get(normalized[name], EMPTY_DISTRIBUTION)
+            result = self._all_result(name, normalized[name], name_type, dist, neighbours.get(normalized[name]))
+            results[name] = result
+            if self._cache is not None:
+                self._cache.put(('all', name.lower(), name_type), result)
+
+        return [copy_result(results[name]) for name in names]
+
+    def _all_result(self, name: str, normalized: str, name_type: str, dist: NameDistribution,
+                    fuzzy_match: Optional[Dict] = None) -> Dict:
+        """Derive every predict_all() section from a single aggregated distribution"""
+        nationality = self._nationality_result(
+            name, normalized, name_type, list(dist.countries[:5]), fuzzy_match, False
+        )
+        top_nationality = self._nationality_result(
+            name, normalized, name_type, list(dist.countries[:1]), None, False
+        )
 
         result = {
             'name': normalized,
-            'nationality': self.predict_nationality(name, name_type),
-            'region': self.predict_region(name, name_type),
-            'language': self.predict_language(name, name_type),
-            'religion': self.predict_religion(name, name_type),  # NEW!
-            'ethnicity': self.predict_ethnicity(name, name_type)
+            'nationality': nationality,
+            'region': self._region_result(normalized, list(dist.regions)),
+            'language': self._language_result(normalized, list(dist.languages[:5])),
+            'religion': self._religion_result(normalized, list(dist.religions[:5])),
+            'ethnicity': self._ethnicity_result(top_nationality)
         }
 
         # Gender only for first names
         if name_type == "first":
-            result['gender'] = self.predict_gender(name)
+            result['gender'] = self._gender_result(normalized, list(dist.genders))
 
         return result
 
     def get_stats(self) -> Dict:
-        """Get database statistics"""
-
-        cursor = self.conn.cursor()
-
-        stats = {}
-
-        cursor.execute("SELECT COUNT(*) as count FROM names WHERE name_type = 'first'")
-        stats['total_first_names'] = cursor.fetchone()['count']
-
-        cursor.execute("SELECT COUNT(*) as count FROM names WHERE name_type = 'last'")
-        stats['total_last_names'] = cursor.fetchone()['count']
-
-        cursor.execute("SELECT COUNT(DISTINCT country_code) as count FROM names")
-        stats['countries'] = cursor.fetchone()['count']
-
-        cursor.execute("SELECT COUNT(DISTINCT region) as count FROM names WHERE region IS NOT NULL")
-        stats['regions'] = cursor.fetchone()['count']
-
-        cursor.execute("SELECT COUNT(DISTINCT language) as count FROM names WHERE language IS NOT NULL")
-        stats['languages'] = cursor.fetchone()['count']
+        """
+        Get database statistics
 
-        return stats
+        Read from the db_metadata table written by the build pipeline
+        (see ethnidata.db_metadata); databases without it are scanned.
+        """
+        return database_stats(self.conn)
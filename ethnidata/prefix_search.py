@@ -0,0 +1,116 @@
+"""
+EthniData prefix search
+
+Type-ahead over the database vocabulary.  ``LIKE 'abc%'`` on the raw
+``names`` table scans and re-aggregates on every keystroke; instead each
+name type gets a sorted array of its distinct normalized names with their
+row counts, loaded once.  A prefix maps to a contiguous slice found with
+two binary searches, and the slice is ranked by frequency:
+
+    - short slices (at most ``SCAN_LIMIT`` names) are ranked directly;
+    - prefixes of up to ``PRECOMPUTED_DEPTH`` characters that cover more
+      names get their top ``TOP_K`` precomputed in one pass at load time;
+    - other large slices are ranked once and memoized in an LRU.
+
+Usage:
+    ed.search_prefix("meh", name_type="first", limit=5)
+    # [{'name': 'mehmet', 'frequency': 8}, ...]
+
+License: MIT
+"""
+
+import heapq
+import sqlite3
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from typing import Dict, List, Tuple
+
+from .cache import LRUCache
+from .name_stats import NAME_STATS_TABLE, name_stats_is_current
+
+# Slices up to this many names are ranked on every call
+SCAN_LIMIT = 256
+
+# Heavy prefixes up to this length are ranked once at load time
+PRECOMPUTED_DEPTH = 3
+
+# Entries kept per precomputed / memoized prefix
+TOP_K = 50
+
+# Memoized rankings for heavy prefixes longer than PRECOMPUTED_DEPTH
+MEMO_SIZE = 16384
+
+# Sorts after every character a normalized name can contain
+_END = "\U0010ffff"
+
+
+def load_vocabulary(conn: sqlite3.Connection, name_type: str) -> List[Tuple[str, int]]:
+    """(name, frequency) for every distinct name of ``name_type``, sorted by name"""
+    if name_stats_is_current(conn):
+        query = f"SELECT name, total FROM {NAME_STATS_TABLE} WHERE name_type = ?"
+    else:
+        query = "SELECT name, COUNT(*) FROM names WHERE name_type = ? AND name IS NOT NULL GROUP BY name"
+    return sorted((name, frequency) for name, frequency in conn.execute(query, (name_type,)))
+
+
+class PrefixIndex:
+    """Sorted name array with frequency-ranked prefix lookups"""
+
+    def __init__(self, vocabulary: List[Tuple[str, int]]):
+        self.names: List[str] = [name for name, _ in vocabulary]
+        self.frequencies = array("q", (frequency for _, frequency in vocabulary))
+        self._top: Dict[str, List[int]] = self._precompute()
+        self._memo = LRUCache(MEMO_SIZE)
+
+    def _precompute(self) -> Dict[str, List[int]]:
+        """Top TOP_K positions of every short prefix covering more than SCAN_LIMIT names"""
+        sizes = Counter(name[:depth] for name in self.names for depth in range(1, PRECOMPUTED_DEPTH + 1)
+                        if len(name) >= depth)
+        top: Dict[str, List[int]] = {prefix: [] for prefix, size in sizes.items() if size > SCAN_LIMIT}
+        if not top:
+            return top
+
+        # Stable sort: equal frequencies stay in name order
+        frequencies = self.frequencies
+        for position in sorted(range(len(self.names)), key=frequencies.__getitem__, reverse=True):
+            name = self.names[position]
+            for depth in range(1, min(len(name), PRECOMPUTED_DEPTH) + 1):
+                bucket = top.get(name[:depth])
+                if bucket is not None and len(bucket) < TOP_K:
+                    bucket.append(position)
+        return top
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def _rank(self, low: int, high: int, limit: int) -> List[int]:
+        frequencies = self.frequencies
+        return heapq.nsmallest(limit, range(low, high), key=lambda i: (-frequencies[i], i))
+
+    def search(self, prefix: str, limit: int = 10) -> List[Dict]:
+        """
+        Names starting with ``prefix`` (already normalized)
+
+        Returns:
+            Up to ``limit`` dicts ``{'name', 'frequency'}``, most frequent
+            first, ties in alphabetical order
+        """
+        if limit <= 0:
+            return []
+
+        low = bisect_left(self.names, prefix)
+        high = bisect_left(self.names, prefix + _END, low)
+
+        if high - low <= SCAN_LIMIT or limit > TOP_K:
+            positions = self._rank(low, high, limit)
+        else:
+            positions = self._top.get(prefix)
+            if positions is None:
+                found, positions = self._memo.get(prefix)
+                if not found:
+                    positions = self._rank(low, high, TOP_K)
+                    self._memo.put(prefix, positions)
+            positions = positions[:limit]
+
+        return [{'name': self.names[i], 'frequency': self.frequencies[i]} for i in positions]
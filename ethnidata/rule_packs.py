@@ -0,0 +1,304 @@
+"""
+EthniData morphology rule packs
+
+Affix rules live in JSON rule packs (``ethnidata/rules/default.json``)
+instead of Python literals.  A pack has two sections:
+
+    groups   cultural/linguistic pattern groups, in priority order, with
+             ``suffixes``, ``prefixes``, ``regions`` and ``countries``
+             (MorphologyEngine.PATTERNS)
+    boosts   the Turkish/Japanese/Chinese signals used by the predictor's
+             morphology correction
+
+The pack is loaded on first use, not on import.  The first load compiles
+the affixes into character tries and, if the cache directory is writable,
+writes them to a ``marshal`` cache next to other EthniData caches; later
+loads read the tries back directly.  Set ``ETHNIDATA_CACHE_DIR=`` (empty)
+to skip the cache.  The cache file name carries a hash of the pack
+source, so editing a pack (or upgrading the compiler format) invalidates
+it automatically; caches of packs that no longer exist are removed the
+next time any pack is compiled.  Matching cost depends on the length of the name, not on
+the number of affixes in the pack.
+
+License: MIT
+"""
+
+import hashlib
+import json
+import marshal
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+RULES_DIR = Path(__file__).parent / "rules"
+DEFAULT_RULE_PACK = RULES_DIR / "default.json"
+
+# Bump when the compiled layout changes; stale caches are then rebuilt
+CACHE_FORMAT = 2
+
+# Pack fields loaded as sets rather than lists
+SET_FIELDS = frozenset({"turkish_chars", "japanese_common", "chinese_common", "korean_common"})
+
+# Trie node key holding the groups whose affix ends at that node
+_HITS = None
+
+
+class RulePackError(ValueError):
+    """Raised for malformed rule pack sources"""
+
+
+class AffixTrie:
+    """
+    Character trie over normalized affixes.
+
+    Each terminal remembers, per pattern group, the list position and
+    original spelling of the earliest affix ending there, so a single walk
+    over a name reproduces "first affix in list order wins" for every group.
+    """
+
+    def __init__(self, root: Optional[Dict] = None):
+        self.root: Dict = {} if root is None else root
+
+    def add(self, affix: str, group: int, position: int, pattern: str) -> None:
+        node = self.root
+        for char in affix:
+            node = node.setdefault(char, {})
+        node.setdefault(_HITS, {}).setdefault(group, (position, pattern))
+
+    @staticmethod
+    def _collect(node: Dict, found: Dict[int, Tuple[int, str]]) -> None:
+        for group, hit in node.get(_HITS, {}).items():
+            if group not in found or hit[0] < found[group][0]:
+                found[group] = hit
+
+    def first_matches(self, chars: Iterable[str]) -> Dict[int, Tuple[int, str]]:
+        """Return {group: (position, pattern)} for affixes that prefix ``chars``"""
+        found: Dict[int, Tuple[int, str]] = {}
+        node = self.root
+        self._collect(node, found)
+        for char in chars:
+            node = node.get(char)
+            if node is None:
+                break
+            self._collect(node, found)
+        return found
+
+    def matches_any(self, chars: Iterable[str]) -> bool:
+        """True if any affix is a prefix of ``chars``"""
+        node = self.root
+        if _HITS in node:
+            return True
+        for char in chars:
+            node = node.get(char)
+            if node is None:
+                return False
+            if _HITS in node:
+                return True
+        return False
+
+
+class CompiledPatterns:
+    """Pattern groups with affixes normalized once into tries"""
+
+    def __init__(self, patterns: Dict[str, Dict],
+                 suffixes: Optional[AffixTrie] = None,
+                 prefixes: Optional[AffixTrie] = None):
+        self.groups: List[Tuple[str, Dict]] = list(patterns.items())
+
+        if suffixes is None or prefixes is None:
+            suffixes, prefixes = AffixTrie(), AffixTrie()
+            for group, (_, data) in enumerate(self.groups):
+                for position, suffix in enumerate(data.get("suffixes", [])):
+                    suffixes.add(suffix.lower().replace("-", "")[::-1], group, position, suffix)
+                for position, prefix in enumerate(data.get("prefixes", [])):
+                    prefixes.add(prefix.lower().replace("-", "").replace("'", ""), group, position, prefix)
+        self.suffixes = suffixes
+        self.prefixes = prefixes
+
+        turkic = patterns.get("turkic", {})
+        east_asian = patterns.get("east_asian", {})
+        self.turkish_chars = frozenset(turkic.get("turkish_chars", ()))
+        self.common_turkish = frozenset(turkic.get("common_surnames", ()))
+        self.japanese_common = frozenset(east_asian.get("japanese_common", ()))
+        self.chinese_common = frozenset(east_asian.get("chinese_common", ()))
+        self.korean_common = frozenset(east_asian.get("korean_common", ()))
+
+
+class RulePack:
+    """A loaded rule pack: pattern groups, compiled tries and predictor boosts"""
+
+    def __init__(self, name: str, patterns: Dict[str, Dict], compiled: CompiledPatterns,
+                 boosts: Dict, turkish_suffixes: AffixTrie):
+        self.name = name
+        self.patterns = patterns
+        self.compiled = compiled
+        self.turkish_chars = frozenset(boosts.get("turkish_chars", ()))
+        self.japanese_common = frozenset(boosts.get("japanese_common", ()))
+        self.chinese_common = frozenset(boosts.get("chinese_common", ()))
+        self._turkish_suffixes = turkish_suffixes
+
+    def has_turkish_chars(self, name_lower: str) -> bool:
+        return not self.turkish_chars.isdisjoint(name_lower)
+
+    def has_turkish_suffix(self, name_lower: str) -> bool:
+        return self._turkish_suffixes.matches_any(reversed(name_lower))
+
+
+def _as_sets(value):
+    if isinstance(value, dict):
+        return {k: set(v) if k in SET_FIELDS else _as_sets(v) for k, v in value.items()}
+    return value
+
+
+def _parse(source: bytes, path: Path) -> Dict:
+    try:
+        pack = json.loads(source.decode("utf-8"))
+    except ValueError as e:
+        raise RulePackError(f"Invalid rule pack {path}: {e}") from e
+    if not isinstance(pack, dict) or not isinstance(pack.get("groups"), dict):
+        raise RulePackError(f"Invalid rule pack {path}: missing 'groups' object")
+    return pack
+
+
+def _compile(pack: Dict) -> Dict:
+    """Pack source -> marshal-able compiled form"""
+    patterns = _as_sets(pack["groups"])
+    compiled = CompiledPatterns(patterns)
+    boosts = _as_sets(pack.get("boosts", {}))
+    turkish_suffixes = AffixTrie()
+    for position, suffix in enumerate(boosts.get("turkish_suffixes", [])):
+        turkish_suffixes.add(suffix[::-1], 0, position, suffix)
+
+    return {
+        "name": pack.get("name", ""),
+        "patterns": patterns,
+        "suffixes": compiled.suffixes.root,
+        "prefixes": compiled.prefixes.root,
+        "boosts": boosts,
+        "turkish_suffixes": turkish_suffixes.root,
+    }
+
+
+def _from_compiled(data: Dict) -> RulePack:
+    patterns = data["patterns"]
+    compiled = CompiledPatterns(patterns, AffixTrie(data["suffixes"]), AffixTrie(data["prefixes"]))
+    return RulePack(data["name"], patterns, compiled, data["boosts"], AffixTrie(data["turkish_suffixes"]))
+
+
+def default_cache_dir() -> Optional[Path]:
+    """
+    ``$ETHNIDATA_CACHE_DIR``, else ``$XDG_CACHE_HOME/ethnidata`` (``~/.cache/ethnidata``)
+
+    None (no compiled cache) when ``ETHNIDATA_CACHE_DIR`` is set but empty,
+    or when there is no home directory to put the cache in.
+    """
+    explicit = os.environ.get("ETHNIDATA_CACHE_DIR")
+    if explicit is not None:
+        return Path(explicit) if explicit else None
+    base = os.environ.get("XDG_CACHE_HOME")
+    if not base:
+        try:
+            base = Path.home() / ".cache"
+        except (KeyError, RuntimeError):
+            return None
+    return Path(base) / "ethnidata"
+
+
+def cache_path(path: Path, source: bytes, cache_dir: Path) -> Path:
+    """
+    ``rules/<stem>-<path hash>-v<format>-<source hash>.marshal`` under ``cache_dir``
+
+    The path hash keeps packs with the same file name in different
+    directories from treating each other's caches as stale.
+    """
+    return cache_dir / "rules" / f"{_cache_prefix(path)}{CACHE_FORMAT}-{hashlib.sha256(source).hexdigest()[:16]}.marshal"
+
+
+def _cache_prefix(path: Path) -> str:
+    location = hashlib.sha256(str(path.resolve()).encode("utf-8")).hexdigest()[:8]
+    return f"{path.stem}-{location}-v"
+
+
+def _read_cache(cached: Path) -> Optional[Dict]:
+    """Compiled pack from a cache file (source path first, then the pack)"""
+    try:
+        with open(cached, "rb") as f:
+            marshal.load(f)
+            data = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _cache_source(cached: Path) -> Optional[str]:
+    try:
+        with open(cached, "rb") as f:
+            source = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    return source if isinstance(source, str) else None
+
+
+def _write_cache(cached: Path, data: Dict, path: Path) -> None:
+    """Best effort: an unwritable cache directory only costs a recompile"""
+    try:
+        cached.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cached.with_name(f"{cached.name}.{os.getpid()}.tmp")
+        with open(tmp, "wb") as f:
+            marshal.dump(str(path.resolve()), f)
+            marshal.dump(data, f)
+        os.replace(tmp, cached)
+    except OSError:
+        return
+
+    # Older compilations of this pack, and caches whose pack file is gone
+    own = _cache_prefix(path)
+    for stale in cached.parent.glob("*.marshal"):
+        if stale == cached:
+            continue
+        if not stale.name.startswith(own):
+            source = _cache_source(stale)
+            if source is not None and Path(source).exists():
+                continue
+        try:
+            stale.unlink()
+        except OSError:
+            pass
+
+
+_loaded: Dict[Tuple, RulePack] = {}
+_lock = threading.Lock()
+
+
+def load_rule_pack(path: Optional[Path] = None, cache_dir: Optional[Path] = None) -> RulePack:
+    """
+    Load a rule pack, using (or refreshing) its compiled cache.
+
+    Args:
+        path: JSON rule pack (default: the bundled ``rules/default.json``)
+        cache_dir: Where compiled packs are kept (default: default_cache_dir())
+
+    Returns:
+        RulePack; repeated calls for an unchanged file return the same object
+    """
+    path = Path(path) if path is not None else DEFAULT_RULE_PACK
+    stat = path.stat()
+    key = (str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+
+    with _lock:
+        pack = _loaded.get(key)
+        if pack is not None:
+            return pack
+
+        source = path.read_bytes()
+        cache_dir = Path(cache_dir) if cache_dir else default_cache_dir()
+        cached = cache_path(path, source, cache_dir) if cache_dir is not None else None
+        data = _read_cache(cached) if cached is not None else None
+        if data is None:
+            data = _compile(_parse(source, path))
+            if cached is not None:
+                _write_cache(cached, data, path)
+
+        pack = _loaded[key] = _from_compiled(data)
+        return pack
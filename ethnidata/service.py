@@ -0,0 +1,308 @@
+"""
+EthniData service mode
+
+A long-running predictor behind a small JSON-over-HTTP server, built for
+containers:
+
+    - start-up opens the database and constructs the predictor once, then
+      warms it: the data file (database or snapshot) is handed to the
+      kernel for read-ahead (``posix_fadvise(WILLNEED)``) and the most
+      frequent names are predicted, which pulls their index pages into the
+      page cache and fills the result cache;
+    - ``/healthz`` answers as soon as the server is up, ``/readyz`` once
+      the warm-up is done;
+    - start-up first writes a "starting" heartbeat file; once ready, the
+      serving loop rewrites it as "ready" every few seconds, so the
+      container health check (``python -m ethnidata.service probe``) only
+      reads that file - no predictor, no database.  The probe passes
+      (printing "starting") for up to ``MAX_START`` seconds of start-up,
+      however long the database load and warm-up take, and then only
+      while the "ready" beats keep coming.
+
+Endpoints (GET):
+    /predict?name=Ahmet[&name_type=first]      predict_nationality()
+    /predict?first=Ahmet&last=Yilmaz           predict_full_name()
+    /stats                                     get_stats()
+    /metrics                                   Prometheus text (see ethnidata.instrumentation)
+    /healthz, /readyz                          liveness / readiness
+
+Usage:
+    python -m ethnidata.service serve --port 8000 [--db PATH] [--backend memory]
+    python -m ethnidata.service probe          # exit 0 while a server is starting or alive
+
+License: MIT
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence
+
+if TYPE_CHECKING:
+    from .predictor import EthniData
+
+DEFAULT_PORT = 8000
+
+# Names predicted per name type during warm-up
+WARM_UP_NAMES = 2000
+
+# Result cache of the service predictor
+SERVICE_CACHE_SIZE = 65536
+
+# Seconds between heartbeat touches; the probe allows three missed beats
+HEARTBEAT_INTERVAL = 5.0
+
+# Seconds the probe accepts a server that is still starting (loading and warming up)
+MAX_START = 600.0
+
+# Warm-up names for databases without a name_stats table (where finding the
+# most frequent names would mean a GROUP BY over every row)
+COMMON_NAMES = {
+    "first": ["john", "maria", "mohammed", "ahmet", "jose", "anna", "wei", "david", "michael", "fatima",
+              "mehmet", "juan", "ali", "james", "elena", "hiroshi", "olga", "carlos", "sarah", "ivan"],
+    "last": ["smith", "garcia", "wang", "li", "kim", "yilmaz", "muller", "rossi", "nguyen", "silva",
+             "rodriguez", "tanaka", "ivanov", "kaya", "singh", "johnson", "lopez", "martin", "chen", "khan"],
+}
+
+
+def default_heartbeat_path() -> str:
+    """``$ETHNIDATA_HEARTBEAT``, else ``ethnidata.heartbeat`` in the temp directory"""
+    return os.environ.get("ETHNIDATA_HEARTBEAT") or os.path.join(tempfile.gettempdir(), "ethnidata.heartbeat")
+
+
+def write_heartbeat(path: str, state: str) -> None:
+    """Atomically write ``state`` ("ready", or "starting <unix time>") to the heartbeat file"""
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w") as f:
+        f.write(state)
+    os.replace(tmp, path)
+
+
+def prefetch(path) -> bool:
+    """Ask the kernel to read ``path`` ahead into the page cache; returns False where unsupported"""
+    if not hasattr(os, "posix_fadvise"):
+        return False
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    finally:
+        os.close(fd)
+    return True
+
+
+def hot_names(ed: "EthniData", name_type: str, count: int) -> List[str]:
+    """The ``count`` most frequent names from name_stats, else COMMON_NAMES"""
+    from .name_stats import NAME_STATS_TABLE, name_stats_is_current
+
+    conn = ed.conn
+    if not name_stats_is_current(conn):
+        return COMMON_NAMES[name_type][:count]
+    return [row[0] for row in conn.execute(
+        f"SELECT name FROM {NAME_STATS_TABLE} WHERE name_type = ? ORDER BY total DESC, name LIMIT ?",
+        (name_type, count)
+    )]
+
+
+def warm_up(ed: "EthniData", count: int = WARM_UP_NAMES) -> Dict[str, float]:
+    """
+    Prefetch the backend's data file and predict the hottest names
+
+    Returns:
+        {'prefetched': bool, 'names': int, 'seconds': float}
+    """
+    start = time.perf_counter()
+    prefetched = prefetch(ed.data_path)
+    warmed = 0
+    for name_type in ("first", "last"):
+        names = hot_names(ed, name_type, count)
+        for name in names:
+            ed.predict_nationality(name, name_type)
+        warmed += len(names)
+    return {'prefetched': prefetched, 'names': warmed, 'seconds': time.perf_counter() - start}
+
+
+def probe(heartbeat_path: Optional[str] = None, max_age: float = 3 * HEARTBEAT_INTERVAL,
+          max_start: float = MAX_START) -> Optional[str]:
+    """
+    State of the server behind the heartbeat file
+
+    Returns:
+        "starting" if it began starting up within ``max_start`` seconds,
+        "ready" if it wrote a ready beat within ``max_age`` seconds,
+        else None
+    """
+    path = heartbeat_path or default_heartbeat_path()
+    try:
+        with open(path) as f:
+            state = f.read().split()
+        modified = os.stat(path).st_mtime
+    except OSError:
+        return None
+    now = time.time()
+    if state[:1] == ["starting"]:
+        try:
+            started = float(state[1])
+        except (IndexError, ValueError):
+            return None
+        return "starting" if now - started <= max_start else None
+    return "ready" if now - modified <= max_age else None
+
+
+def make_server(ed: "EthniData", host: str = "127.0.0.1", port: int = DEFAULT_PORT,
+                heartbeat_path: Optional[str] = None):
+    """
+    ThreadingHTTPServer serving ``ed``; set ``server.ready = True`` after warm-up
+
+    Call ``serve_forever()`` to run it; the "ready" heartbeat is only written while ready.
+    """
+    import json
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    from urllib.parse import parse_qs, urlparse
+
+    heartbeat = heartbeat_path or default_heartbeat_path()
+
+    class Handler(BaseHTTPRequestHandler):
+        def _send(self, status: int, body, content_type: str = "application/json"):
+            if content_type == "application/json":
+                body = json.dumps(body, ensure_ascii=False)
+            data = body.encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+
+            if url.path == "/healthz":
+                self._send(200, {'status': 'ok'})
+            elif url.path == "/readyz":
+                self._send(200 if self.server.ready else 503, {'ready': self.server.ready})
+            elif url.path == "/stats":
+                self._send(200, ed.get_stats())
+            elif url.path == "/metrics":
+                self._send(200, ed.metrics_text(), "text/plain; version=0.0.4")
+            elif url.path == "/predict":
+                if "first" in params and "last" in params:
+                    self._send(200, ed.predict_full_name(params["first"], params["last"]))
+                elif "name" in params:
+                    name_type = params.get("name_type", "first")
+                    if name_type not in ("first", "last"):
+                        self._send(400, {'error': "name_type must be 'first' or 'last'"})
+                    else:
+                        self._send(200, ed.predict_nationality(params["name"], name_type))
+                else:
+                    self._send(400, {'error': "Pass name=, or first= and last="})
+            else:
+                self._send(404, {'error': f"Unknown path: {url.path}"})
+
+        def log_message(self, format, *args):
+            pass
+
+    class Server(ThreadingHTTPServer):
+        daemon_threads = True
+        ready = False
+        _last_beat = float("-inf")
+
+        def service_actions(self):
+            # Runs on every serve_forever() poll, so a stuck loop stops the beats
+            now = time.monotonic()
+            if self.ready and now - self._last_beat >= HEARTBEAT_INTERVAL:
+                write_heartbeat(heartbeat, "ready")
+                self._last_beat = now
+
+        def server_close(self):
+            super().server_close()
+            if self._last_beat > float("-inf"):
+                try:
+                    os.remove(heartbeat)
+                except OSError:
+                    pass
+
+    return Server((host, port), Handler)
+
+
+def serve(args: argparse.Namespace) -> int:
+    import signal
+    import threading
+
+    from .instrumentation import Instrumentation
+    from .predictor import EthniData
+
+    start = time.perf_counter()
+    heartbeat = args.heartbeat or default_heartbeat_path()
+    write_heartbeat(heartbeat, f"starting {time.time()}")
+    ed = EthniData(db_path=args.db, use_v3=args.v3, backend=args.backend, cache_size=args.cache_size,
+                   pooled=True, immutable=args.immutable,
+                   instrumentation=Instrumentation())
+    server = make_server(ed, args.host, args.port, heartbeat)
+    thread = threading.Thread(target=server.serve_forever, kwargs={'poll_interval': 0.5}, daemon=True)
+    thread.start()
+    print(f"🌐 Listening on {args.host}:{server.server_address[1]} ({ed.backend} backend, "
+          f"opened in {time.perf_counter() - start:.2f} s)", flush=True)
+
+    if args.warm_up:
+        report = warm_up(ed, args.warm_up)
+        print(f"🔥 Warmed {report['names']:,} names in {report['seconds']:.2f} s"
+              f"{' (file prefetched)' if report['prefetched'] else ''}", flush=True)
+    server.ready = True
+    print(f"✅ Ready after {time.perf_counter() - start:.2f} s", flush=True)
+
+    # docker stop sends SIGTERM: shut down cleanly and drop the heartbeat
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
+    try:
+        thread.join()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
+        server.server_close()
+        ed.close()
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m ethnidata.service",
+        description="Run EthniData as a warmed-up HTTP service, or probe a running one."
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run = subparsers.add_parser("serve", help="Start the HTTP service")
+    run.add_argument("--host", default="127.0.0.1", help="Bind address (default: 127.0.0.1)")
+    run.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"Port (default: {DEFAULT_PORT})")
+    run.add_argument("--db", default=None, help="Database path (default: bundled database)")
+    run.add_argument("--v3", action="store_true", help="Use the v3 database if installed")
+    run.add_argument("--backend", default="sqlite", choices=["sqlite", "memory", "snapshot"])
+    run.add_argument("--immutable", action="store_true",
+                     help="Open the database with immutable=1 (read-only files only)")
+    run.add_argument("--cache-size", type=int, default=SERVICE_CACHE_SIZE, help="Result cache entries")
+    run.add_argument("--warm-up", type=int, default=WARM_UP_NAMES,
+                     help=f"Hot names predicted per name type before ready (default: {WARM_UP_NAMES}, 0 to skip)")
+    run.add_argument("--heartbeat", default=None, help="Heartbeat file (default: $ETHNIDATA_HEARTBEAT)")
+
+    check = subparsers.add_parser("probe", help="Exit 0 if the service is starting or alive")
+    check.add_argument("--heartbeat", default=None, help="Heartbeat file (default: $ETHNIDATA_HEARTBEAT)")
+    check.add_argument("--max-age", type=float, default=3 * HEARTBEAT_INTERVAL,
+                       help="Oldest acceptable heartbeat in seconds")
+    check.add_argument("--max-start", type=float, default=MAX_START,
+                       help=f"Longest acceptable start-up in seconds (default: {MAX_START:.0f})")
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.command == "probe":
+        state = probe(args.heartbeat, args.max_age, args.max_start)
+        print(state or "down")
+        return 0 if state else 1
+    return serve(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
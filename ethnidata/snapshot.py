@@ -0,0 +1,247 @@
+"""
+EthniData binary snapshot format
+
+A snapshot is a read-only, sorted export of every (name, name_type)
+distribution.  The reader ``mmap``s the file and binary-searches it in
+place, so opening is near-instant and forked workers share one physical
+copy through the OS page cache.
+
+Layout (all integers little-endian):
+
+    header    magic, version, value/key counts and section offsets
+    records   per key: five u16 row counts, then packed rows
+              countries: (code, region, language, frequency) as 4 x u32
+              regions / languages / religions / genders: (value, count) as 2 x u32
+    values    u32 offsets (n_values + 1) followed by the UTF-8 string blob;
+              every country code, region, language, religion and gender is
+              stored once and referenced by index (NULL_ID for NULL)
+    keys      UTF-8 ``name_type + "\\0" + name`` blob
+    index     per key, sorted by key bytes: (key offset u32, key length u32,
+              record offset u64)
+
+Build one with:
+
+    python -m ethnidata.tools.export_snapshot path/to/ethnidata.db
+
+License: MIT
+"""
+
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .distributions import EMPTY_DISTRIBUTION, NameDistribution
+from .name_stats import iter_distributions, iter_name_stats, name_stats_is_current
+
+MAGIC = b"EDSNAP\x00\x01"
+VERSION = 1
+SNAPSHOT_SUFFIX = ".snap"
+
+NULL_ID = 0xFFFFFFFF
+
+_HEADER = struct.Struct("<8sIIIQQQQ")
+_COUNTS = struct.Struct("<5H")
+_COUNTRY_ROW = struct.Struct("<4I")
+_COUNT_ROW = struct.Struct("<2I")
+_OFFSET = struct.Struct("<I")
+_INDEX_ENTRY = struct.Struct("<IIQ")
+
+
+class SnapshotError(ValueError):
+    """Raised when a file is not a readable EthniData snapshot"""
+
+
+def snapshot_key(name: str, name_type: str) -> bytes:
+    return f"{name_type}\0{name}".encode("utf-8")
+
+
+def default_snapshot_path(db_path: Path) -> Path:
+    """Where the exporter writes the snapshot of ``db_path`` by default"""
+    return Path(db_path).with_suffix(SNAPSHOT_SUFFIX)
+
+
+class _ValueTable:
+    def __init__(self):
+        self.ids: Dict[str, int] = {}
+
+    def __call__(self, value: Optional[str]) -> int:
+        if value is None:
+            return NULL_ID
+        value_id = self.ids.get(value)
+        if value_id is None:
+            value_id = self.ids[value] = len(self.ids)
+        return value_id
+
+
+def _encode_record(dist: NameDistribution, value_id: _ValueTable) -> bytes:
+    parts = [_COUNTS.pack(
+        len(dist.countries), len(dist.regions), len(dist.languages),
+        len(dist.religions), len(dist.genders)
+    )]
+    for code, region, language, frequency in dist.countries:
+        parts.append(_COUNTRY_ROW.pack(value_id(code), value_id(region), value_id(language), frequency))
+    for rows in (dist.regions, dist.languages, dist.religions, dist.genders):
+        for value, count in rows:
+            parts.append(_COUNT_ROW.pack(value_id(value), count))
+    return b"".join(parts)
+
+
+def write_snapshot(
+    distributions: Iterable[Tuple[str, str, NameDistribution]],
+    path: Path,
+    progress: Optional[Callable[[int], None]] = None
+) -> int:
+    """
+    Write (name, name_type, NameDistribution) triples to a snapshot file.
+
+    Records are streamed to disk; only the keys are held in memory so the
+    index can be sorted.
+
+    Returns:
+        Number of keys written
+    """
+    path = Path(path)
+    tmp_path = path.with_name(path.name + ".tmp")
+    value_id = _ValueTable()
+    keys: List[Tuple[bytes, int]] = []
+
+    with open(tmp_path, "wb") as f:
+        f.write(b"\0" * _HEADER.size)
+        records_offset = offset = _HEADER.size
+
+        for name, name_type, dist in distributions:
+            record = _encode_record(dist, value_id)
+            keys.append((snapshot_key(name, name_type), offset))
+            f.write(record)
+            offset += len(record)
+            if progress and len(keys) % 100000 == 0:
+                progress(len(keys))
+
+        values = [value.encode("utf-8") for value in value_id.ids]
+        values_offset = offset
+        position = 0
+        for value in values:
+            f.write(_OFFSET.pack(position))
+            position += len(value)
+        f.write(_OFFSET.pack(position))
+        f.write(b"".join(values))
+        offset += _OFFSET.size * (len(values) + 1) + position
+
+        keys.sort()
+        keys_offset = offset
+        index = []
+        position = 0
+        for key, record_offset in keys:
+            f.write(key)
+            index.append(_INDEX_ENTRY.pack(position, len(key), record_offset))
+            position += len(key)
+        index_offset = keys_offset + position
+        f.write(b"".join(index))
+
+        f.seek(0)
+        f.write(_HEADER.pack(
+            MAGIC, VERSION, len(values), len(keys),
+            records_offset, values_offset, keys_offset, index_offset
+        ))
+
+    os.replace(tmp_path, path)
+    if progress:
+        progress(len(keys))
+    return len(keys)
+
+
+def export_snapshot(conn, path: Path, progress: Optional[Callable[[int], None]] = None) -> int:
+    """Export an EthniData database (name_stats if current, else names) to ``path``"""
+    rows = iter_name_stats(conn) if name_stats_is_current(conn) else iter_distributions(conn)
+    return write_snapshot(rows, path, progress)
+
+
+class SnapshotReader:
+    """Memory-mapped, binary-searched view of a snapshot file"""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        if self.path.stat().st_size < _HEADER.size:
+            raise SnapshotError(f"Not an EthniData snapshot: {self.path}")
+        with open(self.path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        (magic, version, n_values, self._n_keys, self._records_offset,
+         values_offset, self._keys_offset, self._index_offset) = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            self._mm.close()
+            raise SnapshotError(f"Not an EthniData snapshot (v{VERSION}): {self.path}")
+
+        # The value table holds a few hundred short strings; decode it once
+        blob = values_offset + _OFFSET.size * (n_values + 1)
+        offsets = [o for (o,) in _OFFSET.iter_unpack(self._mm[values_offset:blob])]
+        self._values = [
+            self._mm[blob + start:blob + end].decode("utf-8")
+            for start, end in zip(offsets, offsets[1:])
+        ]
+
+    def __len__(self) -> int:
+        return self._n_keys
+
+    def _value(self, value_id: int) -> Optional[str]:
+        return None if value_id == NULL_ID else self._values[value_id]
+
+    def _key_at(self, i: int) -> Tuple[bytes, int]:
+        key_offset, key_len, record_offset = _INDEX_ENTRY.unpack_from(
+            self._mm, self._index_offset + i * _INDEX_ENTRY.size
+        )
+        start = self._keys_offset + key_offset
+        return self._mm[start:start + key_len], record_offset
+
+    def _find(self, key: bytes) -> int:
+        lo, hi = 0, self._n_keys
+        while lo < hi:
+            mid = (lo + hi) // 2
+            found, record_offset = self._key_at(mid)
+            if found < key:
+                lo = mid + 1
+            elif found > key:
+                hi = mid
+            else:
+                return record_offset
+        return -1
+
+    def _read_record(self, offset: int) -> NameDistribution:
+        mm, value = self._mm, self._value
+        counts = _COUNTS.unpack_from(mm, offset)
+        offset += _COUNTS.size
+
+        countries = []
+        for _ in range(counts[0]):
+            code, region, language, frequency = _COUNTRY_ROW.unpack_from(mm, offset)
+            countries.append((value(code), value(region), value(language), frequency))
+            offset += _COUNTRY_ROW.size
+
+        sections = []
+        for n in counts[1:]:
+            rows = []
+            for _ in range(n):
+                value_id, count = _COUNT_ROW.unpack_from(mm, offset)
+                rows.append((value(value_id), count))
+                offset += _COUNT_ROW.size
+            sections.append(tuple(rows))
+
+        regions, languages, religions, genders = sections
+        return NameDistribution(tuple(countries), regions, languages, religions, genders)
+
+    def get(self, name: str, name_type: str) -> NameDistribution:
+        offset = self._find(snapshot_key(name, name_type))
+        if offset < 0:
+            return EMPTY_DISTRIBUTION
+        return self._read_record(offset)
+
+    def __iter__(self) -> Iterator[Tuple[str, str, NameDistribution]]:
+        for i in range(self._n_keys):
+            key, record_offset = self._key_at(i)
+            name_type, name = key.decode("utf-8").split("\0", 1)
+            yield name, name_type, self._read_record(record_offset)
+
+    def close(self) -> None:
+        self._mm.close()
@@ -0,0 +1,13 @@
+"""
+EthniData database tools
+
+Maintenance utilities for EthniData SQLite files. Each tool is runnable as
+a module, e.g.:
+
+    python -m ethnidata.tools.optimize_db path/to/ethnidata.db
+    python -m ethnidata.tools.export_snapshot path/to/ethnidata.db
+    python -m ethnidata.tools.build_fuzzy_index path/to/ethnidata.db
+    python -m ethnidata.tools.build_metadata path/to/ethnidata.db
+
+License: MIT
+"""
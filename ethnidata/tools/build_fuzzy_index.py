@@ -0,0 +1,61 @@
+"""
+EthniData fuzzy index builder
+
+Builds the ``fuzzy_deletes`` SymSpell table used by ``EthniData(fuzzy=True)``
+and ``EthniData.fuzzy_lookup()`` from the distinct names of a database
+(``name_stats`` when present, otherwise the raw ``names`` table).
+
+Usage:
+    python -m ethnidata.tools.build_fuzzy_index path/to/ethnidata.db
+    python -m ethnidata.tools.build_fuzzy_index path/to/ethnidata.db --max-distance 1
+
+License: MIT
+"""
+
+import argparse
+import sqlite3
+import sys
+import time
+from pathlib import Path
+from typing import List, Optional
+
+from ..fuzzy import DEFAULT_MAX_DISTANCE, DEFAULT_PREFIX_LENGTH, FUZZY_TABLE, build_fuzzy_index
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m ethnidata.tools.build_fuzzy_index",
+        description="Build the fuzzy name lookup index of an EthniData database."
+    )
+    parser.add_argument("db_path", help="Path to the SQLite database")
+    parser.add_argument("--max-distance", type=int, default=DEFAULT_MAX_DISTANCE,
+                        help=f"Largest supported edit distance (default: {DEFAULT_MAX_DISTANCE})")
+    parser.add_argument("--prefix-length", type=int, default=DEFAULT_PREFIX_LENGTH,
+                        help=f"Name prefix the deletes are taken from (default: {DEFAULT_PREFIX_LENGTH})")
+    args = parser.parse_args(argv)
+
+    db_path = Path(args.db_path)
+    if not db_path.exists():
+        print(f"❌ Database not found: {db_path}")
+        return 1
+
+    start = time.time()
+    conn = sqlite3.connect(str(db_path))
+    try:
+        names = build_fuzzy_index(
+            conn, args.max_distance, args.prefix_length,
+            progress=lambda n: print(f"   {n:,} names", end="\r")
+        )
+        entries = conn.execute(f"SELECT COUNT(*) FROM {FUZZY_TABLE}").fetchone()[0]
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 1
+    finally:
+        conn.close()
+
+    print(f"\n✅ Indexed {names:,} names ({entries:,} entries) in {time.time() - start:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+"""
+EthniData metadata builder
+
+Writes the ``db_metadata`` table that ``EthniData.get_stats()`` reads
+instead of scanning ``names``: row and distinct-value counts, the package
+version that built the file and a checksum of the ``names`` rows.
+``--verify`` recomputes everything and compares it with the stored table.
+
+Usage:
+    python -m ethnidata.tools.build_metadata path/to/ethnidata.db
+    python -m ethnidata.tools.build_metadata path/to/ethnidata.db --no-checksum
+    python -m ethnidata.tools.build_metadata path/to/ethnidata.db --verify
+
+License: MIT
+"""
+
+import argparse
+import sqlite3
+import sys
+import time
+from pathlib import Path
+from typing import List, Optional
+
+from ..db_metadata import build_db_metadata, names_checksum, read_db_metadata, scan_stats
+
+
+def verify(conn: sqlite3.Connection) -> List[str]:
+    """Differences between the stored db_metadata and the ``names`` table (empty when in sync)"""
+    stored = read_db_metadata(conn)
+    if stored is None:
+        return ["no db_metadata table"]
+
+    expected = scan_stats(conn)
+    if 'checksum' in stored:
+        expected['checksum'] = f"sha256:{names_checksum(conn)}"
+    return [
+        f"{key}: stored {stored.get(key)!r}, actual {value!r}"
+        for key, value in expected.items() if stored.get(key) != value
+    ]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m ethnidata.tools.build_metadata",
+        description="Write (or verify) the db_metadata table of an EthniData database."
+    )
+    parser.add_argument("db_path", help="Path to the SQLite database")
+    parser.add_argument("--no-checksum", action="store_true",
+                        help="Skip the checksum of the names table (saves one ordered scan)")
+    parser.add_argument("--verify", action="store_true",
+                        help="Compare the stored metadata with the database instead of writing it")
+    args = parser.parse_args(argv)
+
+    db_path = Path(args.db_path)
+    if not db_path.exists():
+        print(f"❌ Database not found: {db_path}")
+        return 1
+
+    start = time.time()
+    conn = sqlite3.connect(str(db_path))
+    try:
+        if args.verify:
+            problems = verify(conn)
+        else:
+            metadata = build_db_metadata(conn, checksum=not args.no_checksum)
+    finally:
+        conn.close()
+
+    if args.verify:
+        for problem in problems:
+            print(f"❌ {problem}")
+        if problems:
+            return 1
+        print(f"✅ db_metadata matches the database ({time.time() - start:.1f}s)")
+        return 0
+
+    print(f"✅ db_metadata written: {metadata['total_rows']:,} rows, "
+          f"{metadata['countries']:,} countries in {time.time() - start:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
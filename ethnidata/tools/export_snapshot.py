@@ -0,0 +1,54 @@
+"""
+EthniData snapshot exporter
+
+Converts an EthniData SQLite database into the compact binary snapshot
+read by ``EthniData(backend="snapshot")``.  Uses the ``name_stats`` table
+when it has been built, otherwise aggregates the raw ``names`` table.
+
+Usage:
+    python -m ethnidata.tools.export_snapshot path/to/ethnidata.db
+    python -m ethnidata.tools.export_snapshot path/to/ethnidata.db -o names.snap
+
+License: MIT
+"""
+
+import argparse
+import sqlite3
+import sys
+import time
+from pathlib import Path
+from typing import List, Optional
+
+from ..connection import read_only_uri
+from ..snapshot import default_snapshot_path, export_snapshot
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m ethnidata.tools.export_snapshot",
+        description="Export an EthniData database to a memory-mappable binary snapshot."
+    )
+    parser.add_argument("db_path", help="Path to the SQLite database")
+    parser.add_argument("-o", "--output", help="Snapshot path (default: DB path with .snap suffix)")
+    args = parser.parse_args(argv)
+
+    db_path = Path(args.db_path)
+    if not db_path.exists():
+        print(f"❌ Database not found: {db_path}")
+        return 1
+    output = Path(args.output) if args.output else default_snapshot_path(db_path)
+
+    start = time.time()
+    conn = sqlite3.connect(read_only_uri(db_path), uri=True)
+    try:
+        keys = export_snapshot(conn, output, progress=lambda n: print(f"   {n:,} keys", end="\r"))
+    finally:
+        conn.close()
+
+    size_mb = output.stat().st_size / 1024 / 1024
+    print(f"\n✅ Wrote {keys:,} keys to {output} ({size_mb:.1f} MB) in {time.time() - start:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
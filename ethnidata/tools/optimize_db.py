@@ -0,0 +1,226 @@
+"""
+EthniData database optimizer
+
+The build scripts only create single-column indexes, so every predictor
+query has to jump from ``idx_name`` back into the table to read region,
+language, religion and gender.  This tool:
+
+1. Creates one covering index on
+   (name, name_type, country_code, region, language, religion, gender)
+2. Drops indexes that are a leading prefix of it (e.g. ``idx_name``)
+3. Runs ANALYZE so the planner has statistics
+4. Verifies with EXPLAIN QUERY PLAN that every predictor query is answered
+   from the covering index (or the name_stats primary key)
+
+Usage:
+    python -m ethnidata.tools.optimize_db path/to/ethnidata.db
+    python -m ethnidata.tools.optimize_db path/to/ethnidata.db --check-only
+
+License: MIT
+"""
+
+import argparse
+import sqlite3
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .. import backends
+from ..connection import read_only_uri
+from ..name_stats import NAME_STATS_TABLE, has_name_stats
+
+COVERING_INDEX = "idx_names_covering"
+COVERING_COLUMNS = ("name", "name_type", "country_code", "region", "language", "religion", "gender")
+
+# (label, query, sample parameters) for every query the predictor issues
+PREDICTOR_QUERIES: List[Tuple[str, str, tuple]] = [
+    ("nationality", backends.NATIONALITY_QUERY, ("x", "first", 5)),
+    ("nationality_batch",
+     backends.NATIONALITY_BATCH_QUERY.format(placeholders="?, ?, ?"),
+     ("first", "x", "y", "z")),
+    ("region", backends.REGION_QUERY, ("x", "first", -1)),
+    ("language", backends.LANGUAGE_QUERY, ("x", "first", 5)),
+    ("religion", backends.RELIGION_QUERY, ("x", "first", 5)),
+    ("gender", backends.GENDER_QUERY, ("x",)),
+    ("distribution", backends.DISTRIBUTION_QUERY, ("x", "first")),
+    ("distribution_batch",
+     backends.DISTRIBUTION_BATCH_QUERY.format(placeholders="?, ?, ?"),
+     ("first", "x", "y", "z")),
+]
+
+NAME_STATS_QUERIES: List[Tuple[str, str, tuple]] = [
+    ("name_stats", backends.NAME_STATS_QUERY, ("x", "first")),
+    ("name_stats_batch",
+     backends.NAME_STATS_BATCH_QUERY.format(placeholders="?, ?, ?"),
+     ("first", "x", "y", "z")),
+]
+
+
+class QueryPlanError(RuntimeError):
+    """Raised when a predictor query is not served by the expected index"""
+
+
+def index_columns(conn: sqlite3.Connection, index: str) -> Tuple[str, ...]:
+    """Return the indexed column names of ``index`` in key order"""
+    rows = conn.execute(f"PRAGMA index_info('{index}')").fetchall()
+    return tuple(row[2] for row in sorted(rows, key=lambda r: r[0]))
+
+
+def create_covering_index(conn: sqlite3.Connection) -> None:
+    """Create the covering index on the names table if it does not exist"""
+    conn.execute(
+        f"CREATE INDEX IF NOT EXISTS {COVERING_INDEX} ON names({', '.join(COVERING_COLUMNS)})"
+    )
+
+
+def find_redundant_indexes(conn: sqlite3.Connection) -> List[str]:
+    """
+    List user-created indexes on ``names`` whose columns are a leading
+    prefix of the covering index (and therefore never needed by the planner).
+    """
+    redundant = []
+    for _, index, unique, origin, _ in conn.execute("PRAGMA index_list('names')").fetchall():
+        if index == COVERING_INDEX or origin != "c" or unique:
+            continue
+        columns = index_columns(conn, index)
+        if columns and COVERING_COLUMNS[:len(columns)] == columns:
+            redundant.append(index)
+    return sorted(redundant)
+
+
+def explain(conn: sqlite3.Connection, query: str, params: tuple) -> List[str]:
+    """Return the detail column of EXPLAIN QUERY PLAN for ``query``"""
+    return [row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {query}", params).fetchall()]
+
+
+def check_query_plans(conn: sqlite3.Connection) -> Dict[str, List[str]]:
+    """
+    Run EXPLAIN QUERY PLAN for every predictor query.
+
+    Returns:
+        {label: [offending plan steps]} for queries that read the names
+        table without the covering index; empty when all plans are good.
+    """
+    problems: Dict[str, List[str]] = {}
+
+    for label, query, params in PREDICTOR_QUERIES:
+        steps = [
+            step for step in explain(conn, query, params)
+            if step.startswith(("SEARCH names", "SCAN names"))
+        ]
+        bad = [step for step in steps if f"COVERING INDEX {COVERING_INDEX}" not in step]
+        if bad or not steps:
+            problems[label] = bad or ["names table not searched"]
+
+    if has_name_stats(conn):
+        for label, query, params in NAME_STATS_QUERIES:
+            steps = explain(conn, query, params)
+            bad = [
+                step for step in steps
+                if step.startswith(("SEARCH", "SCAN"))
+                and (NAME_STATS_TABLE not in step or "PRIMARY KEY" not in step)
+            ]
+            if bad:
+                problems[label] = bad
+
+    return problems
+
+
+def verify_query_plans(conn: sqlite3.Connection) -> None:
+    """Raise QueryPlanError unless every predictor query uses the covering index"""
+    problems = check_query_plans(conn)
+    if problems:
+        details = "; ".join(f"{label}: {' | '.join(steps)}" for label, steps in problems.items())
+        raise QueryPlanError(f"Predictor queries not covered by {COVERING_INDEX}: {details}")
+
+
+def optimize_database(
+    db_path: str,
+    drop_redundant: bool = True,
+    verify: bool = True
+) -> Dict[str, object]:
+    """
+    Add the covering index, drop redundant indexes, ANALYZE and verify.
+
+    Args:
+        db_path: Path to an EthniData SQLite database (opened read-write)
+        drop_redundant: Drop indexes made redundant by the covering index
+        verify: Raise QueryPlanError if any predictor query is not covered
+
+    Returns:
+        {'created': bool, 'dropped': [index names], 'plans': {label: [steps]}}
+    """
+    if not Path(db_path).exists():
+        raise FileNotFoundError(f"Database not found: {db_path}")
+
+    conn = sqlite3.connect(str(db_path))
+    try:
+        existing = [row[1] for row in conn.execute("PRAGMA index_list('names')").fetchall()]
+        create_covering_index(conn)
+
+        dropped = find_redundant_indexes(conn) if drop_redundant else []
+        for index in dropped:
+            conn.execute(f"DROP INDEX IF EXISTS {index}")
+        conn.commit()
+
+        conn.execute("ANALYZE")
+        conn.commit()
+
+        if verify:
+            verify_query_plans(conn)
+
+        plans = {label: explain(conn, query, params) for label, query, params in PREDICTOR_QUERIES}
+        return {
+            'created': COVERING_INDEX not in existing,
+            'dropped': dropped,
+            'plans': plans,
+        }
+    finally:
+        conn.close()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m ethnidata.tools.optimize_db",
+        description="Add covering indexes to an EthniData database and verify query plans."
+    )
+    parser.add_argument("db_path", help="Path to the SQLite database")
+    parser.add_argument("--keep-redundant", action="store_true",
+                        help="Do not drop indexes made redundant by the covering index")
+    parser.add_argument("--check-only", action="store_true",
+                        help="Only report query plans; do not modify the database")
+    args = parser.parse_args(argv)
+
+    if not Path(args.db_path).exists():
+        print(f"❌ Database not found: {args.db_path}")
+        return 1
+
+    if args.check_only:
+        conn = sqlite3.connect(read_only_uri(args.db_path), uri=True)
+        try:
+            problems = check_query_plans(conn)
+        finally:
+            conn.close()
+        if problems:
+            for label, steps in problems.items():
+                print(f"❌ {label}: {' | '.join(steps)}")
+            return 1
+        print("✅ All predictor queries use covering indexes")
+        return 0
+
+    try:
+        report = optimize_database(args.db_path, drop_redundant=not args.keep_redundant)
+    except QueryPlanError as e:
+        print(f"❌ {e}")
+        return 1
+
+    print(f"✅ Covering index {COVERING_INDEX} {'created' if report['created'] else 'already present'}")
+    for index in report['dropped']:
+        print(f"   Dropped redundant index: {index}")
+    for label, steps in report['plans'].items():
+        print(f"   {label:18s} {' | '.join(steps)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
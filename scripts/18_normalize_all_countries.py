@@ -7,6 +7,10 @@ Dünyadaki bütün ülkeleri kapsayacak şekilde
 import sqlite3
 from pathlib import Path
 import json
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from ethnidata.db_metadata import invalidate_derived_tables  # noqa: E402
 
 DB_FILE = Path(__file__).parent.parent / "ethnidata" / "ethnidata.db"
 RELIGION_FILE = Path(__file__).parent.parent / "data" / "raw" / "religion" / "country_religion_mapping.json"
@@ -203,6 +207,7 @@ print("="*80)
 
 conn = sqlite3.connect(DB_FILE)
 cursor = conn.cursor()
+invalidate_derived_tables(conn)
 
 # 1. Normalize country codes
 print("\n🔄 Ülke kodları standardize ediliyor...")
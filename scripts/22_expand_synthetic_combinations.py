@@ -7,6 +7,10 @@ import sqlite3
 import random
 from pathlib import Path
 import itertools
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from ethnidata.db_metadata import invalidate_derived_tables  # noqa: E402
 
 DB_PATH = Path("ethnidata/ethnidata_mega.db")
 
@@ -196,6 +200,7 @@ def expand_database():
 
     conn = sqlite3.connect(DB_PATH)
     cursor = conn.cursor()
+    invalidate_derived_tables(conn)
 
     # Her din için işlem
     total_added = 0
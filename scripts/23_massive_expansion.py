@@ -11,6 +11,10 @@ Strateji:
 import sqlite3
 from pathlib import Path
 import random
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from ethnidata.db_metadata import invalidate_derived_tables  # noqa: E402
 
 DB_PATH = Path("ethnidata/ethnidata_mega.db")
 
@@ -225,6 +229,7 @@ def massive_expand():
 
     conn = sqlite3.connect(DB_PATH)
     cursor = conn.cursor()
+    invalidate_derived_tables(conn)
 
     # Her dinin unique isimlerini al
     print("\nUnique isimleri toplama...")
@@ -17,6 +17,10 @@ import string
 from pathlib import Path
 from typing import List, Dict, Tuple
 import time
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from ethnidata.db_metadata import invalidate_derived_tables  # noqa: E402
 
 # Paths
 BASE_DIR = Path(__file__).parent.parent
@@ -228,6 +232,7 @@ def create_mega_database(output_path: str):
 
     conn = sqlite3.connect(output_path)
     cursor = conn.cursor()
+    invalidate_derived_tables(conn)
 
     # Create table with same schema
     cursor.execute("""
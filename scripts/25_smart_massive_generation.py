@@ -25,6 +25,10 @@ from typing import List, Dict, Tuple, Set
 import time
 import multiprocessing as mp
 from functools import partial
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from ethnidata.db_metadata import invalidate_derived_tables  # noqa: E402
 
 # Paths
 BASE_DIR = Path(__file__).parent.parent
@@ -204,6 +208,7 @@ def create_database(output_path: str):
 
     conn = sqlite3.connect(output_path)
     cursor = conn.cursor()
+    invalidate_derived_tables(conn)
 
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS names (
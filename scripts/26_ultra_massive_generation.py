@@ -18,6 +18,10 @@ from pathlib import Path
 from typing import List, Dict, Tuple
 import time
 import hashlib
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from ethnidata.db_metadata import invalidate_derived_tables  # noqa: E402
 
 # Paths
 BASE_DIR = Path(__file__).parent.parent
@@ -223,6 +227,7 @@ def create_database(output_path: str):
 
     conn = sqlite3.connect(output_path)
     cursor = conn.cursor()
+    invalidate_derived_tables(conn)
 
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS names (
@@ -20,6 +20,10 @@ import random
 from pathlib import Path
 from typing import List, Dict, Tuple
 import time
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from ethnidata.db_metadata import invalidate_derived_tables  # noqa: E402
 
 # Paths
 BASE_DIR = Path(__file__).parent.parent
@@ -192,6 +196,7 @@ def create_database(path: str):
 
     conn = sqlite3.connect(path)
     cursor = conn.cursor()
+    invalidate_derived_tables(conn)
 
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS names (
@@ -15,6 +15,10 @@ import sqlite3
 from pathlib import Path
 import time
 import random
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from ethnidata.db_metadata import invalidate_derived_tables  # noqa: E402
 
 # Paths
 BASE_DIR = Path(__file__).parent.parent
@@ -68,6 +72,7 @@ def create_target_db(target_path: str):
 
     conn = sqlite3.connect(target_path)
     cursor = conn.cursor()
+    invalidate_derived_tables(conn)
 
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS names (
@@ -9,6 +9,10 @@ Fix religion data quality issues and expand Judaism coverage
 import sqlite3
 import random
 from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from ethnidata.db_metadata import invalidate_derived_tables  # noqa: E402
 
 # Database paths
 SOURCE_DB = Path(__file__).parent.parent / "ethnidata_v3_full.db"
@@ -276,6 +280,7 @@ def main():
 
     conn = sqlite3.connect(SOURCE_DB)
     cursor = conn.cursor()
+    invalidate_derived_tables(conn)
 
     # Get initial stats
     cursor.execute("SELECT COUNT(*) FROM names")
@@ -0,0 +1,59 @@
+"""
+EthniData - Build precomputed name_stats table
+
+Aggregates the raw `names` table once into `name_stats`, one row per
+(name, name_type) with country/region/language/religion/gender counts.
+EthniData detects the table automatically and serves lookups from it.
+Finally writes the `db_metadata` table that get_stats() reads.
+
+Usage:
+    python scripts/30_build_name_stats.py                 # v3 database
+    python scripts/30_build_name_stats.py path/to/file.db
+"""
+
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+from ethnidata.db_metadata import build_db_metadata  # noqa: E402
+from ethnidata.name_stats import build_name_stats  # noqa: E402
+
+DEFAULT_DB = BASE_DIR / "ethnidata" / "ethnidata_v3.db"
+
+
+def main():
+    db_path = Path(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_DB
+
+    print("\n" + "="*80)
+    print("📊 EthniData - Building name_stats aggregate table")
+    print("="*80)
+    print(f"\n📁 Database: {db_path}")
+
+    if not db_path.exists():
+        print(f"❌ Database not found: {db_path}")
+        sys.exit(1)
+
+    start_time = time.time()
+
+    conn = sqlite3.connect(str(db_path))
+
+    def report(written):
+        print(f"\r   Keys written: {written:,}", end="", flush=True)
+
+    written = build_name_stats(conn, progress=report)
+    print(f"\n✅ name_stats built: {written:,} (name, name_type) keys")
+
+    metadata = build_db_metadata(conn)
+    conn.close()
+
+    print(f"✅ db_metadata written (build {metadata['build_version']}, {metadata['checksum']})")
+    print(f"⏱️  Total Time: {time.time() - start_time:.1f} seconds")
+    print("="*80)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""
+EthniData - Regenerate the static ISO 3166 country-name table
+
+Writes ethnidata/countries.py from the installed pycountry so the
+predictor can resolve alpha-3 codes without touching pycountry at runtime.
+Re-run after upgrading pycountry.
+
+Usage:
+    python scripts/31_generate_country_names.py
+"""
+
+from pathlib import Path
+
+import pycountry
+
+OUTPUT = Path(__file__).parent.parent / "ethnidata" / "countries.py"
+
+HEADER = '''"""
+EthniData country metadata
+
+Static ISO 3166-1 alpha-3 -> country name table, generated from pycountry
+{version} by scripts/31_generate_country_names.py.  The predictor resolves
+every result row through country_name(), so the hot path is one dict
+lookup; pycountry is only imported for codes missing from the table.
+
+Region and language are not stored here: they come from the matching
+database rows, which can differ per name for the same country.
+
+License: MIT
+"""
+
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping, Optional
+
+'''
+
+FOOTER = '''
+
+@lru_cache(maxsize=1024)
+def _pycountry_name(code: str) -> Optional[str]:
+    try:
+        import pycountry
+        country = pycountry.countries.get(alpha_3=code)
+    except Exception:
+        return None
+    return country.name if country else None
+
+
+def country_name(code: Optional[str]) -> Optional[str]:
+    """Return the country name for an alpha-3 code, or the code itself if unknown"""
+    name = COUNTRY_NAMES.get(code)
+    if name is None and code:
+        name = _pycountry_name(code)
+    return name or code
+'''
+
+
+def main():
+    version = getattr(pycountry, "__version__", "")
+    entries = sorted((c.alpha_3, c.name) for c in pycountry.countries)
+    lines = [f"    {code!r}: {name!r}," for code, name in entries]
+    body = "COUNTRY_NAMES: Mapping[str, str] = MappingProxyType({\n" + "\n".join(lines) + "\n})\n"
+    OUTPUT.write_text(HEADER.format(version=version).replace(" \n", "\n") + body + FOOTER, encoding="utf-8")
+    print(f"✅ Wrote {len(entries)} countries to {OUTPUT}")
+
+
+if __name__ == "__main__":
+    main()
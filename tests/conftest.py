@@ -0,0 +1,98 @@
+"""Shared fixtures: a tiny on-disk ``names`` database with the v3 schema."""
+
+import sqlite3
+
+import pytest
+
+
+# (name, name_type, country_code, region, language, religion, gender, n_rows)
+SAMPLE_ROWS = [
+    ("ahmet", "first", "TUR", "Asia", "Turkish", "Islam", "M", 6),
+    ("ahmet", "first", "AZE", "Asia", "Azerbaijani", "Islam", "M", 2),
+    ("ahmet", "first", "DEU", "Europe", "German", None, "M", 1),
+    ("maria", "first", "ESP", "Europe", "Spanish", "Christianity", "F", 5),
+    ("maria", "first", "ITA", "Europe", "Italian", "Christianity", "F", 4),
+    ("maria", "first", "BRA", "Americas", "Portuguese", "Christianity", "F", 3),
+    ("maria", "first", "PHL", "Asia", "Filipino", "Christianity", None, 1),
+    ("jose", "first", "ESP", "Europe", "Spanish", "Christianity", "M", 3),
+    ("jose", "first", "MEX", "Americas", "Spanish", "Christianity", "M", 3),
+    ("john", "first", "USA", "Americas", "English", "Christianity", "M", 7),
+    ("john", "first", "GBR", "Europe", "English", "Christianity", "M", 4),
+    ("john", "first", "AUS", "Oceania", "English", None, "M", 2),
+    ("john", "first", "NGA", "Africa", "English", "Christianity", "M", 1),
+    ("john", "first", "CAN", "Americas", "English", "Christianity", "M", 1),
+    ("john", "first", "IRL", "Europe", "English", "Christianity", "M", 1),
+    ("emma", "first", "GBR", "Europe", "English", "Christianity", "F", 3),
+    ("emma", "first", "SWE", "Europe", "Swedish", "Christianity", "F", 2),
+    ("mehmet", "first", "TUR", "Asia", "Turkish", "Islam", "M", 8),
+    ("yilmaz", "last", "TUR", "Asia", "Turkish", "Islam", None, 9),
+    ("yilmaz", "last", "DEU", "Europe", "German", "Islam", None, 1),
+    ("tanaka", "last", "BTN", "Asia", "Dzongkha", "Buddhism", None, 3),
+    ("tanaka", "last", "JPN", "Asia", "Japanese", "Buddhism", None, 2),
+    ("zhang", "last", "CHN", "Asia", "Chinese", "Buddhism", None, 5),
+    ("smith", "last", "USA", "Americas", "English", "Christianity", None, 6),
+    ("smith", "last", "GBR", "Europe", "English", "Christianity", None, 5),
+    ("smith", "last", "AUS", "Oceania", "English", "Christianity", None, 1),
+    ("garcia", "last", "ESP", "Europe", "Spanish", "Christianity", None, 4),
+    ("garcia", "last", "MEX", "Americas", "Spanish", "Christianity", None, 4),
+    ("petrov", "last", "RUS", "Europe", "Russian", "Christianity", None, 3),
+    ("rare", "first", "FRA", "Europe", "French", None, "F", 1),
+    ("rare", "first", "BEL", "Europe", "French", None, "F", 1),
+    ("rare", "first", "CHE", "Europe", "German", None, "M", 1),
+    ("rare", "first", "LUX", "Europe", "French", None, None, 1),
+    ("rare", "first", "MCO", "Europe", "French", None, "F", 1),
+]
+
+
+def build_sample_db(path):
+    """Create a ``names`` table (scripts/28 schema) filled with SAMPLE_ROWS."""
+    conn = sqlite3.connect(str(path))
+    conn.execute("""
+        CREATE TABLE names (
+            name TEXT NOT NULL,
+            name_type TEXT,
+            country_code TEXT,
+            region TEXT,
+            language TEXT,
+            religion TEXT,
+            gender TEXT,
+            source TEXT,
+            PRIMARY KEY (name, name_type, country_code, source)
+        )
+    """)
+    conn.execute("CREATE INDEX idx_name ON names(name)")
+    conn.execute("CREATE INDEX idx_name_type ON names(name_type)")
+    conn.execute("CREATE INDEX idx_country ON names(country_code)")
+
+    rows = []
+    for name, name_type, country, region, language, religion, gender, n in SAMPLE_ROWS:
+        for i in range(n):
+            rows.append((name, name_type, country, region, language, religion, gender, f"src{i}"))
+
+    conn.executemany("""
+        INSERT INTO names
+        (name, name_type, country_code, region, language, religion, gender, source)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    """, rows)
+    conn.commit()
+    conn.close()
+    return path
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path, monkeypatch):
+    """Keep compiled rule packs out of the real ``~/.cache/ethnidata``."""
+    monkeypatch.setenv("ETHNIDATA_CACHE_DIR", str(tmp_path / "ethnidata-cache"))
+
+
+@pytest.fixture
+def sample_db(tmp_path):
+    """Path to a freshly built sample database."""
+    return build_sample_db(tmp_path / "sample.db")
+
+
+@pytest.fixture
+def sample_ed(sample_db):
+    """EthniData instance backed by the sample database."""
+    from ethnidata import EthniData
+    return EthniData(db_path=str(sample_db))
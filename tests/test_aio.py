@@ -0,0 +1,99 @@
+"""Tests for the asyncio front-end."""
+
+import asyncio
+import threading
+
+import pytest
+
+from ethnidata import AsyncEthniData, EthniData
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+def test_async_methods_match_sync(sample_db):
+    sync = EthniData(db_path=str(sample_db))
+
+    async def main():
+        async with AsyncEthniData(db_path=str(sample_db)) as ed:
+            return await asyncio.gather(
+                ed.predict_nationality("Yılmaz", "last", explain=True),
+                ed.predict_gender("Emma"),
+                ed.predict_region("John"),
+                ed.predict_language("John", top_n=2),
+                ed.predict_religion("Ahmet"),
+                ed.predict_ethnicity("Maria"),
+                ed.predict_full_name("Mehmet", "Yılmaz"),
+                ed.predict_all("Maria"),
+                ed.predict_nationality_batch(["John", "Emma"]),
+                ed.predict_full_name_batch([("John", "Smith")]),
+                ed.get_stats(),
+            )
+
+    assert _run(main()) == [
+        sync.predict_nationality("Yılmaz", "last", explain=True),
+        sync.predict_gender("Emma"),
+        sync.predict_region("John"),
+        sync.predict_language("John", top_n=2),
+        sync.predict_religion("Ahmet"),
+        sync.predict_ethnicity("Maria"),
+        sync.predict_full_name("Mehmet", "Yılmaz"),
+        sync.predict_all("Maria"),
+        sync.predict_nationality_batch(["John", "Emma"]),
+        sync.predict_full_name_batch([("John", "Smith")]),
+        sync.get_stats(),
+    ]
+
+
+def test_predict_many_order_and_dedup(sample_db):
+    names = ["John", "Maria", "John", "Nobody", "maria"]
+    expected = EthniData(db_path=str(sample_db)).predict_nationality_batch(names)
+
+    async def main():
+        async with AsyncEthniData(db_path=str(sample_db), max_workers=2) as ed:
+            return await ed.predict_many(names)
+
+    assert _run(main()) == expected
+
+
+def test_concurrent_requests_are_coalesced(sample_db):
+    ed = AsyncEthniData(db_path=str(sample_db), max_workers=4)
+    release = threading.Event()
+    calls = []
+    original = ed.predictor.predict_nationality
+
+    def slow_predict(*args, **kwargs):
+        calls.append(args)
+        release.wait(5)
+        return original(*args, **kwargs)
+
+    ed.predictor.predict_nationality = slow_predict
+
+    async def main():
+        tasks = [asyncio.ensure_future(ed.predict_nationality("Ahmet")) for _ in range(10)]
+        await asyncio.sleep(0.05)
+        release.set()
+        results = await asyncio.gather(*tasks)
+        await ed.close()
+        return results
+
+    results = _run(main())
+    assert len(calls) == 1
+    assert ed.coalesced == 9
+    assert all(r == results[0] for r in results)
+    results[0]["top_countries"].clear()
+    assert results[1]["top_countries"]  # waiters receive independent copies
+
+
+def test_injected_predictor_must_be_pooled_and_stays_open(sample_db):
+    with pytest.raises(ValueError):
+        AsyncEthniData(predictor=EthniData(db_path=str(sample_db)))
+
+    predictor = EthniData(db_path=str(sample_db), pooled=True)
+
+    async def main():
+        async with AsyncEthniData(predictor=predictor) as ed:
+            return await ed.predict_gender("Emma")
+
+    assert _run(main()) == predictor.predict_gender("Emma")
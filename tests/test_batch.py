@@ -0,0 +1,52 @@
+"""Tests for the batched prediction API."""
+
+import pytest
+
+import ethnidata.backends as backends_module
+
+
+NAMES = ["Ahmet", "Maria", "José", "Unknownx", "ahmet", "Yılmaz", "Tanaka", "Rare"]
+
+
+def test_predict_nationality_batch_matches_single(sample_ed):
+    batch = sample_ed.predict_nationality_batch(NAMES, name_type="first", top_n=3)
+    single = [sample_ed.predict_nationality(n, name_type="first", top_n=3) for n in NAMES]
+    assert batch == single
+
+
+def test_predict_nationality_batch_last_names_explain(sample_ed):
+    names = ["Yılmaz", "Tanaka", "Zhang", "Smith", "Garcia", "Missing"]
+    batch = sample_ed.predict_nationality_batch(names, name_type="last", explain=True)
+    single = [sample_ed.predict_nationality(n, name_type="last", explain=True) for n in names]
+    assert batch == single
+
+
+def test_predict_nationality_batch_preserves_order_and_duplicates(sample_ed):
+    names = ["John", "Maria", "John", "Emma"]
+    results = sample_ed.predict_nationality_batch(names)
+    assert [r["name"] for r in results] == ["john", "maria", "john", "emma"]
+    assert results[0] == results[2]
+
+
+def test_predict_nationality_batch_empty(sample_ed):
+    assert sample_ed.predict_nationality_batch([]) == []
+
+
+def test_predict_nationality_batch_accepts_generator(sample_ed):
+    results = sample_ed.predict_nationality_batch(n for n in ["Ahmet", "Maria"])
+    assert [r["country"] for r in results] == ["TUR", "ESP"]
+
+
+def test_predict_nationality_batch_chunking(sample_ed, monkeypatch):
+    monkeypatch.setattr(backends_module, "BATCH_CHUNK_SIZE", 2)
+    batch = sample_ed.predict_nationality_batch(NAMES, top_n=2)
+    single = [sample_ed.predict_nationality(n, top_n=2) for n in NAMES]
+    assert batch == single
+
+
+@pytest.mark.parametrize("explain", [False, True])
+def test_predict_full_name_batch_matches_single(sample_ed, explain):
+    pairs = [("Mehmet", "Yılmaz"), ("John", "Smith"), ("Maria", "Garcia"), ("Nobody", "Missing")]
+    batch = sample_ed.predict_full_name_batch(pairs, explain=explain)
+    single = [sample_ed.predict_full_name(f, l, explain=explain) for f, l in pairs]
+    assert batch == single
@@ -0,0 +1,85 @@
+"""Tests for the benchmark suite runner (benchmarks/bench_suite.py)"""
+
+import importlib.util
+import json
+from pathlib import Path
+
+import pytest
+
+SUITE_PATH = Path(__file__).parent.parent / "benchmarks" / "bench_suite.py"
+
+
+@pytest.fixture(scope="module")
+def suite():
+    spec = importlib.util.spec_from_file_location("bench_suite", SUITE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_fixture_db_follows_zipf(suite, tmp_path):
+    db_path = tmp_path / "bench.db"
+    vocabulary = suite.build_fixture_db(db_path, n_names=50, name_stats=True)
+
+    from ethnidata import EthniData
+    with EthniData(db_path=str(db_path)) as ed:
+        assert ed.backend == "name_stats"
+        counts = dict(ed.conn.execute(
+            "SELECT name, COUNT(*) FROM names WHERE name_type = 'first' GROUP BY name").fetchall())
+    assert len(vocabulary["first"]) == len(vocabulary["last"]) == 50
+    assert counts[vocabulary["first"][0]] == suite.MAX_ROWS
+    assert counts[vocabulary["first"][0]] > counts[vocabulary["first"][9]] > counts[vocabulary["first"][49]]
+
+
+def test_workload_is_skewed_and_deterministic(suite):
+    names = [f"name{i}" for i in range(100)]
+    queries = suite.zipf_workload(names, 2000, unknown=0.0)
+
+    assert queries == suite.zipf_workload(names, 2000, unknown=0.0)
+    assert queries.count("Name0") > queries.count("Name9") > queries.count("Name99")
+    assert all(query.lower() in names for query in queries)
+
+
+def test_percentile(suite):
+    values = list(range(1, 101))
+    assert suite.percentile(values, 50) == 50
+    assert suite.percentile(values, 99) == 99
+    assert suite.percentile([7.0], 90) == 7.0
+    assert suite.percentile([], 50) == 0.0
+
+
+def test_compare_flags_regressions_by_direction(suite):
+    baseline = {
+        "latency.x.p50_us": {"value": 100.0, "unit": "us", "better": "lower"},
+        "throughput.y": {"value": 1000.0, "unit": "names/s", "better": "higher"},
+        "rss.peak_mb": {"value": 50.0, "unit": "MB", "better": "lower"},
+    }
+    current = {
+        "latency.x.p50_us": {"value": 125.0, "unit": "us", "better": "lower"},
+        "throughput.y": {"value": 1200.0, "unit": "names/s", "better": "higher"},
+        "rss.peak_mb": {"value": 52.0, "unit": "MB", "better": "lower"},
+        "new.metric": {"value": 1.0, "unit": "s", "better": "lower"},
+    }
+
+    regressions = suite.compare(baseline, current, threshold=0.1)
+
+    assert [name for name, *_ in regressions] == ["latency.x.p50_us"]
+    assert regressions[0][3] == pytest.approx(0.25)
+    assert suite.compare(baseline, current, threshold=0.3) == []
+
+
+def test_main_writes_json_and_fails_on_regression(suite, tmp_path):
+    output = tmp_path / "run.json"
+    args = ["--names", "200", "--queries", "300", "--cold-runs", "0", "--output", str(output)]
+
+    assert suite.main(args) == 0
+    result = json.loads(output.read_text())
+    assert result["meta"]["names"] == 200
+    assert result["metrics"]["latency.predict_nationality.p50_us"]["unit"] == "us"
+    assert result["metrics"]["throughput.predict_full_name_batch"]["better"] == "higher"
+
+    # A baseline ten times faster than anything achievable
+    for metric in result["metrics"].values():
+        metric["value"] = metric["value"] * (10 if metric["better"] == "higher" else 0.1)
+    output.write_text(json.dumps(result))
+    assert suite.main(args[:-2] + ["--baseline", str(output)]) == 1
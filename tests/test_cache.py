@@ -0,0 +1,105 @@
+"""Tests for the LRU result cache."""
+
+import pytest
+
+from ethnidata import EthniData
+from ethnidata.cache import LRUCache, copy_result
+
+
+def test_lru_cache_eviction_order():
+    cache = LRUCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == (True, 1)  # "a" becomes most recent
+    cache.put("c", 3)                    # evicts "b"
+    assert cache.get("b") == (False, None)
+    info = cache.info()
+    assert (info.hits, info.misses, info.evictions, info.maxsize, info.currsize) == (1, 1, 1, 2, 2)
+
+
+def test_lru_cache_clear_resets_counters():
+    cache = LRUCache(4)
+    cache.put("a", 1)
+    cache.get("a")
+    cache.clear()
+    assert cache.info() == (0, 0, 0, 4, 0)
+
+
+def test_lru_cache_rejects_non_positive_size():
+    with pytest.raises(ValueError):
+        LRUCache(0)
+
+
+def test_copy_result_is_independent():
+    original = {"top": [{"country": "TUR"}], "name": "x"}
+    copied = copy_result(original)
+    copied["top"][0]["country"] = "AZE"
+    assert original["top"][0]["country"] == "TUR"
+
+
+def test_cache_disabled_by_default(sample_ed):
+    sample_ed.predict_nationality("Ahmet")
+    assert sample_ed.cache_info() == (0, 0, 0, 0, 0)
+
+
+def test_cached_predictions_skip_database(sample_db):
+    ed = EthniData(db_path=str(sample_db), cache_size=16)
+    first = ed.predict_nationality("Ahmet")
+    ed.conn.close()  # any further DB access would raise
+    assert ed.predict_nationality("ahmet") == first
+    assert ed.predict_nationality("AHMET") == first
+    info = ed.cache_info()
+    assert info.hits == 2 and info.misses == 1
+
+
+def test_cache_key_includes_arguments(sample_db):
+    ed = EthniData(db_path=str(sample_db), cache_size=16)
+    assert len(ed.predict_nationality("Maria", top_n=2)["top_countries"]) == 2
+    assert len(ed.predict_nationality("Maria", top_n=4)["top_countries"]) == 4
+    assert "explanation" in ed.predict_nationality("Maria", top_n=4, explain=True)
+    assert ed.cache_info().misses == 3
+
+
+def test_cache_distinguishes_diacritics_for_nationality(sample_db):
+    plain = EthniData(db_path=str(sample_db))
+    ed = EthniData(db_path=str(sample_db), cache_size=16)
+    for name in ["Yilmaz", "Yılmaz"]:
+        assert ed.predict_nationality(name, "last", explain=True) == \
+            plain.predict_nationality(name, "last", explain=True)
+
+
+def test_cache_returns_copies(sample_db):
+    ed = EthniData(db_path=str(sample_db), cache_size=16)
+    result = ed.predict_region("Maria")
+    result["distribution"].clear()
+    assert ed.predict_region("Maria")["distribution"] != {}
+
+
+def test_cache_covers_all_attribute_methods(sample_db):
+    plain = EthniData(db_path=str(sample_db))
+    ed = EthniData(db_path=str(sample_db), cache_size=64)
+    for _ in range(2):
+        assert ed.predict_gender("Emma") == plain.predict_gender("Emma")
+        assert ed.predict_region("John") == plain.predict_region("John")
+        assert ed.predict_language("John", top_n=2) == plain.predict_language("John", top_n=2)
+        assert ed.predict_religion("Ahmet") == plain.predict_religion("Ahmet")
+    assert ed.cache_info().hits == 4
+
+
+def test_cache_eviction_and_clear(sample_db):
+    ed = EthniData(db_path=str(sample_db), cache_size=2)
+    for name in ["Ahmet", "Maria", "John"]:
+        ed.predict_gender(name)
+    assert ed.cache_info().evictions == 1
+    ed.clear_cache()
+    assert ed.cache_info() == (0, 0, 0, 2, 0)
+
+
+def test_batch_uses_cache(sample_db):
+    ed = EthniData(db_path=str(sample_db), cache_size=16)
+    single = ed.predict_nationality("John")
+    batch = ed.predict_nationality_batch(["John", "Emma", "John"])
+    assert batch[0] == single == batch[2]
+    assert ed.cache_info().hits >= 1
+    ed.conn.close()
+    assert ed.predict_nationality_batch(["Emma"])[0] == batch[1]
@@ -0,0 +1,161 @@
+"""Tests for the ethnidata command line interface"""
+
+import csv
+import json
+
+import pytest
+
+from ethnidata.cli import main
+
+PEOPLE = [
+    ("Ahmet", "Yılmaz"), ("Maria", "Garcia"), ("John", "Smith"), ("Ahmet", "Yılmaz"),
+    ("", "Smith"), ("Emma", "Tanaka"), ("Nobody", "Unknown"), ("Maria", "Garcia"),
+]
+
+
+def write_csv(path):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["id", "first", "last"])
+        for i, (first, last) in enumerate(PEOPLE):
+            writer.writerow([i, first, last])
+
+
+def test_enrich_csv_full_names(sample_db, sample_ed, tmp_path):
+    source, target = tmp_path / "in.csv", tmp_path / "out.csv"
+    write_csv(source)
+
+    code = main([
+        "enrich", str(source), str(target), "--db", str(sample_db),
+        "--first-name-column", "first", "--last-name-column", "last",
+        "--chunk-size", "3", "--quiet",
+    ])
+    assert code == 0
+
+    with open(target, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert [row["id"] for row in rows] == [str(i) for i in range(len(PEOPLE))]
+    assert list(rows[0]) == ["id", "first", "last", "country", "confidence", "region",
+                             "language", "religion", "gender"]
+
+    for row, (first, last) in zip(rows, PEOPLE):
+        if not first:
+            assert row["country"] == "" and row["gender"] == ""
+            continue
+        expected = sample_ed.predict_full_name(first, last)
+        assert row["country"] == (expected["country"] or "")
+        assert float(row["confidence"]) == expected["confidence"]
+        assert row["religion"] == (sample_ed.predict_religion(first)["religion"] or "")
+        assert row["gender"] == (sample_ed.predict_gender(first)["gender"] or "")
+
+
+def test_enrich_jsonl_single_name(sample_db, sample_ed, tmp_path):
+    source, target = tmp_path / "in.jsonl", tmp_path / "out.jsonl"
+    source.write_text("".join(
+        json.dumps({"name": last}, ensure_ascii=False) + "\n" for _, last in PEOPLE
+    ), encoding="utf-8")
+
+    assert main([
+        "enrich", str(source), str(target), "--db", str(sample_db),
+        "--name-column", "name", "--name-type", "last", "--prefix", "ed_", "--quiet",
+    ]) == 0
+
+    rows = [json.loads(line) for line in target.read_text(encoding="utf-8").splitlines()]
+    assert len(rows) == len(PEOPLE)
+    for row in rows:
+        expected = sample_ed.predict_nationality(row["name"], "last")
+        assert row["ed_country"] == expected["country"]
+        assert row["ed_confidence"] == expected["confidence"]
+        assert row["ed_gender"] is None
+
+
+def test_enrich_parquet_roundtrip(sample_db, tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    source, target = tmp_path / "in.csv", tmp_path / "out.parquet"
+    write_csv(source)
+
+    assert main([
+        "enrich", str(source), str(target), "--db", str(sample_db),
+        "--first-name-column", "first", "--last-name-column", "last", "--chunk-size", "2", "--quiet",
+    ]) == 0
+    table = pq.read_table(target)
+    assert table.num_rows == len(PEOPLE)
+    assert "country" in table.column_names
+
+
+@pytest.mark.parametrize("input_name", ["in.csv", "in.parquet"])
+def test_enrich_parquet_first_chunk_unknown(sample_db, sample_ed, tmp_path, input_name):
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    people = [("Nobody", "Unknown"), ("Zzz", "Qqq"), ("Xxx", "Yyy"), ("Ahmet", "Yılmaz"), ("John", "Smith")]
+    source, target = tmp_path / input_name, tmp_path / "out.parquet"
+    if input_name.endswith(".csv"):
+        with open(source, "w", newline="", encoding="utf-8") as f:
+            csv.writer(f).writerows([("first", "last")] + people)
+    else:
+        pq.write_table(pa.table({"first": [p[0] for p in people], "last": [p[1] for p in people]}), source)
+
+    assert main([
+        "enrich", str(source), str(target), "--db", str(sample_db),
+        "--first-name-column", "first", "--last-name-column", "last", "--chunk-size", "3", "--quiet",
+    ]) == 0
+    table = pq.read_table(target)
+    assert table.schema.field("country").type == pa.string()
+    assert table.schema.field("confidence").type == pa.float64()
+    rows = table.to_pylist()
+    assert [row["country"] for row in rows[:3]] == [None, None, None]
+    assert rows[3]["country"] == sample_ed.predict_full_name("Ahmet", "Yılmaz")["country"] is not None
+
+
+def test_enrich_jsonl_to_parquet_varying_rows(sample_db, tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    source, target = tmp_path / "in.jsonl", tmp_path / "out.parquet"
+    rows = [
+        {"name": "Smith", "id": None},
+        {"name": "Yılmaz", "id": 7},
+        {"name": "Müller", "id": "x-8", "note": {"vip": True}},
+    ]
+    source.write_text("".join(json.dumps(row, ensure_ascii=False) + "\n" for row in rows), encoding="utf-8")
+
+    assert main([
+        "enrich", str(source), str(target), "--db", str(sample_db),
+        "--name-column", "name", "--name-type", "last", "--chunk-size", "1", "--quiet",
+    ]) == 0
+    written = pq.read_table(target).to_pylist()
+    assert [row["id"] for row in written] == [None, "7", "x-8"]
+    assert [row["note"] for row in written] == [None, None, '{"vip": true}']
+
+
+def test_enrich_failure_leaves_no_output(sample_db, tmp_path):
+    source, target = tmp_path / "in.jsonl", tmp_path / "out.jsonl"
+    source.write_text('{"name": "Smith"}\nnot json\n', encoding="utf-8")
+
+    assert main([
+        "enrich", str(source), str(target), "--db", str(sample_db),
+        "--name-column", "name", "--chunk-size", "1", "--quiet",
+    ]) == 1
+    assert not target.exists()
+
+
+def test_enrich_errors(sample_db, tmp_path, capsys):
+    source = tmp_path / "in.csv"
+    write_csv(source)
+    out = str(tmp_path / "out.csv")
+
+    assert main(["enrich", str(source), out, "--db", str(sample_db), "--first-name-column", "first"]) == 2
+    assert main(["enrich", str(tmp_path / "missing.csv"), out, "--db", str(sample_db),
+                 "--name-column", "first"]) == 1
+    assert main(["enrich", str(source), out, "--db", str(sample_db), "--name-column", "nope"]) == 1
+    assert "nope" in capsys.readouterr().err
+
+
+def test_enrich_with_workers(sample_db, tmp_path):
+    source = tmp_path / "in.csv"
+    write_csv(source)
+    single, multi = tmp_path / "single.csv", tmp_path / "multi.csv"
+    base = ["--db", str(sample_db), "--first-name-column", "first", "--last-name-column", "last",
+            "--chunk-size", "3", "--quiet"]
+
+    assert main(["enrich", str(source), str(single)] + base) == 0
+    assert main(["enrich", str(source), str(multi), "--workers", "2"] + base) == 0
+    assert multi.read_text(encoding="utf-8") == single.read_text(encoding="utf-8")
@@ -0,0 +1,111 @@
+"""Tests for pooled per-thread connections and the close() lifecycle."""
+
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from ethnidata import EthniData
+from ethnidata.connection import ConnectionPool, has_table, read_only_uri
+
+
+NAMES = ["Ahmet", "Maria", "John", "Emma", "Jose", "Mehmet", "Rare", "Nobody"]
+
+
+def test_read_only_uri(tmp_path):
+    db = tmp_path / "a b.db"
+    assert read_only_uri(db).endswith("a%20b.db?mode=ro")
+    assert read_only_uri(db, immutable=True).endswith("?mode=ro&immutable=1")
+
+
+def test_pool_gives_each_thread_its_own_connection(sample_db):
+    pool = ConnectionPool(sample_db, per_thread=True)
+    main_conn = pool.get()
+    assert pool.get() is main_conn
+
+    seen = []
+    thread = threading.Thread(target=lambda: seen.append(pool.get()))
+    thread.start()
+    thread.join()
+
+    assert seen[0] is not main_conn
+    assert pool.size == 2
+    pool.close()
+    with pytest.raises(sqlite3.ProgrammingError):
+        pool.get()
+
+
+def test_pooled_predictor_is_read_only(sample_db):
+    with EthniData(db_path=str(sample_db), pooled=True) as ed:
+        with pytest.raises(sqlite3.OperationalError):
+            ed.conn.execute("DELETE FROM names")
+
+
+@pytest.mark.parametrize("immutable", [False, True])
+def test_pooled_predictor_shared_across_threads(sample_db, immutable):
+    expected = [EthniData(db_path=str(sample_db)).predict_all(n) for n in NAMES]
+
+    ed = EthniData(db_path=str(sample_db), pooled=True, immutable=immutable, cache_size=32)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(ed.predict_all, NAMES * 20))
+
+    assert results == expected * 20
+    ed.close()
+
+
+def test_shared_connection_rejects_other_threads(sample_db):
+    ed = EthniData(db_path=str(sample_db))
+    errors = []
+
+    def worker():
+        try:
+            ed.predict_nationality("Ahmet")
+        except sqlite3.ProgrammingError as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+    assert errors
+
+
+def test_close_and_context_manager(sample_db):
+    with EthniData(db_path=str(sample_db)) as ed:
+        assert ed.predict_nationality("Ahmet")["country"] == "TUR"
+    with pytest.raises(sqlite3.ProgrammingError):
+        ed.predict_nationality("Ahmet")
+    ed.close()  # closing twice is harmless
+
+
+def test_pool_releases_connections_of_finished_threads(sample_db):
+    pool = ConnectionPool(sample_db, per_thread=True, max_idle=2)
+    barrier = threading.Barrier(4)
+
+    def work():
+        pool.get().execute("SELECT 1").fetchone()
+        barrier.wait()  # four connections in use at once
+
+    for _ in range(3):
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        # Finished threads gave their connections back: two kept idle, two closed
+        assert pool.size == pool.idle == 2
+
+    # A new thread reuses an idle connection instead of opening one
+    thread = threading.Thread(target=lambda: pool.get().execute("SELECT 1").fetchone())
+    thread.start()
+    thread.join()
+    assert pool.size == 2
+    pool.close()
+    assert pool.size == pool.idle == 0
+
+
+def test_has_table(sample_db):
+    conn = sqlite3.connect(str(sample_db))
+    assert has_table(conn, "names")
+    assert not has_table(conn, "name_stats")
+    conn.close()
@@ -0,0 +1,72 @@
+"""Tests for the post-ranking correction pipeline"""
+
+from ethnidata import EthniData
+from ethnidata.corrections import (
+    ChineseBoost,
+    CorrectionPipeline,
+    CountryBoost,
+    JapaneseBoost,
+    Ranking,
+    default_corrections,
+)
+
+
+def ranking(name, *codes):
+    return Ranking(name, [{'country': code, 'probability': 0.5} for code in codes], 0.5)
+
+
+def test_found_country_moves_to_top():
+    result = CorrectionPipeline().apply(ranking("tanaka", "BTN", "JPN"))
+    assert [c['country'] for c in result.top_countries] == ["JPN", "BTN"]
+    assert result.applied and result.signal == "Japanese"
+    assert result.confidence == 0.75
+
+
+def test_missing_country_inserted():
+    result = CorrectionPipeline().apply(ranking("zhang", "USA"))
+    assert result.top_countries[0]['country'] == "CHN"
+    assert result.top_countries[0]['frequency'] == 0
+    assert result.confidence == 0.70
+
+
+def test_turkish_insert_needs_chars_and_suffix():
+    # Suffix only: handled by the Turkish stage but nothing to promote
+    result = CorrectionPipeline().apply(ranking("baker", "USA"))
+    assert not result.applied
+    result = CorrectionPipeline().apply(ranking("öztürkcan", "USA"))
+    assert result.top_countries[0]['country'] == "TUR"
+    assert result.confidence == 0.65
+
+
+def test_first_matching_stage_wins():
+    # "li" is Chinese, but a Japanese stage listed first never sees it
+    pipeline = CorrectionPipeline([JapaneseBoost(), ChineseBoost()])
+    assert pipeline.apply(ranking("li", "USA")).signal == "Chinese"
+
+
+def test_unmatched_name_untouched():
+    result = CorrectionPipeline().apply(ranking("john", "USA", "GBR"))
+    assert not result.applied
+    assert [c['country'] for c in result.top_countries] == ["USA", "GBR"]
+    assert result.confidence == 0.5
+
+
+class SmithBoost(CountryBoost):
+    def __init__(self):
+        super().__init__('English', 'GBR', 'Europe', 'English')
+
+    def matches(self, name_lower):
+        return name_lower == "smith"
+
+
+def test_predictor_corrections_configurable(sample_db):
+    with EthniData(db_path=str(sample_db)) as default, \
+            EthniData(db_path=str(sample_db), corrections=[]) as disabled, \
+            EthniData(db_path=str(sample_db), corrections=default_corrections() + [SmithBoost()]) as extended:
+        assert default.predict_nationality("tanaka", "last")["country"] == "JPN"
+        assert disabled.predict_nationality("tanaka", "last")["country"] == "BTN"
+        assert not disabled.corrections
+
+        result = extended.predict_nationality("smith", "last")
+        assert result["country"] == "GBR"
+        assert result["note"] == "Morphology-based English pattern detected"
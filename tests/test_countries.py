@@ -0,0 +1,20 @@
+"""Tests for the static country-name table"""
+
+from ethnidata.countries import COUNTRY_NAMES, country_name
+
+
+def test_known_codes():
+    assert country_name("DEU") == "Germany"
+    assert country_name("JPN") == "Japan"
+    assert len(COUNTRY_NAMES) >= 249
+
+
+def test_unknown_code_returned_unchanged():
+    assert country_name("XXX") == "XXX"
+    assert country_name("") == ""
+    assert country_name(None) is None
+
+
+def test_predictions_use_table(sample_ed):
+    result = sample_ed.predict_nationality("ahmet")
+    assert result["country_name"] == COUNTRY_NAMES["TUR"]
@@ -0,0 +1,113 @@
+"""Tests for the db_metadata table read by get_stats()."""
+
+import sqlite3
+
+from ethnidata import EthniData, __version__
+from ethnidata.connection import has_table
+from ethnidata.db_metadata import (
+    DERIVED_TABLES, STATS_KEYS, build_db_metadata, has_db_metadata, invalidate_derived_tables,
+    names_checksum, read_db_metadata, scan_stats,
+)
+from ethnidata.fuzzy import build_fuzzy_index
+from ethnidata.name_stats import build_name_stats
+from ethnidata.tools.build_metadata import main as build_main
+
+
+def _build(db_path, checksum=True):
+    conn = sqlite3.connect(str(db_path))
+    metadata = build_db_metadata(conn, checksum=checksum)
+    conn.close()
+    return metadata
+
+
+def test_legacy_database_is_scanned(sample_db):
+    conn = sqlite3.connect(str(sample_db))
+    assert not has_db_metadata(conn)
+    assert read_db_metadata(conn) is None
+    expected = scan_stats(conn, STATS_KEYS)
+    conn.close()
+
+    stats = EthniData(db_path=str(sample_db)).get_stats()
+    assert stats == expected
+    assert list(stats) == list(STATS_KEYS)
+    assert stats['total_first_names'] > 0 and stats['countries'] > 0
+
+
+def test_build_stores_counts_version_and_checksum(sample_db):
+    written = _build(sample_db)
+    conn = sqlite3.connect(str(sample_db))
+    stored = read_db_metadata(conn)
+    assert stored == written
+    assert stored['total_rows'] == conn.execute("SELECT COUNT(*) FROM names").fetchone()[0]
+    assert stored['build_version'] == __version__
+    assert stored['checksum'] == f"sha256:{names_checksum(conn)}"
+    conn.close()
+
+    assert 'checksum' not in _build(sample_db, checksum=False)
+
+
+def test_get_stats_reads_metadata(sample_db):
+    before = EthniData(db_path=str(sample_db)).get_stats()
+    _build(sample_db)
+    assert EthniData(db_path=str(sample_db)).get_stats() == before
+
+    # A stored value that no longer matches the rows proves nothing was scanned
+    conn = sqlite3.connect(str(sample_db))
+    conn.execute("UPDATE db_metadata SET value = '12345' WHERE key = 'countries'")
+    conn.commit()
+    conn.close()
+    assert EthniData(db_path=str(sample_db)).get_stats()['countries'] == 12345
+
+
+def test_incomplete_metadata_falls_back_to_scan(sample_db):
+    before = EthniData(db_path=str(sample_db)).get_stats()
+    _build(sample_db)
+    conn = sqlite3.connect(str(sample_db))
+    conn.execute("DELETE FROM db_metadata WHERE key = 'languages'")
+    conn.commit()
+    conn.close()
+    assert EthniData(db_path=str(sample_db)).get_stats() == before
+
+
+def test_checksum_tracks_rows(sample_db):
+    conn = sqlite3.connect(str(sample_db))
+    first = names_checksum(conn)
+    assert names_checksum(conn) == first
+    conn.execute("UPDATE names SET region = 'Elsewhere' WHERE rowid = (SELECT MIN(rowid) FROM names)")
+    assert names_checksum(conn) != first
+    conn.close()
+
+
+def test_main_build_and_verify(sample_db, tmp_path, capsys):
+    assert build_main([str(tmp_path / "missing.db")]) == 1
+    assert build_main([str(sample_db), "--verify"]) == 1
+    assert build_main([str(sample_db)]) == 0
+    assert build_main([str(sample_db), "--verify"]) == 0
+
+    conn = sqlite3.connect(str(sample_db))
+    conn.execute("DELETE FROM names WHERE rowid = (SELECT MIN(rowid) FROM names)")
+    conn.commit()
+    conn.close()
+    capsys.readouterr()
+    assert build_main([str(sample_db), "--verify"]) == 1
+    out = capsys.readouterr().out
+    assert "total_rows" in out and "checksum" in out
+
+
+def test_invalidate_derived_tables(sample_db):
+    conn = sqlite3.connect(str(sample_db))
+    build_name_stats(conn)
+    build_fuzzy_index(conn)
+    build_db_metadata(conn)
+    assert all(has_table(conn, table) for table in DERIVED_TABLES)
+    assert EthniData(db_path=str(sample_db)).backend == "name_stats"
+
+    invalidate_derived_tables(conn)
+    assert not any(has_table(conn, table) for table in DERIVED_TABLES)
+    assert has_table(conn, "names")
+    expected = scan_stats(conn, STATS_KEYS)
+    conn.close()
+
+    ed = EthniData(db_path=str(sample_db))
+    assert ed.backend == "sqlite"
+    assert ed.get_stats() == expected
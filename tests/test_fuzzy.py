@@ -0,0 +1,142 @@
+"""Tests for the SymSpell fuzzy name index and the predictor fallback"""
+
+import sqlite3
+
+import pytest
+
+from ethnidata import EthniData
+from ethnidata.fuzzy import build_fuzzy_index, deletes, edit_distance
+from ethnidata.name_stats import build_name_stats
+from ethnidata.tools.build_fuzzy_index import main as build_main
+
+
+@pytest.fixture
+def fuzzy_db(sample_db):
+    conn = sqlite3.connect(str(sample_db))
+    build_fuzzy_index(conn)
+    conn.close()
+    return sample_db
+
+
+def reference_distance(a, b):
+    """Plain optimal string alignment distance"""
+    d = [[i + j if i * j == 0 else 0 for j in range(len(b) + 1)] for i in range(len(a) + 1)]
+    for i in range(1, len(a) + 1):
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            d[i][j] = min(d[i - 1][j] + 1, d[i][j - 1] + 1, d[i - 1][j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                d[i][j] = min(d[i][j], d[i - 2][j - 2] + 1)
+    return d[len(a)][len(b)]
+
+
+@pytest.mark.parametrize("a, b", [
+    ("mohammed", "muhammad"), ("mohamad", "muhammad"), ("ahmet", "ahmed"), ("jose", "joes"),
+    ("smith", "smyth"), ("garcia", "garcía"), ("", "abc"), ("tanaka", "tanaka"), ("ca", "abc"),
+])
+def test_edit_distance(a, b):
+    expected = reference_distance(a, b)
+    for max_distance in range(4):
+        assert edit_distance(a, b, max_distance) == min(expected, max_distance + 1)
+
+
+def test_deletes():
+    assert deletes("abc", 1) == {"abc", "bc", "ac", "ab"}
+    assert "a" in deletes("abc", 2)
+    assert deletes("abc", 0) == {"abc"}
+
+
+def test_lookup(fuzzy_db):
+    ed = EthniData(db_path=str(fuzzy_db))
+
+    assert ed.fuzzy_lookup("Ahmed") == [{'name': 'ahmet', 'distance': 1, 'frequency': 9}]
+    assert [m['name'] for m in ed.fuzzy_lookup("Smyth", "last")] == ["smith"]
+    assert ed.fuzzy_lookup("Smyth", "first") == []
+    # Equal distance: more frequent names first
+    assert ed.fuzzy_lookup("Mahmat") == [
+        {'name': 'ahmet', 'distance': 2, 'frequency': 9},
+        {'name': 'mehmet', 'distance': 2, 'frequency': 8},
+    ]
+    assert ed.fuzzy_lookup("Mahmat", max_distance=1) == []
+    with pytest.raises(ValueError):
+        ed.fuzzy_lookup("Mahmat", max_distance=3)
+
+
+def test_nationality_fallback_reports_neighbour(fuzzy_db):
+    ed = EthniData(db_path=str(fuzzy_db), fuzzy=True)
+    exact = ed.predict_nationality("Ahmet")
+
+    result = ed.predict_nationality("Ahmed", explain=True)
+
+    assert result['name'] == "ahmed"
+    assert result['fuzzy_match'] == {'name': 'ahmet', 'distance': 1, 'frequency': 9}
+    assert result['top_countries'] == exact['top_countries']
+    assert "ahmet" in result['explanation']['why'][0]
+
+    # Known and hopeless names are unaffected
+    assert 'fuzzy_match' not in ed.predict_nationality("Ahmet")
+    assert ed.predict_nationality("Xqzvw")['country'] is None
+
+
+def test_batch_matches_single(fuzzy_db):
+    ed = EthniData(db_path=str(fuzzy_db), fuzzy=True)
+    names = ["Ahmed", "Smyth", "Garsia", "Smith", "Nobody", "Ahmed"]
+
+    assert ed.predict_nationality_batch(names, "last") == [ed.predict_nationality(n, "last") for n in names]
+    assert ed.predict_full_name("Jose", "Garsia")['country'] in ("ESP", "MEX")
+
+
+def test_short_names_allow_fewer_edits(fuzzy_db):
+    ed = EthniData(db_path=str(fuzzy_db), fuzzy=True)
+
+    # "Jon" is one edit from "john", "Jhan" two: too short for a fallback
+    for name in ("Jo", "Jon", "Jhan"):
+        result = ed.predict_nationality(name)
+        assert result['country'] is None and 'fuzzy_match' not in result
+        assert ed.predict_all(name)['nationality']['country'] is None
+    assert ed.predict_nationality("Emna")['fuzzy_match']['name'] == "emma"
+    # The explicit lookup keeps the full edit distance
+    assert [m['name'] for m in ed.fuzzy_lookup("Jhan")] == ["john"]
+
+
+@pytest.mark.parametrize("backend", ["sqlite", "memory"])
+def test_predict_all_fallback(fuzzy_db, backend):
+    ed = EthniData(db_path=str(fuzzy_db), fuzzy=True, backend=backend)
+    exact = ed.predict_all("Ahmet")
+
+    result = ed.predict_all("Ahmed")
+    assert result['name'] == "ahmed"
+    assert result['nationality']['fuzzy_match'] == {'name': 'ahmet', 'distance': 1, 'frequency': 9}
+    assert result['nationality']['top_countries'] == exact['nationality']['top_countries']
+    assert result['region']['region'] == exact['region']['region']
+    assert result['gender']['gender'] == exact['gender']['gender']
+
+    names = ["Ahmed", "Smyth", "Ahmet", "Xqzvw", "Ahmed"]
+    fresh = EthniData(db_path=str(fuzzy_db), fuzzy=True, backend=backend)
+    assert fresh.predict_all_batch(names, "last") == [ed.predict_all(n, "last") for n in names]
+    assert ed.predict_all("Xqzvw")['nationality']['country'] is None
+
+
+def test_fuzzy_disabled_by_default(fuzzy_db):
+    assert 'fuzzy_match' not in EthniData(db_path=str(fuzzy_db)).predict_nationality("Ahmed")
+
+
+def test_missing_index(sample_db):
+    with pytest.raises(ValueError, match="build_fuzzy_index"):
+        EthniData(db_path=str(sample_db), fuzzy=True)
+
+
+def test_built_from_name_stats(sample_db):
+    conn = sqlite3.connect(str(sample_db))
+    build_name_stats(conn)
+    conn.close()
+
+    assert build_main([str(sample_db), "--max-distance", "1"]) == 0
+    ed = EthniData(db_path=str(sample_db), fuzzy=True)
+    assert ed.predict_nationality("Ahmed")['fuzzy_match']['name'] == "ahmet"
+    assert ed.predict_nationality("Mahmat")['country'] is None
+
+
+def test_tool_rejects_bad_options(sample_db, tmp_path):
+    assert build_main([str(tmp_path / "missing.db")]) == 1
+    assert build_main([str(sample_db), "--max-distance", "3", "--prefix-length", "3"]) == 1
@@ -0,0 +1,61 @@
+"""Import-time budget: ``import ethnidata`` must stay cheap (python -X importtime)"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).parent.parent
+
+# Cumulative microseconds of the ``ethnidata`` package itself
+IMPORT_BUDGET_US = 25000
+
+# Only loaded once something that needs them is used
+HEAVY_MODULES = {"numpy", "pandas", "asyncio", "multiprocessing", "concurrent.futures.process", "pycountry"}
+
+
+def importtime(code):
+    """{module: (self us, cumulative us)} of everything ``code`` imported"""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        check=True, capture_output=True, text=True, cwd=str(ROOT)
+    ).stderr
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        if self_us.strip().isdigit():
+            modules[name.strip()] = (int(self_us), int(cumulative_us))
+    return modules
+
+
+def test_import_ethnidata_is_lazy():
+    modules = importtime("import ethnidata")
+
+    assert [name for name in modules if name.startswith("ethnidata")] == ["ethnidata"]
+    assert not HEAVY_MODULES & set(modules)
+    assert modules["ethnidata"][1] < IMPORT_BUDGET_US
+
+
+def test_predictor_import_skips_optional_stacks(sample_db):
+    code = (
+        "from ethnidata import EthniData\n"
+        f"ed = EthniData(db_path={str(sample_db)!r})\n"
+        "ed.predict_full_name('Ahmet', 'Yilmaz')\n"
+        "ed.predict_full_name_batch([('John', 'Smith')])\n"
+    )
+    assert not HEAVY_MODULES & set(importtime(code))
+
+
+def test_lazy_attributes():
+    import ethnidata
+
+    assert set(ethnidata.__all__) <= set(dir(ethnidata))
+    for name in ethnidata.__all__:
+        assert getattr(ethnidata, name).__name__ == name
+    assert ethnidata.EthniData is __import__("ethnidata.predictor").predictor.EthniData
+
+    with pytest.raises(AttributeError, match="NoSuchThing"):
+        ethnidata.NoSuchThing
@@ -0,0 +1,102 @@
+"""Tests for predictor instrumentation"""
+
+import pytest
+
+from ethnidata import EthniData
+from ethnidata.instrumentation import Instrumentation
+
+
+@pytest.fixture
+def instrumented(sample_db):
+    instrumentation = Instrumentation()
+    with EthniData(db_path=str(sample_db), instrumentation=instrumentation, cache_size=16) as ed:
+        yield ed, instrumentation
+
+
+def test_disabled_by_default(sample_ed):
+    assert sample_ed.instrumentation is None
+    assert "predict_nationality" not in vars(sample_ed)
+
+    stats = sample_ed.stats()
+    assert stats['stages'] == {} and stats['counters'] == {}
+    assert stats['cache']['maxsize'] == 0
+
+
+def test_results_unchanged(instrumented, sample_ed):
+    ed, _ = instrumented
+    assert ed.predict_nationality("Yılmaz", "last", explain=True) == \
+        sample_ed.predict_nationality("Yılmaz", "last", explain=True)
+    assert ed.predict_full_name_batch([("Ahmet", "Smith")]) == sample_ed.predict_full_name_batch([("Ahmet", "Smith")])
+    assert ed.backend == sample_ed.backend
+
+
+def test_stages_and_counters(instrumented):
+    ed, instrumentation = instrumented
+
+    ed.predict_nationality("Yılmaz", "last", explain=True)
+    ed.predict_nationality("Nobody")
+    ed.predict_nationality("Yılmaz", "last", explain=True)   # cache hit
+    stats = ed.stats()
+
+    stages = stats['stages']
+    assert stages['predict_nationality']['count'] == 3
+    assert stages['normalize']['count'] == stages['lookup']['count'] == 2
+    # Ranking, corrections and explanations only run for known names
+    assert stages['rank']['count'] == stages['corrections']['count'] == stages['explain']['count'] == 1
+    assert stats['counters'] == {'queries': 2, 'rows': 2}
+    assert (stats['cache']['hits'], stats['cache']['misses']) == (1, 2)
+
+    histogram = stages['lookup']
+    assert histogram['buckets'][-1] == (float("inf"), 2)
+    assert histogram['total_s'] > 0 and histogram['max_us'] >= histogram['mean_us']
+
+    instrumentation.reset()
+    assert ed.stats()['stages'] == {}
+
+
+def test_nested_and_batch_calls(instrumented):
+    ed, _ = instrumented
+
+    ed.predict_full_name("Ahmet", "Yılmaz")
+    ed.predict_all_batch(["Maria", "John", "Maria"])
+    stages = ed.stats()['stages']
+
+    assert stages['predict_full_name']['count'] == 1
+    assert stages['predict_nationality']['count'] == 2
+    assert stages['predict_all_batch']['count'] == 1
+    assert ed.stats()['counters']['queries'] == 3
+
+
+def test_observers(instrumented):
+    ed, instrumentation = instrumented
+    seen = []
+    observer = lambda stage, seconds: seen.append((stage, seconds))  # noqa: E731
+
+    instrumentation.add_observer(observer)
+    ed.predict_gender("Maria")
+    instrumentation.remove_observer(observer)
+    ed.predict_gender("John")
+
+    assert [stage for stage, _ in seen] == ["normalize", "lookup", "predict_gender"]
+    assert all(seconds >= 0 for _, seconds in seen)
+
+
+def test_prometheus_text(instrumented):
+    ed, instrumentation = instrumented
+    instrumentation.observe("lookup", 0.00003)
+    instrumentation.observe("lookup", 2.0)
+
+    text = ed.metrics_text()
+
+    assert "# TYPE ethnidata_stage_seconds histogram" in text
+    assert 'ethnidata_stage_seconds_bucket{stage="lookup",le="2.5e-05"} 0' in text
+    assert 'ethnidata_stage_seconds_bucket{stage="lookup",le="5e-05"} 1' in text
+    assert 'ethnidata_stage_seconds_bucket{stage="lookup",le="+Inf"} 2' in text
+    assert 'ethnidata_stage_seconds_count{stage="lookup"} 2' in text
+    assert "ethnidata_cache_hits_total 0" in text
+    assert "ethnidata_cache_maxsize 16" in text
+
+
+def test_bucket_validation():
+    with pytest.raises(ValueError):
+        Instrumentation(buckets=[0.1, 0.01])
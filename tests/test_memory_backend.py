@@ -0,0 +1,48 @@
+"""Tests for the in-memory backend"""
+
+import pytest
+
+from ethnidata import EthniData
+from ethnidata.name_stats import build_name_stats
+from tests.conftest import SAMPLE_ROWS
+
+NAMES = sorted({row[0] for row in SAMPLE_ROWS}) + ["unknownname"]
+
+
+def test_memory_backend_selected(sample_db):
+    with EthniData(db_path=str(sample_db), backend="memory") as ed:
+        assert ed.backend == "memory"
+        assert len(ed._backend) == len({(row[0], row[1]) for row in SAMPLE_ROWS})
+
+
+def test_unknown_backend_rejected(sample_db):
+    with pytest.raises(ValueError):
+        EthniData(db_path=str(sample_db), backend="redis")
+
+
+@pytest.mark.parametrize("with_name_stats", [False, True])
+def test_memory_matches_sqlite(sample_db, with_name_stats):
+    if with_name_stats:
+        with EthniData(db_path=str(sample_db)) as ed:
+            build_name_stats(ed.conn)
+
+    with EthniData(db_path=str(sample_db)) as disk, \
+            EthniData(db_path=str(sample_db), backend="memory") as memory:
+        for name in NAMES:
+            for name_type in ("first", "last"):
+                assert memory.predict_nationality(name, name_type) == disk.predict_nationality(name, name_type)
+                assert memory.predict_region(name, name_type) == disk.predict_region(name, name_type)
+                assert memory.predict_language(name, name_type) == disk.predict_language(name, name_type)
+                assert memory.predict_religion(name, name_type) == disk.predict_religion(name, name_type)
+                assert memory.predict_all(name, name_type) == disk.predict_all(name, name_type)
+            assert memory.predict_gender(name) == disk.predict_gender(name)
+
+        assert memory.predict_nationality_batch(NAMES) == disk.predict_nationality_batch(NAMES)
+
+
+def test_memory_interns_values(sample_db):
+    with EthniData(db_path=str(sample_db), backend="memory") as ed:
+        ahmet = ed._backend.distribution("ahmet", "first")
+        mehmet = ed._backend.distribution("mehmet", "first")
+        assert ahmet.countries[0][0] is mehmet.countries[0][0]
+        assert ahmet.religions[0] == mehmet.religions[0] == ("Islam", ahmet.religions[0][1])
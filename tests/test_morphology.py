@@ -0,0 +1,63 @@
+"""Tests for the compiled morphology matcher"""
+
+import random
+
+from ethnidata.morphology import MorphologyEngine
+from ethnidata.rule_packs import AffixTrie
+
+
+def reference_affix_matches(name):
+    """The original list-walking suffix/prefix detection"""
+    normalized = MorphologyEngine.normalize_for_pattern(name)
+    detected = []
+    for pattern_type, pattern_data in MorphologyEngine.PATTERNS.items():
+        for suffix in pattern_data.get("suffixes", []):
+            if normalized.endswith(suffix.lower().replace("-", "")):
+                detected.append((pattern_type, suffix, "suffix"))
+                break
+        for prefix in pattern_data.get("prefixes", []):
+            if normalized.startswith(prefix.lower().replace("-", "").replace("'", "")):
+                detected.append((pattern_type, prefix, "prefix"))
+                break
+    return detected
+
+
+def sample_names():
+    affixes = [
+        a.replace("-", "")
+        for data in MorphologyEngine.PATTERNS.values()
+        for a in data.get("suffixes", []) + data.get("prefixes", [])
+    ]
+    stems = ["", "a", "ivan", "jo", "mar", "de", "al", "ko", "ber"]
+    names = [p + s + q for p in affixes + [""] for s in stems for q in affixes + [""]]
+    rng = random.Random(0)
+    letters = "abcdeiklmnorstuvzyçğıöşü-' "
+    names += ["".join(rng.choice(letters) for _ in range(rng.randint(1, 12))) for _ in range(2000)]
+    names += ["Petrov", "Yılmaz", "O'Connor", "McDonald", "Al-Rashid", "Van der Berg", "Gonzalez", "Tanaka"]
+    return names
+
+
+def test_trie_matches_list_walk():
+    for name in sample_names():
+        patterns = MorphologyEngine.detect_patterns(name)
+        if any(p["match_type"] in ("character_set", "common_surname") for p in patterns):
+            continue
+        assert [(p["pattern_type"], p["pattern"], p["match_type"]) for p in patterns] == \
+            reference_affix_matches(name), name
+
+
+def test_first_affix_in_list_order_wins():
+    trie = AffixTrie()
+    trie.add("ov", 0, 0, "-ov")
+    trie.add("o", 0, 1, "-o")
+    trie.add("o", 1, 0, "-o")
+    assert trie.first_matches("ovx") == {0: (0, "-ov"), 1: (0, "-o")}
+    assert trie.first_matches("x") == {}
+
+
+def test_detect_patterns_batch():
+    names = ["Petrov", "Yılmaz", "Petrov", "Smith", "McDonald"]
+    results = MorphologyEngine.detect_patterns_batch(names)
+    assert results == [MorphologyEngine.detect_patterns(n) for n in names]
+    assert results[0] is not results[2]
+    assert results[0][0] is not results[2][0]
@@ -0,0 +1,102 @@
+"""Tests for the precomputed name_stats table and backend selection."""
+
+import sqlite3
+
+from ethnidata import EthniData
+from ethnidata.distributions import aggregate_rows
+from ethnidata.name_stats import build_name_stats, has_name_stats, name_stats_is_current
+
+
+def _build(db_path):
+    conn = sqlite3.connect(str(db_path))
+    written = build_name_stats(conn)
+    conn.close()
+    return written
+
+
+def test_build_name_stats_writes_one_row_per_key(sample_db):
+    written = _build(sample_db)
+    conn = sqlite3.connect(str(sample_db))
+    distinct = conn.execute(
+        "SELECT COUNT(*) FROM (SELECT DISTINCT name, name_type FROM names)"
+    ).fetchone()[0]
+    assert has_name_stats(conn)
+    assert written == distinct
+    assert conn.execute("SELECT COUNT(*) FROM name_stats").fetchone()[0] == distinct
+    conn.close()
+
+
+def test_build_name_stats_is_repeatable(sample_db):
+    assert _build(sample_db) == _build(sample_db)
+
+
+def test_backend_detection(sample_db):
+    assert EthniData(db_path=str(sample_db)).backend == "sqlite"
+    _build(sample_db)
+    assert EthniData(db_path=str(sample_db)).backend == "name_stats"
+
+
+
+def test_stale_name_stats_fall_back_to_names(sample_db):
+    _build(sample_db)
+    conn = sqlite3.connect(str(sample_db))
+    assert name_stats_is_current(conn)
+    conn.execute(
+        "INSERT INTO names (name, name_type, country_code, region, language, religion, gender, source) "
+        "VALUES ('newcomer', 'first', 'NOR', 'Europe', 'Norwegian', NULL, 'M', 'test')"
+    )
+    conn.commit()
+    assert has_name_stats(conn) and not name_stats_is_current(conn)
+    conn.close()
+
+    for backend in ("sqlite", "memory"):
+        ed = EthniData(db_path=str(sample_db), backend=backend)
+        assert ed.backend == backend
+        assert ed.predict_nationality("Newcomer")["country"] == "NOR"
+    assert EthniData(db_path=str(sample_db)).search_prefix("newc") == [{'name': 'newcomer', 'frequency': 1}]
+
+    _build(sample_db)
+    assert EthniData(db_path=str(sample_db)).backend == "name_stats"
+
+
+def test_name_stats_without_watermark_are_trusted(sample_db):
+    _build(sample_db)
+    conn = sqlite3.connect(str(sample_db))
+    conn.execute("DROP TABLE name_stats_source")
+    conn.commit()
+    assert name_stats_is_current(conn)
+    conn.close()
+
+def test_name_stats_matches_raw_queries(sample_db):
+    raw = EthniData(db_path=str(sample_db))
+    _build(sample_db)
+    stats = EthniData(db_path=str(sample_db))
+
+    for name in ["Ahmet", "Maria", "José", "John", "Rare", "Unknownx"]:
+        assert stats.predict_nationality(name, top_n=3) == raw.predict_nationality(name, top_n=3)
+        assert stats.predict_region(name) == raw.predict_region(name)
+        assert stats.predict_language(name, top_n=2) == raw.predict_language(name, top_n=2)
+        assert stats.predict_religion(name) == raw.predict_religion(name)
+        assert stats.predict_gender(name) == raw.predict_gender(name)
+
+    for name in ["Yılmaz", "Tanaka", "Garcia", "Smith"]:
+        assert (
+            stats.predict_nationality(name, "last", explain=True)
+            == raw.predict_nationality(name, "last", explain=True)
+        )
+    pairs = [("John", "Smith"), ("Maria", "Garcia"), ("X", "Y")]
+    assert stats.predict_full_name_batch(pairs) == raw.predict_full_name_batch(pairs)
+
+
+def test_aggregate_rows_ordering():
+    dist = aggregate_rows([
+        ("ESP", "Europe", "Spanish", None, "M", 2),
+        ("MEX", "Americas", "Spanish", "Christianity", None, 2),
+        ("ARG", "Americas", None, "Christianity", "F", 1),
+    ])
+    assert [row[0] for row in dist.countries] == ["ESP", "MEX", "ARG"]
+    assert dist.regions == (("Americas", 3), ("Europe", 2))
+    assert dist.languages == (("Spanish", 4),)
+    assert dist.religions == (("Christianity", 3),)
+    assert dist.genders == ((None, 2), ("F", 1), ("M", 2))
+    assert dist.total == 5
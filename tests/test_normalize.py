@@ -0,0 +1,42 @@
+"""Tests for name normalization"""
+
+from unidecode import unidecode
+
+from ethnidata import EthniData
+from ethnidata import normalize
+from ethnidata.normalize import normalize_many, normalize_name
+
+NAMES = ["Ahmet", "  John ", "MARIA", "José", "Yılmaz", "Öztürk", "Müller", "Zhāng", "山田", "", "  ", "o'Neil-Smith"]
+
+
+def test_matches_unidecode():
+    for name in NAMES:
+        assert normalize_name(name) == unidecode(name.strip().lower())
+
+
+def test_ascii_names_skip_transliteration():
+    normalize.clear_cache()
+    normalize_name("Ahmet")
+    normalize_name("  John ")
+    assert normalize.cache_info().currsize == 0
+
+    normalize_name("Yılmaz")
+    normalize_name("YILMAZ ".replace("I", "ı"))
+    info = normalize.cache_info()
+    assert (info.misses, info.currsize) == (1, 1)
+
+
+def test_normalize_many_keeps_order():
+    names = NAMES + list(reversed(NAMES))
+    assert normalize_many(names) == [normalize_name(name) for name in names]
+    assert normalize_many([]) == []
+
+
+def test_predictor_uses_normalized_keys(sample_ed):
+    assert EthniData.normalize_name("  Öztürk") == "ozturk"
+
+    result = sample_ed.predict_full_name("  Ahmet ", "Yılmaz")
+    assert (result['first_name'], result['last_name']) == ("ahmet", "yilmaz")
+
+    batch = sample_ed.predict_full_name_batch([("  Ahmet ", "Yılmaz")] * 300)
+    assert batch[0] == result
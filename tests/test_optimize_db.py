@@ -0,0 +1,87 @@
+"""Tests for ethnidata.tools.optimize_db."""
+
+import sqlite3
+
+import pytest
+
+from ethnidata import EthniData
+from ethnidata.name_stats import build_name_stats
+from ethnidata.tools import optimize_db
+from tests.conftest import build_sample_db
+
+
+def test_check_query_plans_flags_unoptimized_db(sample_db):
+    conn = sqlite3.connect(str(sample_db))
+    problems = optimize_db.check_query_plans(conn)
+    conn.close()
+    assert "nationality" in problems
+    with pytest.raises(optimize_db.QueryPlanError):
+        conn = sqlite3.connect(str(sample_db))
+        try:
+            optimize_db.verify_query_plans(conn)
+        finally:
+            conn.close()
+
+
+def test_optimize_database(sample_db):
+    report = optimize_db.optimize_database(str(sample_db))
+    assert report["created"] is True
+    assert report["dropped"] == ["idx_name"]
+    for steps in report["plans"].values():
+        assert any(optimize_db.COVERING_INDEX in step for step in steps)
+
+    conn = sqlite3.connect(str(sample_db))
+    indexes = {row[1] for row in conn.execute("PRAGMA index_list('names')")}
+    assert optimize_db.COVERING_INDEX in indexes
+    assert "idx_name" not in indexes
+    assert "idx_name_type" in indexes  # not a prefix of the covering index
+    assert conn.execute("SELECT COUNT(*) FROM sqlite_stat1").fetchone()[0] > 0
+    assert optimize_db.check_query_plans(conn) == {}
+    conn.close()
+
+
+def test_optimize_database_is_idempotent(sample_db):
+    optimize_db.optimize_database(str(sample_db))
+    report = optimize_db.optimize_database(str(sample_db))
+    assert report["created"] is False
+    assert report["dropped"] == []
+
+
+def test_optimize_database_keep_redundant(sample_db):
+    report = optimize_db.optimize_database(str(sample_db), drop_redundant=False)
+    assert report["dropped"] == []
+
+
+def test_optimize_database_with_name_stats(sample_db):
+    conn = sqlite3.connect(str(sample_db))
+    build_name_stats(conn)
+    conn.close()
+    optimize_db.optimize_database(str(sample_db))
+
+    conn = sqlite3.connect(str(sample_db))
+    assert optimize_db.check_query_plans(conn) == {}
+    conn.close()
+
+
+def test_predictions_unchanged_after_optimize(sample_db):
+    before = EthniData(db_path=str(sample_db)).predict_all("Maria")
+    optimize_db.optimize_database(str(sample_db))
+    assert EthniData(db_path=str(sample_db)).predict_all("Maria") == before
+
+
+def test_optimize_database_missing_file(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        optimize_db.optimize_database(str(tmp_path / "missing.db"))
+
+
+def test_main_check_only(sample_db, capsys):
+    assert optimize_db.main([str(sample_db), "--check-only"]) == 1
+    assert optimize_db.main([str(sample_db)]) == 0
+    assert optimize_db.main([str(sample_db), "--check-only"]) == 0
+    assert "covering indexes" in capsys.readouterr().out
+
+
+def test_check_only_path_with_uri_characters(tmp_path):
+    db = build_sample_db(tmp_path / "odd #1 100%?.db")
+    assert optimize_db.main([str(db)]) == 0
+    assert optimize_db.main([str(db), "--check-only"]) == 0
@@ -0,0 +1,112 @@
+"""Tests for the vectorized pandas / Arrow accessor"""
+
+import sqlite3
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+from ethnidata import EthniData  # noqa: E402
+from ethnidata.pandas import RESULT_COLUMNS, predict_frame, predict_table  # noqa: E402
+
+FIRST = ["Ahmet", "Maria", "John", "Emma", "Nobody", "Ahmet", "Mehmet", "Jose", "rare", "Maria"]
+LAST = ["Yılmaz", "Garcia", "Smith", "Tanaka", "Unknown", "Yılmaz", "Petrov", "Zhang", "Smith", "Öztürk"]
+
+
+def expected_row(result):
+    return tuple(result[column] for column in RESULT_COLUMNS)
+
+
+def frame_rows(frame):
+    return [
+        tuple(None if pd.isna(value) else value for value in row)
+        for row in frame[list(RESULT_COLUMNS)].itertuples(index=False)
+    ]
+
+
+def test_full_names_match_predict_full_name(sample_ed):
+    # Every first/last combination, including ties and morphology boosts
+    first = [f for f in FIRST for _ in LAST]
+    last = [l for _ in FIRST for l in LAST]
+    df = pd.DataFrame({"first": first, "last": last}, index=range(100, 100 + len(first)))
+
+    result = df.ethnidata.predict(first="first", last="last", predictor=sample_ed)
+
+    assert list(result.index) == list(df.index)
+    assert str(result["confidence"].dtype) == "float64"
+    assert str(result["country"].dtype) == "string"
+    assert frame_rows(result) == [expected_row(sample_ed.predict_full_name(f, l)) for f, l in zip(first, last)]
+
+
+def test_duplicate_countries_fold_like_predict_full_name(sample_db):
+    # Same country under several regions, on both sides
+    conn = sqlite3.connect(str(sample_db))
+    conn.executemany("""
+        INSERT INTO names (name, name_type, country_code, region, language, religion, gender, source)
+        VALUES (?, ?, ?, ?, ?, NULL, NULL, ?)
+    """, [
+        ("john", "first", "USA", "Europe", "Spanish", "extra1"),
+        ("john", "first", "USA", "Europe", "Spanish", "extra2"),
+        ("smith", "last", "USA", "Oceania", "English", "extra1"),
+        ("smith", "last", "GBR", "Americas", "English", "extra1"),
+        ("smith", "last", "GBR", "Americas", "English", "extra2"),
+    ])
+    conn.commit()
+    conn.close()
+
+    ed = EthniData(db_path=str(sample_db))
+    pairs = [("John", "Smith"), ("Emma", "Smith"), ("John", "Garcia"), ("Nobody", "Smith")]
+    df = pd.DataFrame(pairs, columns=["first", "last"])
+
+    result = predict_frame(df, first="first", last="last", predictor=ed, top_n=10)
+
+    assert frame_rows(result) == [expected_row(ed.predict_full_name(f, l, top_n=10)) for f, l in pairs]
+
+
+def test_single_name_column(sample_ed):
+    df = pd.DataFrame({"surname": LAST})
+
+    result = df.ethnidata.predict(name="surname", name_type="last", predictor=sample_ed, prefix="eth_")
+
+    assert list(result.columns) == [f"eth_{column}" for column in RESULT_COLUMNS]
+    result.columns = list(RESULT_COLUMNS)
+    assert frame_rows(result) == [expected_row(sample_ed.predict_nationality(n, "last")) for n in LAST]
+
+
+def test_missing_names(sample_ed):
+    df = pd.DataFrame({"first": ["Ahmet", None, "John"], "last": ["Yılmaz", "Smith", float("nan")]})
+
+    result = df.ethnidata.predict(first="first", last="last", predictor=sample_ed)
+
+    assert result["country"].tolist()[0] == sample_ed.predict_full_name("Ahmet", "Yılmaz")["country"]
+    assert result["country"].isna().tolist() == [False, True, True]
+    assert result["confidence"].tolist()[1:] == [0.0, 0.0]
+
+
+def test_empty_frame(sample_ed):
+    df = pd.DataFrame({"first": pd.Series([], dtype=object), "last": pd.Series([], dtype=object)})
+
+    result = df.ethnidata.predict(first="first", last="last", predictor=sample_ed)
+
+    assert list(result.columns) == list(RESULT_COLUMNS)
+    assert len(result) == 0
+
+
+def test_column_arguments(sample_ed):
+    df = pd.DataFrame({"first": ["Ahmet"], "last": ["Yılmaz"]})
+
+    with pytest.raises(ValueError):
+        df.ethnidata.predict(first="first", predictor=sample_ed)
+    with pytest.raises(ValueError):
+        df.ethnidata.predict(first="first", last="last", name="first", predictor=sample_ed)
+
+
+def test_arrow_table(sample_ed):
+    pa = pytest.importorskip("pyarrow")
+    table = pa.table({"first": FIRST, "last": LAST, "id": list(range(len(FIRST)))})
+
+    result = predict_table(table, first="first", last="last", predictor=sample_ed)
+
+    assert result.column_names == ["first", "last", "id"] + list(RESULT_COLUMNS)
+    assert result.column("country").to_pylist() == \
+        [sample_ed.predict_full_name(f, l)["country"] for f, l in zip(FIRST, LAST)]
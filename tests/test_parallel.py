@@ -0,0 +1,47 @@
+"""Tests for the multi-process ParallelPredictor"""
+
+import multiprocessing
+
+import pytest
+
+from ethnidata.parallel import ParallelPredictor
+
+FIRST = ["Ahmet", "Maria", "John", "Emma", "Nobody", "Ahmet", "Mehmet", "Jose", "Maria"]
+LAST = ["Yılmaz", "Garcia", "Smith", "Tanaka", "Unknown", "Yılmaz", "Petrov", "Zhang", "Garcia"]
+
+
+@pytest.fixture
+def parallel(sample_db):
+    with ParallelPredictor(db_path=str(sample_db), n_workers=2, chunk_size=2) as pp:
+        yield pp
+
+
+def test_results_in_input_order(parallel, sample_ed):
+    assert parallel.predict_nationality_batch(LAST, "last") == \
+        [sample_ed.predict_nationality(n, "last") for n in LAST]
+    assert parallel.predict_all_batch(FIRST) == [sample_ed.predict_all(n) for n in FIRST]
+
+    pairs = list(zip(FIRST, LAST))
+    assert parallel.predict_full_name_batch(pairs, explain=True) == \
+        [sample_ed.predict_full_name(f, l, explain=True) for f, l in pairs]
+
+
+def test_repeated_names_get_copies(parallel):
+    results = parallel.predict_nationality_batch(["Ahmet", "Ahmet"])
+    assert results[0] == results[1]
+    assert results[0] is not results[1]
+
+
+def test_empty_input(parallel):
+    assert parallel.predict_all_batch([]) == []
+
+
+def test_spawn_context(sample_db, sample_ed):
+    ctx = multiprocessing.get_context("spawn")
+    with ParallelPredictor(db_path=str(sample_db), n_workers=1, mp_context=ctx) as pp:
+        assert pp.predict_nationality_batch(["Ahmet"]) == [sample_ed.predict_nationality("Ahmet")]
+
+
+def test_invalid_chunk_size(sample_db):
+    with pytest.raises(ValueError):
+        ParallelPredictor(db_path=str(sample_db), chunk_size=0)
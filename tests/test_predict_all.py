@@ -0,0 +1,58 @@
+"""Tests for the single-aggregation predict_all()."""
+
+import pytest
+
+
+def _composed(ed, name, name_type):
+    """predict_all() as it used to be assembled from the individual methods"""
+    result = {
+        'name': ed.normalize_name(name),
+        'nationality': ed.predict_nationality(name, name_type),
+        'region': ed.predict_region(name, name_type),
+        'language': ed.predict_language(name, name_type),
+        'religion': ed.predict_religion(name, name_type),
+        'ethnicity': ed.predict_ethnicity(name, name_type),
+    }
+    if name_type == "first":
+        result['gender'] = ed.predict_gender(name)
+    return result
+
+
+@pytest.mark.parametrize("name,name_type", [
+    ("Ahmet", "first"), ("Maria", "first"), ("John", "first"), ("Rare", "first"),
+    ("Yılmaz", "last"), ("Tanaka", "last"), ("Garcia", "last"), ("Nobody", "first"),
+])
+def test_predict_all_matches_individual_methods(sample_ed, name, name_type):
+    assert sample_ed.predict_all(name, name_type) == _composed(sample_ed, name, name_type)
+
+
+def test_predict_all_issues_one_query(sample_ed):
+    statements = []
+    sample_ed.conn.set_trace_callback(statements.append)
+    sample_ed.predict_all("Maria", "first")
+    sample_ed.conn.set_trace_callback(None)
+    assert len([s for s in statements if s.lstrip().upper().startswith("SELECT")]) == 1
+
+
+def test_predict_all_last_name_has_no_gender(sample_ed):
+    assert 'gender' not in sample_ed.predict_all("Smith", "last")
+
+
+@pytest.mark.parametrize("with_name_stats", [False, True])
+def test_predict_all_batch(sample_db, with_name_stats):
+    from ethnidata import EthniData
+    from ethnidata.name_stats import build_name_stats
+
+    names = ["Ahmet", "maria", "Ahmet", "Nobody", "Tanaka", "Yılmaz"]
+    if with_name_stats:
+        with EthniData(db_path=str(sample_db)) as ed:
+            build_name_stats(ed.conn)
+
+    with EthniData(db_path=str(sample_db), cache_size=16) as ed:
+        for name_type in ("first", "last"):
+            expected = [ed.predict_all(name, name_type) for name in names]
+            ed.clear_cache()
+            assert ed.predict_all_batch(names, name_type) == expected
+            # Second call is answered from the cache
+            assert ed.predict_all_batch(names, name_type) == expected
+        assert ed.cache_info().hits >= len(set(names))
@@ -0,0 +1,60 @@
+"""Tests for frequency-ranked prefix search"""
+
+import random
+import sqlite3
+
+import pytest
+
+from ethnidata import prefix_search
+from ethnidata.name_stats import build_name_stats
+from ethnidata.prefix_search import PrefixIndex, load_vocabulary
+
+
+def brute_force(vocabulary, prefix, limit):
+    matches = [(name, frequency) for name, frequency in vocabulary if name.startswith(prefix)]
+    matches.sort(key=lambda item: (-item[1], item[0]))
+    return [{'name': name, 'frequency': frequency} for name, frequency in matches[:limit]]
+
+
+def test_search(sample_ed):
+    assert sample_ed.search_prefix("m") == [
+        {'name': 'maria', 'frequency': 13},
+        {'name': 'mehmet', 'frequency': 8},
+    ]
+    assert sample_ed.search_prefix("Jo", limit=1) == [{'name': 'john', 'frequency': 16}]
+    assert [m['name'] for m in sample_ed.search_prefix("", "last", limit=3)] == ["smith", "yilmaz", "garcia"]
+    assert sample_ed.search_prefix("Yıl", "last") == [{'name': 'yilmaz', 'frequency': 10}]
+    assert sample_ed.search_prefix("x") == []
+    assert sample_ed.search_prefix("m", limit=0) == []
+
+
+def test_name_stats_vocabulary(sample_db, sample_ed):
+    before = {t: load_vocabulary(sample_ed.conn, t) for t in ("first", "last")}
+    conn = sqlite3.connect(str(sample_db))
+    build_name_stats(conn)
+    conn.close()
+
+    assert {t: load_vocabulary(sample_ed.conn, t) for t in ("first", "last")} == before
+
+
+@pytest.fixture
+def small_limits(monkeypatch):
+    # Exercise the precomputed and memoized paths on a small vocabulary
+    monkeypatch.setattr(prefix_search, "SCAN_LIMIT", 5)
+    monkeypatch.setattr(prefix_search, "PRECOMPUTED_DEPTH", 2)
+    monkeypatch.setattr(prefix_search, "TOP_K", 8)
+
+
+def test_matches_brute_force(small_limits):
+    rng = random.Random(0)
+    vocabulary = sorted({
+        "".join(rng.choice("abc") for _ in range(rng.randint(1, 6))): rng.randint(1, 5)
+        for _ in range(500)
+    }.items())
+    index = PrefixIndex(vocabulary)
+    assert index._top
+
+    prefixes = ["", "a", "b", "ab", "abc", "abca", "cc", "ccc", "bbbb", "d"]
+    for prefix in prefixes * 2:
+        for limit in (1, 3, 8, 20):
+            assert index.search(prefix, limit) == brute_force(vocabulary, prefix, limit)
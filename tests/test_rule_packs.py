@@ -0,0 +1,157 @@
+"""Tests for morphology rule packs and their compiled cache"""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from ethnidata import EthniData
+from ethnidata.morphology import MorphologyEngine
+from ethnidata.rule_packs import DEFAULT_RULE_PACK, RulePackError, load_rule_pack
+
+
+@pytest.fixture
+def pack_file(tmp_path):
+    pack = json.loads(DEFAULT_RULE_PACK.read_text(encoding="utf-8"))
+    path = tmp_path / "custom.json"
+    path.write_text(json.dumps(pack, ensure_ascii=False), encoding="utf-8")
+    return path
+
+
+def write_pack(path, pack):
+    path.write_text(json.dumps(pack, ensure_ascii=False), encoding="utf-8")
+    # Make sure the in-process memo sees a new mtime even on coarse clocks
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def restore_default_pack():
+    yield
+    MorphologyEngine.use_rule_pack()
+
+
+def test_cached_pack_matches_fresh_compile(pack_file, tmp_path):
+    cache_dir = tmp_path / "cache"
+    fresh = load_rule_pack(pack_file, cache_dir=cache_dir)
+    assert len(list((cache_dir / "rules").glob("custom-*.marshal"))) == 1
+
+    # Drop the in-process memo so the second load reads the marshal file
+    write_pack(pack_file, json.loads(pack_file.read_text(encoding="utf-8")))
+    cached = load_rule_pack(pack_file, cache_dir=cache_dir)
+
+    assert cached is not fresh
+    assert cached.patterns == fresh.patterns == MorphologyEngine.PATTERNS
+    assert cached.compiled.suffixes.root == fresh.compiled.suffixes.root
+    assert cached.compiled.prefixes.root == fresh.compiled.prefixes.root
+
+
+def test_editing_pack_invalidates_cache(pack_file, tmp_path):
+    cache_dir = tmp_path / "cache"
+    load_rule_pack(pack_file, cache_dir=cache_dir)
+    old_cache = list((cache_dir / "rules").glob("custom-*.marshal"))
+
+    pack = json.loads(pack_file.read_text(encoding="utf-8"))
+    pack["groups"]["slavic"]["suffixes"].append("-enko")
+    write_pack(pack_file, pack)
+    reloaded = load_rule_pack(pack_file, cache_dir=cache_dir)
+
+    new_cache = list((cache_dir / "rules").glob("custom-*.marshal"))
+    assert len(new_cache) == 1 and new_cache != old_cache
+    assert "-enko" in reloaded.patterns["slavic"]["suffixes"]
+
+
+def test_corrupt_cache_is_rebuilt(pack_file, tmp_path):
+    cache_dir = tmp_path / "cache"
+    load_rule_pack(pack_file, cache_dir=cache_dir)
+    cached = next((cache_dir / "rules").glob("custom-*.marshal"))
+    cached.write_bytes(b"not marshal")
+
+    write_pack(pack_file, json.loads(pack_file.read_text(encoding="utf-8")))
+    pack = load_rule_pack(pack_file, cache_dir=cache_dir)
+    assert pack.patterns == MorphologyEngine.PATTERNS
+
+
+def test_invalid_pack(tmp_path):
+    path = tmp_path / "broken.json"
+    path.write_text("{not json", encoding="utf-8")
+    with pytest.raises(RulePackError):
+        load_rule_pack(path, cache_dir=tmp_path)
+
+    path.write_text("[]", encoding="utf-8")
+    with pytest.raises(RulePackError):
+        load_rule_pack(path, cache_dir=tmp_path)
+
+
+def test_use_rule_pack_with_many_affixes(pack_file, restore_default_pack):
+    pack = json.loads(pack_file.read_text(encoding="utf-8"))
+    extra = [f"-zq{i:03d}" for i in range(500)]
+    pack["groups"]["nordic"]["suffixes"] += extra
+    write_pack(pack_file, pack)
+
+    MorphologyEngine.use_rule_pack(pack_file)
+    patterns = MorphologyEngine.detect_patterns("Hansenzq250")
+    assert [(p["pattern_type"], p["pattern"]) for p in patterns] == [("nordic", "-zq250")]
+
+    MorphologyEngine.use_rule_pack()
+    assert MorphologyEngine.detect_patterns("Hansenzq250") == []
+
+
+def test_predictor_boosts_follow_rule_pack(sample_db, pack_file, restore_default_pack):
+    pack = json.loads(pack_file.read_text(encoding="utf-8"))
+    pack["boosts"]["japanese_common"].append("smith")
+    write_pack(pack_file, pack)
+
+    with EthniData(db_path=str(sample_db)) as ed:
+        assert ed.predict_nationality("smith", "last")["country"] != "JPN"
+        MorphologyEngine.use_rule_pack(pack_file)
+        assert ed.predict_nationality("smith", "last")["country"] == "JPN"
+
+
+def test_import_does_not_touch_cache(tmp_path):
+    cache_dir = tmp_path / "cache"
+    env = dict(os.environ, ETHNIDATA_CACHE_DIR=str(cache_dir))
+    subprocess.run(
+        [sys.executable, "-c", "import ethnidata.predictor, ethnidata.morphology"],
+        check=True, env=env
+    )
+    assert not cache_dir.exists()
+
+
+def test_same_stem_packs_keep_their_caches(pack_file, tmp_path):
+    cache_dir = tmp_path / "cache"
+    other_dir = tmp_path / "other"
+    other_dir.mkdir()
+    other = other_dir / pack_file.name
+    pack = json.loads(pack_file.read_text(encoding="utf-8"))
+    pack["groups"]["slavic"]["suffixes"].append("-enko")
+    write_pack(other, pack)
+
+    load_rule_pack(pack_file, cache_dir=cache_dir)
+    load_rule_pack(other, cache_dir=cache_dir)
+    assert len(list((cache_dir / "rules").glob("custom-*.marshal"))) == 2
+
+
+def test_caches_of_removed_packs_are_pruned(pack_file, tmp_path):
+    cache_dir = tmp_path / "cache"
+    gone = tmp_path / "gone.json"
+    gone.write_bytes(pack_file.read_bytes())
+    load_rule_pack(gone, cache_dir=cache_dir)
+    (cache_dir / "rules" / "legacy-v1-0123456789abcdef.marshal").write_bytes(b"old format")
+    gone.unlink()
+
+    load_rule_pack(pack_file, cache_dir=cache_dir)
+    assert [p.name.split("-")[0] for p in (cache_dir / "rules").glob("*.marshal")] == ["custom"]
+
+
+def test_unwritable_cache_is_skipped(pack_file, tmp_path, monkeypatch):
+    blocker = tmp_path / "file"
+    blocker.write_text("not a directory", encoding="utf-8")
+    pack = load_rule_pack(pack_file, cache_dir=blocker)
+    assert pack.patterns == MorphologyEngine.PATTERNS
+
+    monkeypatch.setenv("ETHNIDATA_CACHE_DIR", "")
+    write_pack(pack_file, json.loads(pack_file.read_text(encoding="utf-8")))
+    assert load_rule_pack(pack_file).patterns == MorphologyEngine.PATTERNS
@@ -0,0 +1,142 @@
+"""Tests for service mode (warm-up, HTTP endpoints, liveness probe)"""
+
+import json
+import os
+import sqlite3
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+import pytest
+
+from ethnidata import EthniData, Instrumentation
+from ethnidata import service
+from ethnidata.name_stats import build_name_stats
+from ethnidata.service import COMMON_NAMES, hot_names, make_server, probe, warm_up, write_heartbeat
+from ethnidata.tools import export_snapshot
+
+
+@pytest.fixture
+def server(sample_db, tmp_path):
+    ed = EthniData(db_path=str(sample_db), pooled=True, cache_size=64, instrumentation=Instrumentation())
+    heartbeat = tmp_path / "heartbeat"
+    server = make_server(ed, port=0, heartbeat_path=str(heartbeat))
+    thread = threading.Thread(target=server.serve_forever, kwargs={'poll_interval': 0.05}, daemon=True)
+    thread.start()
+    yield server, heartbeat, ed
+    server.shutdown()
+    server.server_close()
+    ed.close()
+
+
+def get(server, path):
+    url = f"http://127.0.0.1:{server.server_address[1]}{path}"
+    try:
+        with urllib.request.urlopen(url) as response:
+            return response.status, response.read().decode("utf-8")
+    except urllib.error.HTTPError as error:
+        return error.code, error.read().decode("utf-8")
+
+
+def test_hot_names_prefer_name_stats(sample_db):
+    with EthniData(db_path=str(sample_db)) as ed:
+        assert hot_names(ed, "last", 3) == COMMON_NAMES["last"][:3]
+
+    conn = sqlite3.connect(str(sample_db))
+    build_name_stats(conn)
+    conn.close()
+
+    with EthniData(db_path=str(sample_db), cache_size=16) as ed:
+        assert hot_names(ed, "last", 3) == ["smith", "yilmaz", "garcia"]
+        report = warm_up(ed, count=3)
+        assert report['names'] == 6
+        assert ed.cache_info().currsize == 6
+
+
+
+def test_warm_up_prefetches_backend_file(sample_db, monkeypatch):
+    assert export_snapshot.main([str(sample_db)]) == 0
+    prefetched = []
+    monkeypatch.setattr(service, "prefetch", lambda path: prefetched.append(Path(path)) or True)
+
+    with EthniData(db_path=str(sample_db)) as ed:
+        warm_up(ed, count=1)
+    with EthniData(db_path=str(sample_db), backend="snapshot") as ed:
+        warm_up(ed, count=1)
+    assert prefetched == [Path(sample_db), Path(sample_db).with_suffix(".snap")]
+
+def test_endpoints(server, sample_ed):
+    server, _, _ = server
+
+    assert get(server, "/healthz") == (200, '{"status": "ok"}')
+    assert get(server, "/readyz")[0] == 503
+    server.ready = True
+    assert get(server, "/readyz")[0] == 200
+
+    status, body = get(server, "/predict?name=Y%C4%B1lmaz&name_type=last")
+    assert status == 200
+    assert json.loads(body) == sample_ed.predict_nationality("Yılmaz", "last")
+
+    status, body = get(server, "/predict?first=Ahmet&last=Smith")
+    assert json.loads(body) == sample_ed.predict_full_name("Ahmet", "Smith")
+
+    assert json.loads(get(server, "/stats")[1]) == sample_ed.get_stats()
+    assert "ethnidata_stage_seconds_count" in get(server, "/metrics")[1]
+
+    assert get(server, "/predict")[0] == 400
+    assert get(server, "/predict?name=x&name_type=middle")[0] == 400
+    assert get(server, "/nope")[0] == 404
+
+
+def test_heartbeat_only_while_ready(server):
+    server, heartbeat, _ = server
+
+    time.sleep(0.2)
+    assert not heartbeat.exists()
+    assert not probe(str(heartbeat))
+
+    server.ready = True
+    deadline = time.time() + 5
+    while not heartbeat.exists() and time.time() < deadline:
+        time.sleep(0.02)
+    assert probe(str(heartbeat)) == "ready"
+
+    old = time.time() - 60
+    os.utime(heartbeat, (old, old))
+    assert not probe(str(heartbeat))
+
+
+def test_probe_reports_starting(tmp_path):
+    heartbeat = str(tmp_path / "heartbeat")
+
+    # A slow start-up passes without any ready beat, but only for max_start seconds
+    write_heartbeat(heartbeat, f"starting {time.time() - 120}")
+    old = time.time() - 120
+    os.utime(heartbeat, (old, old))
+    assert probe(heartbeat) == "starting"
+    assert probe(heartbeat, max_start=60) is None
+
+    write_heartbeat(heartbeat, "ready")
+    assert probe(heartbeat, max_start=60) == "ready"
+
+
+def test_probe_command_skips_predictor(tmp_path):
+    heartbeat = tmp_path / "heartbeat"
+    heartbeat.touch()
+    code = (
+        "import sys\n"
+        "from ethnidata.service import main\n"
+        f"status = main(['probe', '--heartbeat', {str(heartbeat)!r}])\n"
+        "assert 'ethnidata.predictor' not in sys.modules and 'sqlite3' not in sys.modules\n"
+        "sys.exit(status)\n"
+    )
+    root = Path(__file__).parent.parent
+    assert subprocess.run([sys.executable, "-c", code], cwd=str(root)).returncode == 0
+
+    heartbeat.unlink()
+    assert subprocess.run([sys.executable, "-m", "ethnidata.service", "probe", "--heartbeat", str(heartbeat)],
+                          cwd=str(root)).returncode == 1
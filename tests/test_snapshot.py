@@ -0,0 +1,70 @@
+"""Tests for the binary snapshot format and backend"""
+
+import pytest
+
+from ethnidata import EthniData
+from ethnidata.name_stats import iter_distributions
+from ethnidata.snapshot import SnapshotError, SnapshotReader, write_snapshot
+from ethnidata.tools import export_snapshot
+from tests.conftest import SAMPLE_ROWS, build_sample_db
+
+NAMES = sorted({row[0] for row in SAMPLE_ROWS}) + ["unknownname", "zzz", ""]
+
+
+@pytest.fixture
+def snapshot(sample_db):
+    assert export_snapshot.main([str(sample_db)]) == 0
+    return sample_db.with_suffix(".snap")
+
+
+def test_reader_roundtrip(sample_db, snapshot):
+    with EthniData(db_path=str(sample_db)) as ed:
+        expected = list(iter_distributions(ed.conn))
+
+    reader = SnapshotReader(snapshot)
+    try:
+        assert len(reader) == len(expected)
+        assert sorted(reader, key=lambda t: (t[1], t[0])) == sorted(expected, key=lambda t: (t[1], t[0]))
+        for name, name_type, dist in expected:
+            assert reader.get(name, name_type) == dist
+        assert reader.get("unknownname", "first").total == 0
+    finally:
+        reader.close()
+
+
+def test_snapshot_matches_sqlite(sample_db, snapshot):
+    with EthniData(db_path=str(sample_db)) as disk, \
+            EthniData(db_path=str(sample_db), backend="snapshot") as snap:
+        assert snap.backend == "snapshot"
+        for name in NAMES:
+            for name_type in ("first", "last"):
+                assert snap.predict_nationality(name, name_type) == disk.predict_nationality(name, name_type)
+                assert snap.predict_all(name, name_type) == disk.predict_all(name, name_type)
+            assert snap.predict_gender(name) == disk.predict_gender(name)
+        assert snap.predict_nationality_batch(NAMES) == disk.predict_nationality_batch(NAMES)
+
+
+def test_empty_snapshot(tmp_path):
+    path = tmp_path / "empty.snap"
+    assert write_snapshot([], path) == 0
+    reader = SnapshotReader(path)
+    assert len(reader) == 0
+    assert reader.get("ahmet", "first").total == 0
+    reader.close()
+
+
+def test_rejects_other_files(sample_db):
+    with pytest.raises(SnapshotError):
+        SnapshotReader(sample_db)
+
+
+def test_missing_database(tmp_path, capsys):
+    assert export_snapshot.main([str(tmp_path / "missing.db")]) == 1
+
+
+def test_export_path_with_uri_characters(tmp_path):
+    db = build_sample_db(tmp_path / "odd #1 100%?.db")
+    assert export_snapshot.main([str(db)]) == 0
+    reader = SnapshotReader(db.with_suffix(".snap"))
+    assert len(reader) > 0
+    reader.close()
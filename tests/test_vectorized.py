@@ -0,0 +1,63 @@
+"""Tests for the NumPy full-name score combination"""
+
+import random
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from ethnidata import EthniData, predictor  # noqa: E402
+from ethnidata.vectorized import combine_top_countries  # noqa: E402
+
+FIRST = ["Ahmet", "Maria", "John", "Emma", "Nobody", "Mehmet", "Jose", "rare"]
+LAST = ["Yılmaz", "Garcia", "Smith", "Tanaka", "Unknown", "Petrov", "Zhang", "Öztürk"]
+
+
+def random_tops(rng):
+    # Few codes and coarse probabilities: plenty of ties and repeated countries
+    return [
+        {
+            'country': rng.choice(["USA", "GBR", "TUR", "JPN", "XKX", "ZZZ"]),
+            'region': rng.choice(["Asia", "Europe", None]),
+            'language': rng.choice(["English", "Turkish"]),
+            'probability': rng.choice([0.0, 0.1, 0.2, 0.25, 0.3333, 0.5, 1.0]),
+        }
+        for _ in range(rng.randint(0, 6))
+    ]
+
+
+@pytest.mark.parametrize("top_n", [1, 2, 3, 5, 20])
+def test_matches_scalar_combination(top_n):
+    rng = random.Random(top_n)
+    firsts = [random_tops(rng) for _ in range(300)]
+    lasts = [random_tops(rng) for _ in range(300)]
+    first_ids = [rng.randrange(len(firsts)) for _ in range(2000)]
+    last_ids = [rng.randrange(len(lasts)) for _ in range(2000)]
+
+    combined = combine_top_countries(firsts, lasts, top_n, first_ids, last_ids, block_size=128)
+
+    assert combined == [
+        EthniData._combine_top_countries({'top_countries': firsts[f]}, {'top_countries': lasts[l]}, top_n)
+        for f, l in zip(first_ids, last_ids)
+    ]
+
+
+def test_aligned_and_empty():
+    tops = [[{'country': 'TUR', 'region': 'Asia', 'language': 'Turkish', 'probability': 1.0}], []]
+
+    assert combine_top_countries(tops, tops, 5)[1] == []
+    assert combine_top_countries(tops, tops, 5)[0][0]['probability'] == 1.0
+    assert combine_top_countries([], [], 5) == []
+    with pytest.raises(ValueError):
+        combine_top_countries(tops, tops, 5, first_ids=[0], last_ids=[0, 1])
+
+
+def test_batch_uses_vectorized_path(sample_ed, monkeypatch):
+    monkeypatch.setattr(predictor, "VECTORIZE_MIN_PAIRS", 1)
+    pairs = [(f, l) for f in FIRST for l in LAST]
+
+    for top_n in (1, 3, 5):
+        assert sample_ed.predict_full_name_batch(pairs, top_n=top_n) == \
+            [sample_ed.predict_full_name(f, l, top_n=top_n) for f, l in pairs]
+    assert sample_ed.predict_full_name_batch(pairs[:4], explain=True) == \
+        [sample_ed.predict_full_name(f, l, explain=True) for f, l in pairs[:4]]